@@ -0,0 +1,61 @@
+"""Tests for core.parse_cache round-trips and invalidation."""
+import pytest
+
+from core import parse_cache
+from core.nlp_processor import ScriptParse, parse_script_text
+from core.parse_cache import file_sha1, load_parse_cache, save_parse_cache
+
+TEXT = "HAMLET\nTo be, or not to be.\n\nOPHELIA\nGood my lord.\n"
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / parse_cache.PARSE_CACHE_FILENAME
+
+
+@pytest.fixture
+def parse():
+    return parse_script_text(TEXT)
+
+
+def test_round_trip(cache_path, parse):
+    save_parse_cache(cache_path, "abc", parse, TEXT, extract_key="pymupdf/text")
+    loaded = load_parse_cache(cache_path, "abc", "pymupdf/text")
+    assert loaded is not None
+    cached_parse, full_text = loaded
+    assert isinstance(cached_parse, ScriptParse)
+    assert full_text == TEXT
+    assert [b.speaker for b in cached_parse.blocks] == [b.speaker for b in parse.blocks]
+    assert [b.text for b in cached_parse.blocks] == [b.text for b in parse.blocks]
+    assert not list(cache_path.parent.glob("*.tmp"))
+
+
+def test_other_sha1_misses(cache_path, parse):
+    save_parse_cache(cache_path, "abc", parse, TEXT)
+    assert load_parse_cache(cache_path, "def") is None
+
+
+def test_other_extract_settings_miss(cache_path, parse):
+    save_parse_cache(cache_path, "abc", parse, TEXT, extract_key="pymupdf/text")
+    assert load_parse_cache(cache_path, "abc", "pypdf/text") is None
+
+
+def test_version_bump_misses(cache_path, parse, monkeypatch):
+    save_parse_cache(cache_path, "abc", parse, TEXT)
+    monkeypatch.setattr(parse_cache, "PARSE_CACHE_VERSION", parse_cache.PARSE_CACHE_VERSION + 1)
+    assert load_parse_cache(cache_path, "abc") is None
+
+
+def test_missing_or_corrupt_cache_misses(cache_path):
+    assert load_parse_cache(cache_path, "abc") is None
+    cache_path.write_bytes(b"not a pickle")
+    assert load_parse_cache(cache_path, "abc") is None
+
+
+def test_file_sha1(tmp_path):
+    path = tmp_path / "script.pdf"
+    path.write_bytes(b"%PDF-1.4\n" * 1000)
+    assert file_sha1(str(path)) == file_sha1(str(path))
+    other = tmp_path / "other.pdf"
+    other.write_bytes(b"%PDF-1.5\n" * 1000)
+    assert file_sha1(str(other)) != file_sha1(str(path))
@@ -0,0 +1,69 @@
+"""Smoke tests for core.pdf_parser against a small generated PDF."""
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from core.pdf_parser import PDFParser
+
+
+@pytest.fixture
+def script_pdf(tmp_path):
+    path = tmp_path / "script.pdf"
+    doc = fitz.open()
+    for text in ("HAMLET\nTo be, or not to be.", "OPHELIA\nGood my lord."):
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.mark.parametrize("text_mode", ["text", "blocks"])
+def test_extract_text(script_pdf, text_mode):
+    parser = PDFParser(script_pdf, text_mode=text_mode)
+    try:
+        assert parser.num_pages() == 2
+        text = parser.extract_text(ocr_if_empty=False)
+    finally:
+        parser.close()
+    assert "To be, or not to be." in text
+    assert text.index("HAMLET") < text.index("OPHELIA")
+
+
+def test_pages_and_metadata(script_pdf):
+    parser = PDFParser(script_pdf)
+    try:
+        pages = parser.extract_pages(ocr_if_empty=False)
+        assert [p.page_index for p in pages] == [0, 1]
+        assert "OPHELIA" in parser.page_text(1, ocr_if_empty=False)
+        assert parser.has_text(0)
+        assert not parser.is_likely_scanned()
+        assert parser.get_metadata().num_pages == 2
+    finally:
+        parser.close()
+
+
+def test_pypdf_backend(script_pdf):
+    pytest.importorskip("pypdf")
+    parser = PDFParser(script_pdf, backend="pypdf")
+    try:
+        assert parser.backend == "pypdf"
+        assert "Good my lord." in parser.extract_text(ocr_if_empty=False)
+    finally:
+        parser.close()
+
+
+def test_extract_text_parallel(script_pdf, monkeypatch):
+    import core.pdf_parser as pdf_parser
+    monkeypatch.setattr(pdf_parser, "PARALLEL_MIN_PAGES", 2)
+    monkeypatch.setattr(pdf_parser, "PARALLEL_SHARD_PAGES", 1)
+    progress = []
+    parser = PDFParser(script_pdf)
+    try:
+        serial = parser.extract_text(ocr_if_empty=False)
+        parallel = parser.extract_text_parallel(workers=2, ocr_if_empty=False,
+                                                progress_callback=lambda d, t: progress.append(d))
+    finally:
+        parser.close()
+    assert parallel == serial
+    assert sorted(progress) == [1, 2]
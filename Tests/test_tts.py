@@ -0,0 +1,104 @@
+"""Tests for core.tts WAV framing and the sentence pipeline, with a fake Piper voice."""
+import io
+import random
+import threading
+import time
+import wave
+from types import SimpleNamespace
+
+import pytest
+
+from core import tts
+from core.tts import PiperTTS, PiperTTSError, _write_wav, WAV_HEADER_SIZE
+
+SAMPLE_RATE = 22050
+
+
+class FakeVoice:
+    """Stands in for PiperVoice: one PCM chunk per sentence, derived from its text."""
+
+    def __init__(self, delay: bool = False):
+        self.config = SimpleNamespace(sample_rate=SAMPLE_RATE)
+        self.delay = delay
+
+    def synthesize_stream_raw(self, text, **kwargs):
+        for sentence in tts._split_sentences(text):
+            if self.delay:
+                # Uneven synthesis times must not reorder the output
+                time.sleep(random.uniform(0, 0.01))
+            yield sentence.encode("utf-8").ljust(16, b"\0")
+
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    monkeypatch.setattr(tts, "_probe_piper", lambda: (True, None))
+    model = tmp_path / "voice.onnx"
+    model.write_bytes(b"")
+    engine = PiperTTS(model_path=str(model), sentence_silence_seconds=0.0)
+    voice = FakeVoice(delay=True)
+    monkeypatch.setattr(engine, "_get_piper_instance", lambda: voice)
+    return engine
+
+
+def _read_wav(data: bytes):
+    with wave.open(io.BytesIO(data), "rb") as w:
+        return w.getnchannels(), w.getsampwidth(), w.getframerate(), w.readframes(w.getnframes())
+
+
+def test_write_wav_patches_sizes():
+    buf = io.BytesIO()
+    chunks = [b"\x01\x00" * 10, b"\x02\x00" * 5]
+    assert _write_wav(buf, SAMPLE_RATE, chunks) == 30
+    data = buf.getvalue()
+    assert len(data) == WAV_HEADER_SIZE + 30
+    assert _read_wav(data) == (1, 2, SAMPLE_RATE, b"".join(chunks))
+
+
+def test_write_wav_empty():
+    buf = io.BytesIO()
+    assert _write_wav(buf, SAMPLE_RATE, []) == 0
+    assert len(buf.getvalue()) == WAV_HEADER_SIZE
+
+
+def test_synthesize_stream_is_header_then_pcm(engine):
+    chunks = list(engine.synthesize_stream("One. Two. Three."))
+    assert len(chunks[0]) == WAV_HEADER_SIZE
+    assert chunks[0][:4] == b"RIFF" and chunks[0][8:16] == b"WAVEfmt "
+    pcm = b"".join(chunks[1:])
+    assert pcm.startswith(b"One.")
+    assert _read_wav(chunks[0] + pcm)[3] == pcm
+
+
+def test_synthesize_sentences_keeps_order(engine):
+    sentences = [f"Line {i}." for i in range(40)]
+    out = list(engine.synthesize_sentences(" ".join(sentences)))
+    assert [chunk.rstrip(b"\0").decode() for chunk in out] == sentences
+
+
+def test_synthesize_sentences_inserts_silence(engine):
+    engine._sentence_silence_seconds = 0.01
+    out = list(engine.synthesize_sentences("First. Second."))
+    silence = b"\x00\x00" * int(SAMPLE_RATE * 0.01)
+    assert out[1] == silence
+    assert out[0].startswith(b"First.") and out[2].startswith(b"Second.")
+
+
+def test_synthesize_sentences_surfaces_errors(engine, monkeypatch):
+    def boom(*args, **kwargs):
+        raise RuntimeError("model failed")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(engine, "_iter_pcm", boom)
+    with pytest.raises(PiperTTSError):
+        list(engine.synthesize_sentences("Hello. World."))
+
+
+def test_synthesize_sentences_stops_when_abandoned(engine):
+    stream = engine.synthesize_sentences(" ".join(f"Line {i}." for i in range(100)))
+    next(stream)
+    stream.close()
+    # The worker must notice and stop rather than block on the full queue
+    deadline = time.monotonic() + 2
+    while any(t.name == "piper-sentences" for t in threading.enumerate()):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
@@ -1,16 +1,29 @@
 # app/config.py
 from __future__ import annotations
-import json
+import atexit
+import copy
+import os
+import threading
+import weakref
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# orjson encodes/decodes in C and returns bytes; the stdlib is the fallback
+try:
+    import orjson
+except Exception:
+    orjson = None
+    import json
+
 # Reuse the same app-support location as core.project_manager
 try:
     from core.project_manager import mac_app_support_dir
 except Exception:
     # Fallback if imported early in bootstrap
-    import os
+    import functools
     import platform
+
+    @functools.lru_cache(maxsize=8)
     def mac_app_support_dir(app_name: str = "ActorRehearsal") -> Path:
         """Cross-platform app support directory fallback."""
         system = platform.system()
@@ -21,10 +34,43 @@ except Exception:
             base = Path(appdata) / app_name
         else:  # Linux and other Unix-like systems
             base = Path.home() / ".config" / app_name
-        base.mkdir(parents=True, exist_ok=True)
+        if not base.is_dir():
+            base.mkdir(parents=True, exist_ok=True)
         return base
 
 
+# Setters mark the config dirty; the file is written this long after the last change
+SAVE_DELAY_SECONDS = 0.5
+
+# Live configs, so pending writes can be flushed at interpreter exit
+_instances: "weakref.WeakSet[AppConfig]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for config in list(_instances):
+        config.flush()
+
+
+# Written on first run; copied before use so instances never share nested dicts
+_DEFAULTS: Dict[str, Any] = {
+    "window": {"width": 1200, "height": 800, "maximized": False},
+    "editor": {
+        "font_family": "Courier Prime",
+        "font_size": 12,
+        "wrap": False,
+    },
+    "highlight": {"color": "#FFF59D", "weight": 600},
+    "recent_libraries": [],   # purely UI convenience
+    "recent_projects": [],    # list[str] of project names
+    "tts": {
+        "engine": "piper",
+        "model_path": "",
+        "speaker": None,
+    },
+}
+
+
 class AppConfig:
     """
     GUI-focused config (window, editor, highlight, recents).
@@ -36,48 +82,81 @@ class AppConfig:
         self._dir = mac_app_support_dir(app_name)
         self._path = self._dir / "ui_config.json"
         self._data: Dict[str, Any] = {}
+        # Copy of _data taken by the last setter and not yet written. Setters run on
+        # the GUI thread; the save timer only ever serializes this snapshot
+        self._pending: Optional[Dict[str, Any]] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # Held for a whole write, so writes land in order and flush() waits for them
+        self._write_lock = threading.Lock()
         self._load()
+        _instances.add(self)
 
     # ---------- I/O ----------
 
     def _load(self) -> None:
         if self._path.exists():
             try:
-                self._data = json.loads(self._path.read_text(encoding="utf-8"))
+                raw = self._path.read_bytes()
+                self._data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             except Exception:
                 self._data = {}
         if not self._data:
             self._data = self._defaults()
             self._save()
 
+    def _mark_dirty(self) -> None:
+        """Schedule a save, coalescing bursts of changes into one write."""
+        snapshot = copy.deepcopy(self._data)
+        with self._lock:
+            self._pending = snapshot
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(SAVE_DELAY_SECONDS, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes to disk now."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                data, self._pending = self._pending, None
+            if data is not None:
+                self._write(data)
+
     def _save(self) -> None:
+        """Write the current config to disk now, superseding any pending save."""
+        snapshot = copy.deepcopy(self._data)
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._pending = None
+            self._write(snapshot)
+
+    def _write(self, data: Dict[str, Any]) -> None:
         """Save config to disk. Silently fails if disk is full or permission denied."""
         try:
             tmp = self._path.with_suffix(".tmp")
-            tmp.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
-            tmp.replace(self._path)
+            if orjson is not None:
+                raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                # Compact output; the pure-Python indenting encoder is the slow path
+                raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            with open(tmp, "wb") as f:
+                f.write(raw)
+            os.replace(tmp, self._path)
         except (OSError, IOError, PermissionError) as e:
             # Silently fail if disk is full, permission denied, or other I/O errors
             # The setting will still work in memory, just won't persist
             pass
 
     def _defaults(self) -> Dict[str, Any]:
-        return {
-            "window": {"width": 1200, "height": 800, "maximized": False},
-            "editor": {
-                "font_family": "Courier Prime",
-                "font_size": 12,
-                "wrap": False,
-            },
-            "highlight": {"color": "#FFF59D", "weight": 600},
-            "recent_libraries": [],   # purely UI convenience
-            "recent_projects": [],    # list[str] of project names
-            "tts": {
-                "engine": "piper",
-                "model_path": "",
-                "speaker": None,
-            },
-        }
+        return copy.deepcopy(_DEFAULTS)
 
     # ---------- Window ----------
 
@@ -87,7 +166,7 @@ class AppConfig:
     def set_window_geometry(self, width: int, height: int, maximized: bool) -> None:
         self._data.setdefault("window", {})
         self._data["window"].update({"width": int(width), "height": int(height), "maximized": bool(maximized)})
-        self._save()
+        self._mark_dirty()
 
     # ---------- Editor ----------
 
@@ -102,7 +181,7 @@ class AppConfig:
             ed["font_size"] = int(font_size)
         if wrap is not None:
             ed["wrap"] = bool(wrap)
-        self._save()
+        self._mark_dirty()
 
     # ---------- Highlight ----------
 
@@ -115,30 +194,25 @@ class AppConfig:
             hl["color"] = str(color)
         if weight is not None:
             hl["weight"] = int(weight)
-        self._save()
+        self._mark_dirty()
 
     # ---------- Recents ----------
 
+    def _push_recent(self, key: str, value: str, max_items: int) -> None:
+        """Move value to the front of a recents list, dropping duplicates and overflow."""
+        lst = self._data.setdefault(key, [])
+        # One rebuild instead of remove() + insert(0) + truncate, each O(N)
+        lst[:] = [value, *(x for x in lst if x != value)][:max_items]
+        self._mark_dirty()
+
     def add_recent_library(self, path: str, max_items: int = 5) -> None:
-        lst = self._data.setdefault("recent_libraries", [])
-        path = str(Path(path).expanduser())
-        if path in lst:
-            lst.remove(path)
-        lst.insert(0, path)
-        del lst[max_items:]
-        self._save()
+        self._push_recent("recent_libraries", str(Path(path).expanduser()), max_items)
 
     def recent_libraries(self) -> list[str]:
         return list(self._data.get("recent_libraries", []))
 
     def add_recent_project(self, name: str, max_items: int = 10) -> None:
-        lst = self._data.setdefault("recent_projects", [])
-        name = str(name).strip()
-        if name in lst:
-            lst.remove(name)
-        lst.insert(0, name)
-        del lst[max_items:]
-        self._save()
+        self._push_recent("recent_projects", str(name).strip(), max_items)
 
     def recent_projects(self) -> list[str]:
         return list(self._data.get("recent_projects", []))
@@ -159,7 +233,7 @@ class AppConfig:
         if any(excluded in path_str for excluded in [".venv", "venv", "site-packages", "logreg_iris", "datasets"]):
             # Invalid path detected - clear it from config
             self._data["tts"]["model_path"] = ""
-            self._save()
+            self._mark_dirty()
             return None
         
         # Check if file exists
@@ -188,7 +262,7 @@ class AppConfig:
         
         self._data.setdefault("tts", {})
         self._data["tts"]["model_path"] = path_str
-        self._save()
+        self._mark_dirty()
 
     def tts_speaker(self) -> Optional[int]:
         cfg = self._data.setdefault("tts", {})
@@ -197,7 +271,7 @@ class AppConfig:
     def set_tts_speaker(self, speaker: Optional[int]) -> None:
         self._data.setdefault("tts", {})
         self._data["tts"]["speaker"] = speaker
-        self._save()
+        self._mark_dirty()
 
     # ---------- Character Colors ----------
 
@@ -231,7 +305,7 @@ class AppConfig:
             colors[char_key] = "No Highlight"
         else:
             colors[char_key] = str(color)
-        self._save()
+        self._mark_dirty()
 
     # ---------- Custom Colors ----------
 
@@ -246,7 +320,7 @@ class AppConfig:
         # Don't add if it's already in the list
         if color_str not in [c.upper() for c in custom]:
             custom.append(color_str)
-            self._save()
+            self._mark_dirty()
 
     # ---------- Rehearse Highlighting Options ----------
 
@@ -264,7 +338,7 @@ class AppConfig:
         """Set a rehearse highlighting option."""
         options = self._data.setdefault("rehearse_highlighting_options", {})
         options[option_name] = bool(value)
-        self._save()
+        self._mark_dirty()
 
     # ---------- Rehearse Alignment Options ----------
 
@@ -284,4 +358,4 @@ class AppConfig:
             raise ValueError(f"Invalid alignment: {alignment}. Must be 'left', 'center', or 'right'.")
         options = self._data.setdefault("rehearse_alignment_options", {})
         options[option_name] = alignment
-        self._save()
\ No newline at end of file
+        self._mark_dirty()
\ No newline at end of file
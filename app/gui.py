@@ -2,21 +2,31 @@
 from __future__ import annotations
 import sys
 import os
+import time
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set, Tuple
 
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QAction, QTextCharFormat, QColor, QIcon
+from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal, QStringListModel, QTimer
+from PyQt6.QtGui import QAction, QTextCharFormat, QColor, QIcon, QTextCursor, QFont, QSyntaxHighlighter
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog, QMessageBox,
     QHBoxLayout, QVBoxLayout, QListWidget, QListWidgetItem, QPushButton,
-    QLabel, QComboBox, QTextEdit, QSplitter, QToolBar, QStatusBar
+    QLabel, QComboBox, QPlainTextEdit, QSplitter, QToolBar, QStatusBar
 )
 
 # Core modules
 from core.project_manager import ProjectManager, ProjectLibraryError, Project, ProjectLibrary
 from core.pdf_parser import PDFParser
-from core.nlp_processor import parse_script_text, list_characters, blocks_for_character, ScriptParse
+from core.highlighter import compute_line_offsets
+from core.parse_cache import PARSE_CACHE_FILENAME, file_sha1, load_parse_cache, save_parse_cache
+from core.nlp_processor import parse_script_text, list_characters, blocks_for_character, ScriptParse, DialogueBlock
+
+# Quiet period after the last character-combo change before highlighting
+HIGHLIGHT_DEBOUNCE_MS = 150
+
+# Scripts longer than this (in characters) get a block list instead of inline
+# highlighting; painting every line of a huge document stalls the GUI
+MAX_HIGHLIGHT_CHARS = 800_000
 
 
 # ----------------------------
@@ -32,6 +42,113 @@ def _info(parent: QWidget, msg: str) -> None:
 def _confirm(parent: QWidget, msg: str) -> bool:
     return QMessageBox.question(parent, "Confirm", msg) == QMessageBox.StandardButton.Yes
 
+def _merged_line_ranges(blocks: List[DialogueBlock]) -> List[Tuple[int, int]]:
+    """Sorted inclusive (start_line, end_line) spans, with touching/overlapping spans joined."""
+    spans = sorted((max(0, b.start_line), max(0, b.start_line, b.end_line)) for b in blocks)
+    merged: List[Tuple[int, int]] = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+# ----------------------------
+# Character highlighting
+# ----------------------------
+
+class CharacterHighlighter(QSyntaxHighlighter):
+    """Paints whole script lines; the view holds one line per block, so lines are block numbers."""
+
+    def __init__(self, document):
+        super().__init__(document)
+        self._target_blocks: Set[int] = set()
+        self._fmt = QTextCharFormat()
+        self._fmt.setBackground(QColor("#FFF59D"))  # soft yellow
+        self._fmt.setFontWeight(600)
+
+    def reset(self) -> None:
+        """Forget the targets without repainting (the document is about to be replaced)."""
+        self._target_blocks = set()
+
+    def set_lines(self, lines: Set[int]) -> None:
+        """Highlight exactly these lines, repainting only the blocks whose state changes."""
+        changed = self._target_blocks ^ lines
+        self._target_blocks = lines
+        doc = self.document()
+        if doc is None:
+            return
+        for n in sorted(changed):
+            block = doc.findBlockByNumber(n)
+            if block.isValid():
+                self.rehighlightBlock(block)
+
+    def highlightBlock(self, text: str) -> None:
+        if self.currentBlock().blockNumber() in self._target_blocks:
+            self.setFormat(0, len(text), self._fmt)
+
+
+# ----------------------------
+# Background script loading
+# ----------------------------
+
+class ScriptLoadWorker(QThread):
+    """Extracts and parses a project's PDF off the GUI thread."""
+
+    loaded = pyqtSignal(object, object, str)  # project, ScriptParse, full text
+    failed = pyqtSignal(object, str)  # project, error message
+    progress = pyqtSignal(int, int)  # pages done, total pages
+
+    def __init__(self, project: Project, backend: Optional[str] = None, text_mode: str = "text",
+                 cache_path: Optional[Path] = None, parent=None):
+        super().__init__(parent)
+        self.project = project
+        self.backend = backend
+        self.text_mode = text_mode
+        self.cache_path = cache_path
+        self.elapsed = 0.0  # seconds spent extracting text
+
+    def run(self):
+        started = time.perf_counter()
+        # Extraction output depends on the engine and text mode as well as the file
+        extract_key = f"{self.backend or 'auto'}:{self.text_mode}"
+        pdf_sha1 = None
+        if self.cache_path is not None:
+            try:
+                pdf_sha1 = file_sha1(self.project.pdf_path)
+            except OSError:
+                pdf_sha1 = None
+            cached = load_parse_cache(self.cache_path, pdf_sha1, extract_key) if pdf_sha1 else None
+            if cached is not None:
+                self.backend = "cache"
+                self.elapsed = time.perf_counter() - started
+                self.loaded.emit(self.project, cached[0], cached[1])
+                return
+        try:
+            parser = PDFParser(self.project.pdf_path, backend=self.backend, text_mode=self.text_mode)
+            self.backend = parser.backend
+            try:
+                full_text = parser.extract_text_parallel(
+                    preserve_layout=True, ocr_if_empty=True,
+                    progress_callback=self.progress.emit,
+                )
+            finally:
+                parser.close()
+        except Exception as e:
+            self.failed.emit(self.project, f"Failed to read PDF:\n{e}")
+            return
+        self.elapsed = time.perf_counter() - started
+        full_text = full_text if full_text else ""
+        try:
+            parse = parse_script_text(full_text)
+        except Exception as e:
+            self.failed.emit(self.project, f"Failed to parse script:\n{e}")
+            return
+        if pdf_sha1:
+            save_parse_cache(self.cache_path, pdf_sha1, parse, full_text, extract_key)
+        self.loaded.emit(self.project, parse, full_text)
+
 
 # ----------------------------
 # Main Window
@@ -56,6 +173,15 @@ class MainWindow(QMainWindow):
         self.current_text: str = ""
         self.current_parse: Optional[ScriptParse] = None
         self.line_offsets: List[int] = []  # cumulative char offsets for each line
+        self._range_cache: Dict[str, List[Tuple[int, int]]] = {}  # character -> merged line spans
+        self._last_highlighted_char: Optional[str] = None  # character shown in the current text
+        self._load_worker: Optional[ScriptLoadWorker] = None
+        # Debounce highlight requests so scrolling through the combo only paints the last pick
+        self._pending_char: str = ""
+        self._hl_timer = QTimer(self)
+        self._hl_timer.setSingleShot(True)
+        self._hl_timer.setInterval(HIGHLIGHT_DEBOUNCE_MS)
+        self._hl_timer.timeout.connect(self._do_highlight)
 
         # UI
         self._build_actions()
@@ -108,6 +234,7 @@ class MainWindow(QMainWindow):
         tb.addSeparator()
         tb.addAction(self.act_quit)
         self.addToolBar(tb)
+        self._toolbar = tb
 
     def _build_content(self) -> None:
         # Left: project list
@@ -123,6 +250,9 @@ class MainWindow(QMainWindow):
         # Right: script area
         self.lbl_project = QLabel("No project open")
         self.cmb_char = QComboBox()
+        # Backed by a string list model so a reload can swap all names in one reset
+        self._char_model = QStringListModel(self)
+        self.cmb_char.setModel(self._char_model)
         self.cmb_char.currentTextChanged.connect(self.on_character_changed)
         self.btn_select_char = QPushButton("Use Selected Character")
         self.btn_select_char.clicked.connect(self.on_set_project_character)
@@ -133,16 +263,26 @@ class MainWindow(QMainWindow):
         header.addWidget(self.cmb_char)
         header.addWidget(self.btn_select_char)
 
-        self.txt_script = QTextEdit()
+        self.txt_script = QPlainTextEdit()
         self.txt_script.setReadOnly(True)
-        self.txt_script.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.txt_script.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         # macOS font readability
-        self.txt_script.setFontFamily("Courier Prime")
-        self.txt_script.setFontPointSize(12)
+        self.txt_script.setFont(QFont("Courier Prime", 12))
+        self._highlighter = CharacterHighlighter(self.txt_script.document())
+
+        # Sidebar list of the character's blocks, used instead of highlighting huge scripts
+        self.list_blocks = QListWidget()
+        self.list_blocks.setMaximumWidth(320)
+        self.list_blocks.itemDoubleClicked.connect(self.on_block_activated)
+        self.list_blocks.hide()
+
+        body = QHBoxLayout()
+        body.addWidget(self.txt_script, stretch=1)
+        body.addWidget(self.list_blocks)
 
         right_box = QVBoxLayout()
         right_box.addLayout(header)
-        right_box.addWidget(self.txt_script, stretch=1)
+        right_box.addLayout(body, stretch=1)
         right_panel = QWidget()
         right_panel.setLayout(right_box)
 
@@ -175,19 +315,55 @@ class MainWindow(QMainWindow):
         return int(item.data(Qt.ItemDataRole.UserRole))
 
     def _load_project(self, proj: Project) -> None:
+        if self._load_worker is not None:
+            self.statusBar().showMessage("Still loading the previous script…", 3000)
+            return
         self.current_project = proj
         self.lbl_project.setText(f"Project: {proj.name}  |  PDF: {proj.pdf_path}")
-        # Extract text
-        try:
-            parser = PDFParser(proj.pdf_path)
-            full_text = parser.extract_text(preserve_layout=True, ocr_if_empty=True)
-            parser.close()
-        except Exception as e:
-            _err(self, f"Failed to read PDF:\n{e}")
-            return
-        self.current_text = full_text if full_text else ""
-        # Parse
-        self.current_parse = parse_script_text(self.current_text)
+        # Extract and parse on a worker thread so the window stays responsive
+        self._toolbar.setEnabled(False)
+        self.list_projects.setEnabled(False)
+        self.statusBar().showMessage("Loading script…")
+        lib = self.pm.library
+        cache_path = lib.attachment_path(proj, PARSE_CACHE_FILENAME) if lib else None
+        worker = ScriptLoadWorker(proj, backend=self.pm.config.pdf_backend,
+                                  text_mode=self.pm.config.pdf_text_mode,
+                                  cache_path=cache_path, parent=self)
+        worker.progress.connect(self._on_load_progress)
+        worker.loaded.connect(self._on_script_loaded)
+        worker.failed.connect(self._on_load_failed)
+        self._load_worker = worker
+        worker.start()
+
+    def _finish_loading(self) -> None:
+        worker = self._load_worker
+        self._load_worker = None
+        if worker is not None:
+            worker.wait()
+            worker.deleteLater()
+        self._toolbar.setEnabled(True)
+        self.list_projects.setEnabled(True)
+
+    def _on_load_progress(self, done: int, total: int) -> None:
+        self.statusBar().showMessage(f"Reading page {done} of {total}…")
+
+    def _on_load_failed(self, proj: Project, message: str) -> None:
+        self._finish_loading()
+        self.statusBar().clearMessage()
+        _err(self, message)
+
+    def _on_script_loaded(self, proj: Project, parse: ScriptParse, full_text: str) -> None:
+        worker = self._load_worker
+        self._finish_loading()
+        if worker is not None:
+            self.statusBar().showMessage(
+                f"Loaded {proj.name} ({worker.backend}, {worker.elapsed:.1f}s)", 5000)
+        else:
+            self.statusBar().showMessage(f"Loaded {proj.name}", 3000)
+        self.current_text = full_text
+        self.current_parse = parse
+        self._range_cache.clear()
+        self._hl_timer.stop()  # a pending pick belongs to the previous script
         self._populate_character_combo(proj)
         # Show text and apply highlight (if a character is already chosen)
         self._set_script_text(self.current_parse.lines if self.current_parse else self.current_text.splitlines())
@@ -195,72 +371,86 @@ class MainWindow(QMainWindow):
             self._highlight_character(proj.chosen_character)
 
     def _populate_character_combo(self, proj: Project) -> None:
+        chars = list_characters(self.current_parse, sort_by_freq=True) if self.current_parse else []
         self.cmb_char.blockSignals(True)
-        self.cmb_char.clear()
-        if not self.current_parse:
-            self.cmb_char.blockSignals(False)
-            return
-        chars = list_characters(self.current_parse, sort_by_freq=True)
-        self.cmb_char.addItems(chars)
+        # Reloading the same script leaves the model (and the popup's layout) untouched
+        if chars != self._char_model.stringList():
+            self._char_model.setStringList(chars)
+            if chars and self.cmb_char.currentIndex() < 0:
+                self.cmb_char.setCurrentIndex(0)
         # Preselect project’s chosen character if present
         if proj.chosen_character and proj.chosen_character in chars:
             self.cmb_char.setCurrentText(proj.chosen_character)
         self.cmb_char.blockSignals(False)
 
     def _set_script_text(self, lines: List[str]) -> None:
-        # Build offsets per line for highlighting by line-span
-        self.line_offsets = []
-        buf = []
-        offset = 0
-        for i, ln in enumerate(lines):
-            self.line_offsets.append(offset)
-            buf.append(ln)
-            offset += len(ln) + 1  # +1 for newline we insert
-        text = "\n".join(buf)
-        self.txt_script.clear()
+        # Offsets per line for highlighting by line-span
+        self.line_offsets = compute_line_offsets(lines)
+        text = "\n".join(lines)
+        self._highlighter.reset()
+        self._last_highlighted_char = None
+        # Detach the highlighter from oversized scripts so loading them doesn't run it per line
+        doc = self.txt_script.document()
+        self._highlighter.setDocument(None if len(text) > MAX_HIGHLIGHT_CHARS else doc)
         self.txt_script.setPlainText(text)
+        self.list_blocks.clear()
+        self.list_blocks.hide()
+
+    def _show_block_list(self, blocks: List[DialogueBlock]) -> None:
+        """List a character's blocks by line; double-clicking one scrolls to it."""
+        self.list_blocks.clear()
+        for b in blocks:
+            item = QListWidgetItem(f"Line {b.start_line + 1}: {b.text[:60]}")
+            item.setData(Qt.ItemDataRole.UserRole, b.start_line)
+            self.list_blocks.addItem(item)
+        self.list_blocks.show()
 
     def _highlight_character(self, character: str) -> None:
         if not self.current_parse:
             return
-        # Clear formats
-        cursor = self.txt_script.textCursor()
-        cursor.beginEditBlock()
-        cursor.select(cursor.SelectionType.Document)
-        default_fmt = QTextCharFormat()
-        self.txt_script.textCursor().mergeCharFormat(default_fmt)
-        cursor.endEditBlock()
-
-        # Prepare highlight format
-        fmt = QTextCharFormat()
-        fmt.setBackground(QColor("#FFF59D"))  # soft yellow
-        fmt.setFontWeight(600)
-
-        blocks = blocks_for_character(self.current_parse, character)
-        if not blocks:
-            self.statusBar().showMessage(f"No blocks found for {character}", 5000)
+        if character == self._last_highlighted_char:
+            return  # already shown for this text
+        self._last_highlighted_char = character
+
+        # characterCount() is O(1) and counts the final paragraph separator, hence - 1;
+        # this matches the len(text) check that detached the highlighter
+        if self.txt_script.document().characterCount() - 1 > MAX_HIGHLIGHT_CHARS:
+            blocks = blocks_for_character(self.current_parse, character)
+            self._show_block_list(blocks)
+            if not blocks:
+                self.statusBar().showMessage(f"No blocks found for {character}", 5000)
+            else:
+                self.statusBar().showMessage(
+                    f"Script too large to highlight; listed {len(blocks)} blocks for {character}", 5000)
             return
 
-        doc = self.txt_script.document()
-        cursor = self.txt_script.textCursor()
-        cursor.beginEditBlock()
-        for b in blocks:
-            start_line = max(0, b.start_line)
-            end_line = max(start_line, b.end_line)
-            if start_line >= len(self.line_offsets):
-                continue
-            start_pos = self.line_offsets[start_line]
-            # inclusive end_line
-            end_pos = self.line_offsets[end_line] + len(self.current_parse.lines[end_line]) if end_line < len(self.line_offsets) else len(self.txt_script.toPlainText())
-            # Apply format
-            cursor.setPosition(start_pos)
-            cursor.setPosition(end_pos, cursor.MoveMode.KeepAnchor)
-            cursor.mergeCharFormat(fmt)
-        cursor.endEditBlock()
+        ranges = self._range_cache.get(character)
+        if ranges is None:
+            ranges = _merged_line_ranges(blocks_for_character(self.current_parse, character))
+            self._range_cache[character] = ranges
+        # The highlighter repaints only lines entering or leaving the highlight
+        self._highlighter.set_lines({n for start, end in ranges for n in range(start, end + 1)})
+
+        if not ranges:
+            self.statusBar().showMessage(f"No blocks found for {character}", 5000)
+            return
         self.statusBar().showMessage(f"Highlighted lines for {character}", 3000)
 
+    def closeEvent(self, event) -> None:
+        # A QThread must not be destroyed while running
+        if self._load_worker is not None:
+            self._load_worker.wait()
+        super().closeEvent(event)
+
     # ---- Slots ----
 
+    def on_block_activated(self, item: QListWidgetItem) -> None:
+        doc = self.txt_script.document()
+        line = min(int(item.data(Qt.ItemDataRole.UserRole)), doc.blockCount() - 1)
+        self.txt_script.setTextCursor(QTextCursor(doc.findBlockByNumber(line)))
+        self.txt_script.ensureCursorVisible()
+        self.txt_script.setFocus()
+
     def on_choose_library(self) -> None:
         path = QFileDialog.getExistingDirectory(self, "Select Project Library Folder")
         if not path:
@@ -359,8 +549,13 @@ class MainWindow(QMainWindow):
     def on_character_changed(self, name: str) -> None:
         if not name:
             return
-        # Preview highlight without saving
-        self._highlight_character(name)
+        # Preview highlight without saving, once the selection settles
+        self._pending_char = name
+        self._hl_timer.start()
+
+    def _do_highlight(self) -> None:
+        if self._pending_char:
+            self._highlight_character(self._pending_char)
 
     def on_set_project_character(self) -> None:
         if not self.current_project:
@@ -660,7 +660,7 @@ class ProjectBrowser(QWidget):
                         # Update the path to point to the new folder
                         new_pdf_path = new_folder / old_pdf_path.name
                         # Update the PDF path in the database
-                        self.pm.library.update_pdf_path(proj.id, str(new_pdf_path), copy_into_library=False)
+                        self.pm.replace_pdf(proj.id, str(new_pdf_path), copy_into_library=False)
             
             # Refresh the project list
             self._refresh_projects(scan_filesystem=False)
@@ -14,13 +14,7 @@ from PyQt6.QtWidgets import (
     QColorDialog, QMessageBox, QFileDialog, QFrame
 )
 
-try:
-    import fitz  # PyMuPDF
-    _HAVE_PYMUPDF = True
-except Exception:
-    _HAVE_PYMUPDF = False
-
-from core.pdf_editor import PDFEditor, PDFEditorError
+from core.pdf_editor import PDFEditor, PDFEditorError, _fitz
 from core.file_state_manager import FileStateManager
 
 
@@ -141,7 +135,9 @@ class AnnotateTab(QWidget):
     
     def _load_pdf(self, pdf_path: Path) -> None:
         """Load a PDF file for annotation."""
-        if not _HAVE_PYMUPDF:
+        try:
+            _fitz()  # PyMuPDF is imported on first use, not at app startup
+        except PDFEditorError:
             self.label_pdf.setText("PyMuPDF is required for PDF annotation")
             return
         
@@ -208,21 +204,16 @@ class AnnotateTab(QWidget):
             return
         
         try:
-            page = self.pdf_editor._doc[self.current_page]
-            mat = fitz.Matrix(self.zoom, self.zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
+            rgb = self.pdf_editor.get_page_rgb(self.current_page, self.zoom)
+            if rgb is None:
+                return
+            width, height, data = rgb
             
-            # Convert to QImage
-            img = QImage(
-                pix.samples,
-                pix.width,
-                pix.height,
-                pix.stride,
-                QImage.Format.Format_RGB888
-            )
+            # Wrap the raw RGB buffer directly (no PNG round-trip)
+            img = QImage(data, width, height, width * 3, QImage.Format.Format_RGB888)
             
             if img.isNull():
-                img_data = pix.tobytes("png")
+                img_data = self.pdf_editor.get_page_image(self.current_page, self.zoom)
                 img = QImage.fromData(img_data, "PNG")
             
             pixmap = QPixmap.fromImage(img)
@@ -15,7 +15,7 @@ from core.voice_installer import VoiceInstaller
 
 class VoiceInstallThread(QThread):
     """Thread for installing voices in the background."""
-    progress = pyqtSignal(str, int, int)  # voice_name, current, total
+    progress = pyqtSignal(str, int, int)  # voice_name just finished, completed, total
     finished = pyqtSignal(int, int)  # installed_count, total_count
     
     def __init__(self, models_dir: Path, presets_dir: Path):
@@ -34,7 +34,7 @@ class VoiceInstallThread(QThread):
             progress_callback
         )
         
-        total = len(VoiceInstaller.get_all_voices())
+        total = len(VoiceInstaller.get_all_voices(self.models_dir / VoiceInstaller.VOICES_CACHE_FILE))
         self.finished.emit(installed, total)
 
 
@@ -66,7 +66,7 @@ class VoiceInstallDialog(QDialog):
         
         # Progress bar
         from core.voice_installer import VoiceInstaller
-        total_voices = len(VoiceInstaller.get_all_voices())
+        total_voices = len(VoiceInstaller.get_all_voices(self.models_dir / VoiceInstaller.VOICES_CACHE_FILE))
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, total_voices)
         self.progress_bar.setValue(0)
@@ -91,9 +91,9 @@ class VoiceInstallDialog(QDialog):
         self.install_thread.start()
     
     def _on_progress(self, voice_name: str, current: int, total: int) -> None:
-        """Update progress."""
+        """Update progress; voice_name is the voice that just finished (installed or failed)."""
         self.progress_bar.setValue(current)
-        self.status_label.setText(f"Installing {voice_name}... ({current}/{total})")
+        self.status_label.setText(f"Finished {voice_name} ({current}/{total})...")
     
     def _on_finished(self, installed: int, total: int) -> None:
         """Handle installation completion."""
@@ -1,6 +1,8 @@
 # core/highlighter.py
 from __future__ import annotations
+import operator
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import List, Tuple, Optional
 
 # We depend on the parsing structures to know where dialogue lives.
@@ -42,12 +44,9 @@ def compute_line_offsets(lines: List[str]) -> List[int]:
     Returns cumulative character offsets for each line’s start,
     assuming the final text is '\n'.join(lines).
     """
-    offsets: List[int] = []
-    cur = 0
-    for ln in lines:
-        offsets.append(cur)
-        cur += len(ln) + 1  # +1 for the newline we’ll join with
-    return offsets
+    # offset[i] = sum of the previous line lengths + i newlines; every step runs in C
+    # (map stops at range's end, dropping accumulate's trailing grand total)
+    return list(map(operator.add, accumulate(map(len, lines), initial=0), range(len(lines))))
 
 
 def get_highlight_spans(parse: ScriptParse, character: str) -> List[HighlightSpan]:
@@ -4,45 +4,73 @@ OCR utility for extracting text from image files.
 Uses EasyOCR which is open source and commercially licensable (Apache 2.0).
 """
 from __future__ import annotations
+import functools
 from pathlib import Path
-from typing import Optional, Callable
-import numpy as np
+from typing import TYPE_CHECKING, Optional, Callable
 
-try:
+if TYPE_CHECKING:
     import easyocr
-    from PIL import Image
-    _HAVE_EASYOCR = True
-except Exception:
-    _HAVE_EASYOCR = False
 
 
 class ImageOCRError(Exception):
     """Generic OCR error."""
 
 
+def _noop(*args, **kwargs) -> None:
+    pass
+
+
+def _raise_missing_easyocr(cause: Optional[BaseException] = None) -> None:
+    """Raise the standard 'EasyOCR is not available' error."""
+    raise ImageOCRError(
+        "EasyOCR is not available. Please install EasyOCR:\n\n"
+        "pip install easyocr\n\n"
+        "Note: EasyOCR requires PyTorch, which will be installed automatically."
+    ) from cause
+
+
+# EasyOCR pulls in PyTorch, so it (and PIL) are only imported on first OCR call.
+@functools.lru_cache(maxsize=1)
+def _easyocr():
+    """Import and return the easyocr module."""
+    try:
+        import easyocr
+    except Exception as e:
+        _raise_missing_easyocr(e)
+    return easyocr
+
+
+@functools.lru_cache(maxsize=1)
+def _pil_image():
+    """Import and return PIL.Image."""
+    try:
+        from PIL import Image
+    except Exception as e:
+        raise ImageOCRError("Pillow is not available. Please install it with: pip install Pillow") from e
+    return Image
+
+
+# Longest image side fed to the OCR detector; larger photos are downscaled first.
+DEFAULT_MAX_DIM = 2000
+
 # Global EasyOCR reader instance (lazy initialization)
-_reader_instance: Optional[easyocr.Reader] = None
+_reader_instance: Optional["easyocr.Reader"] = None
 
 
-def _get_reader(lang: str = "en") -> easyocr.Reader:
+def _get_reader(lang: str = "en") -> "easyocr.Reader":
     """Get or create EasyOCR reader instance."""
     global _reader_instance
     if _reader_instance is None:
-        if not _HAVE_EASYOCR:
-            raise ImageOCRError(
-                "EasyOCR is not available. Please install EasyOCR:\n\n"
-                "pip install easyocr\n\n"
-                "Note: EasyOCR requires PyTorch, which will be installed automatically."
-            )
         # Initialize reader (this downloads models on first use)
-        _reader_instance = easyocr.Reader([lang], gpu=False)
+        _reader_instance = _easyocr().Reader([lang], gpu=False)
     return _reader_instance
 
 
 def extract_text_from_image(
     image_path: Path,
     lang: str = "en",
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_dim: Optional[int] = DEFAULT_MAX_DIM
 ) -> str:
     """
     Extract text from an image file using EasyOCR.
@@ -51,6 +79,8 @@ def extract_text_from_image(
         image_path: Path to the image file
         lang: Language code for OCR (default: "en" for English)
         progress_callback: Optional callback function(progress, total) for progress updates
+        max_dim: Downscale so the longest side is at most this many pixels
+            (None to OCR at full resolution, e.g. for very small print)
         
     Returns:
         Extracted text as a string
@@ -58,54 +88,50 @@ def extract_text_from_image(
     Raises:
         ImageOCRError: If OCR fails or EasyOCR is not available
     """
-    if not _HAVE_EASYOCR:
-        raise ImageOCRError(
-            "EasyOCR is not available. Please install EasyOCR:\n\n"
-            "pip install easyocr\n\n"
-            "Note: EasyOCR requires PyTorch, which will be installed automatically."
-        )
+    _easyocr()  # raises ImageOCRError if EasyOCR is missing
     
     if not image_path.exists():
         raise ImageOCRError(f"Image file not found: {image_path}")
     
+    _report = progress_callback or _noop
+    
     try:
         # Report progress start
-        if progress_callback:
-            progress_callback(0, 100)
+        _report(0, 100)
         
         # Load image
-        if progress_callback:
-            progress_callback(10, 100)
-        
-        img = Image.open(str(image_path))
+        _report(10, 100)
+        img = _pil_image().open(str(image_path))
         
         # Convert to RGB if necessary
         if img.mode != "RGB":
-            if progress_callback:
-                progress_callback(20, 100)
+            _report(20, 100)
             img = img.convert("RGB")
         
+        # Cap resolution; detector cost scales with pixel count
+        if max_dim and max(img.size) > max_dim:
+            scale = max_dim / max(img.size)
+            new_size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+            img = img.resize(new_size, _pil_image().Resampling.BOX)
+        
         # Convert PIL Image to numpy array for EasyOCR
-        if progress_callback:
-            progress_callback(30, 100)
+        _report(30, 100)
         
+        import numpy as np
         img_array = np.array(img)
         
         # Get EasyOCR reader
-        if progress_callback:
-            progress_callback(40, 100)
+        _report(40, 100)
         
         reader = _get_reader(lang)
         
         # Perform OCR
-        if progress_callback:
-            progress_callback(50, 100)
+        _report(50, 100)
         
         # EasyOCR returns list of (bbox, text, confidence) tuples
         results = reader.readtext(img_array)
         
-        if progress_callback:
-            progress_callback(90, 100)
+        _report(90, 100)
         
         # Extract text from results, preserving line breaks
         # Sort by vertical position (top to bottom) to maintain reading order
@@ -140,20 +166,14 @@ def extract_text_from_image(
         else:
             extracted_text = ""
         
-        if progress_callback:
-            progress_callback(100, 100)
+        _report(100, 100)
         
         return extracted_text.strip()
         
     except Exception as e:
-        error_msg = str(e)
-        if "easyocr" in error_msg.lower() or "not found" in error_msg.lower():
-            raise ImageOCRError(
-                "EasyOCR is not installed or not working properly.\n\n"
-                "Please install EasyOCR:\n\n"
-                "pip install easyocr\n\n"
-                "Note: EasyOCR requires PyTorch, which will be installed automatically."
-            ) from e
+        error_msg = str(e).lower()
+        if "easyocr" in error_msg or "not found" in error_msg:
+            _raise_missing_easyocr(e)
         raise ImageOCRError(f"Failed to extract text from image: {e}") from e
 
 
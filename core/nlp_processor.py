@@ -1,14 +1,26 @@
 # core/nlp_processor.py
 from __future__ import annotations
+import functools
+import importlib.util
 import re
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 
-try:
-    import spacy  # optional boost
-    _HAVE_SPACY = True
-except Exception:
-    _HAVE_SPACY = False
+# spaCy is an optional alias boost; it is only imported (and a model loaded) when
+# alias resolution actually runs, so importing this module stays cheap
+_HAVE_SPACY = importlib.util.find_spec("spacy") is not None
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+
+@functools.lru_cache(maxsize=4)
+def _load_spacy(model: str):
+    """Load a spaCy pipeline for NER, or None if spaCy or the model is missing."""
+    try:
+        import spacy
+        return spacy.load(model, disable=["parser", "tagger", "lemmatizer", "textcat"])
+    except Exception:
+        return None
 
 @dataclass
 class DialogueBlock:
@@ -25,40 +37,99 @@ class ScriptParse:
     blocks: List[DialogueBlock]
     character_aliases: Dict[str, List[str]]
     lines: List[str]
+    # speaker -> that speaker's blocks, in script order
+    blocks_by_speaker: Dict[str, List[DialogueBlock]] = field(default_factory=dict)
+    # True once spaCy alias resolution has run (or was attempted)
+    aliases_resolved: bool = False
 
-_SCENE_RE = re.compile(r'^(INT\.|EXT\.|INT/EXT\.|I/E\.|EST\.|INT\.? ?/ ?EXT\.?)\b')
-_TRANSITION_RE = re.compile(r'(FADE IN:|FADE OUT\.?|CUT TO:|DISSOLVE TO:|SMASH CUT TO:|MATCH CUT TO:|WIPE TO:)\s*$')
-_NAME_LINE_RE = re.compile(r"""^(?P<name>[A-Z0-9 .'\-]{2,}(?: [A-Z0-9 .'\-]{1,}){0,3})(?:\s*\((?:V\.O\.|O\.S\.|OS|OC|CONT'?D|CONT’D|PHONE|FILTERED)\))?\s*$""", re.X)
-_NAME_BLACKLIST = {"INT","EXT","DAY","NIGHT","LATER","MOMENTS LATER","CONTINUOUS","CUT TO","FADE IN","FADE OUT","DISSOLVE TO","SMASH CUT TO","MATCH CUT TO","SUPER","TITLE","CREDITS"}
+    def needs_alias_resolution(self) -> bool:
+        return not self.aliases_resolved and bool(self.blocks)
+
+_SCENE_PAT = r'(?:INT\.|EXT\.|INT/EXT\.|I/E\.|EST\.|INT\.? ?/ ?EXT\.?)\b'
+_TRANSITION_PAT = r'(?:FADE IN:|FADE OUT\.?|CUT TO:|DISSOLVE TO:|SMASH CUT TO:|MATCH CUT TO:|WIPE TO:)\s*$'
+# Optional cue extension such as (V.O.) or (CONT'D), then end of line
+_CUE_EXT_PAT = r"""(?:\s*\((?:V\.O\.|O\.S\.|OS|OC|CONT'?D|CONT’D|PHONE|FILTERED)\))?\s*$"""
+_NAME_BLACKLIST = frozenset({"INT","EXT","DAY","NIGHT","LATER","MOMENTS LATER","CONTINUOUS","CUT TO","FADE IN","FADE OUT","DISSOLVE TO","SMASH CUT TO","MATCH CUT TO","SUPER","TITLE","CREDITS"})
+# Cue text that _clean_name would reduce to a blacklisted word (padding of spaces,
+# dots and dashes, collapsed inner spaces, an optional extension); rejecting it in
+# the pattern saves the clean-up call for those lines
+_BLACKLIST_PAT = (
+    r'[ .\-]*(?:'
+    + '|'.join(re.escape(w).replace(r'\ ', ' +') for w in sorted(_NAME_BLACKLIST, key=len, reverse=True))
+    + r')[ .\-]*' + _CUE_EXT_PAT
+)
+# The character class already includes the space, so a single run covers multi-word
+# names; nesting quantifiers here backtracks polynomially on long all-caps lines
+_NAME_LINE_PAT = r"""(?!""" + _BLACKLIST_PAT + r""")(?P<name>[A-Z0-9 .'\-]{2,})""" + _CUE_EXT_PAT
+# All three in one pass over a stripped line, in priority order: a scene heading
+# at the start, a transition ending the line (found anywhere, like re.search), then a cue name
+_CLASSIFY_RE = re.compile(
+    '(?P<scene>' + _SCENE_PAT + ')'
+    '|.*?(?P<trans>' + _TRANSITION_PAT + ')'
+    '|' + _NAME_LINE_PAT
+)
 _PAREN_RE = re.compile(r'\(([^)]+)\)')
 _MULTI_SPACE_RE = re.compile(r'\s{2,}')
 
+# Line kinds produced by _classify_lines
+KIND_BODY = 0
+KIND_NAME = 1
+KIND_SCENE = 2  # scene heading or transition
+KIND_BLANK = 3
+
+# ASCII byte -> 1 for an upper-case letter, 2 for lower-case, 0 otherwise
+_CASE_TABLE = bytes(1 if 65 <= i <= 90 else 2 if 97 <= i <= 122 else 0 for i in range(256))
+
 def _is_mostly_caps(s: str) -> bool:
+    if s.isascii():
+        # Count letter cases in C: translate to case codes, then count them
+        codes = s.encode('ascii').translate(_CASE_TABLE)
+        caps = codes.count(1)
+        letters = caps + codes.count(2)
+        if not letters: return False
+        return caps / letters >= 0.9
+    # Non-ASCII letters need str.isalpha()/isupper()
     letters = [ch for ch in s if ch.isalpha()]
     if not letters: return False
     caps = sum(1 for ch in letters if ch.isupper())
     return caps / len(letters) >= 0.9
 
-def _is_scene_or_transition(line: str) -> bool:
-    l = line.strip()
-    return bool(_SCENE_RE.match(l)) or bool(_TRANSITION_RE.search(l))
-
 def _clean_name(name: str) -> str:
     name = _MULTI_SPACE_RE.sub(' ', name.strip())
     name = re.sub(r'\s*\((?:V\.O\.|O\.S\.|OS|OC|CONT\'?D|CONT’D|PHONE|FILTERED)\)\s*$', '', name)
-    name = name.strip(" .-").upper()
+    # The cue pattern only admits upper-case ASCII, so no .upper() is needed
+    name = name.strip(" .-")
     if name in _NAME_BLACKLIST: return ""
     if len(name.split()) > 5: return ""
     return name
 
+def _classify_stripped(s: str) -> Tuple[int, Optional[str]]:
+    """Return (kind, cleaned cue name or None) for one already-stripped line."""
+    if not s: return KIND_BLANK, None
+    m = _CLASSIFY_RE.match(s)
+    if m is None: return KIND_BODY, None
+    name = m.group('name')
+    if name is None: return KIND_SCENE, None
+    candidate = _clean_name(name)
+    if not candidate or not _is_mostly_caps(candidate): return KIND_BODY, None
+    return KIND_NAME, candidate
+
+def _classify_line(line: str) -> Tuple[int, Optional[str]]:
+    return _classify_stripped(line.strip())
+
+def _classify_lines(stripped: List[str]) -> Tuple[bytearray, List[Optional[str]]]:
+    """Classify every (stripped) line once; later passes index into the results."""
+    kinds = bytearray(len(stripped))
+    names: List[Optional[str]] = [None] * len(stripped)
+    for idx, s in enumerate(stripped):
+        kinds[idx], names[idx] = _classify_stripped(s)
+    return kinds, names
+
+def _is_scene_or_transition(line: str) -> bool:
+    return _classify_line(line)[0] == KIND_SCENE
+
 def _looks_like_name_line(line: str) -> Optional[str]:
-    s = line.strip()
-    if not s or _is_scene_or_transition(s): return None
-    m = _NAME_LINE_RE.match(s)
-    if not m: return None
-    candidate = _clean_name(m.group('name'))
-    if not candidate or not _is_mostly_caps(candidate): return None
-    return candidate
+    return _classify_line(line)[1]
 
 def _strip_parentheticals(text: str):
     parenths = _PAREN_RE.findall(text)
@@ -67,54 +138,76 @@ def _strip_parentheticals(text: str):
     stripped = '\n'.join(l.strip() for l in stripped.splitlines())
     return stripped.strip(), [p.strip() for p in parenths if p.strip()]
 
-def _merge_soft_wraps(lines: List[str]) -> List[str]:
+def _glue(pieces: List[str]) -> str:
+    """Join soft-wrapped pieces with spaces; a trailing hyphen joins without one."""
+    # Collect parts and join once; repeated str concatenation is quadratic on long runs
+    parts = [pieces[0]]
+    for nxt in pieces[1:]:
+        # parts[-1] is always a non-empty piece, so this matches checking the whole buffer
+        if parts[-1].endswith('-'):
+            parts[-1] = parts[-1][:-1]
+        else:
+            parts.append(' ')
+        parts.append(nxt)
+    return ''.join(parts)
+
+def _merge_soft_wraps(lines: List[str], stripped: List[str], kinds: bytearray, names: List[Optional[str]]
+                      ) -> Tuple[List[str], List[str], bytearray, List[Optional[str]]]:
+    """
+    Join soft-wrapped body lines; returns the merged lines (right-stripped), their
+    stripped forms, kinds and names.
+    """
     merged: List[str] = []
+    merged_stripped: List[str] = []
+    merged_kinds = bytearray()
+    merged_names: List[Optional[str]] = []
+    n = len(lines)
     i = 0
-    while i < len(lines):
+    while i < n:
+        kind = kinds[i]
         cur = lines[i].rstrip()
-        if not cur:
-            merged.append(cur); i += 1; continue
-        if (not _looks_like_name_line(cur)) and (not _is_scene_or_transition(cur)):
-            buff = cur; j = i + 1
-            while j < len(lines):
-                nxt = lines[j].strip()
-                if not nxt: break
-                if _looks_like_name_line(nxt) or _is_scene_or_transition(nxt): break
-                buff = (buff[:-1] + nxt) if buff.endswith('-') else (buff + ' ' + nxt)
-                j += 1
-            merged.append(buff); i = j if j > i + 1 else i + 1
+        if kind == KIND_BODY:
+            # Find the end of the body run first, then join it in one go
+            j = i + 1
+            while j < n and kinds[j] == KIND_BODY: j += 1
+            if j > i + 1:
+                buff = _glue([cur] + stripped[i + 1:j])
+                # Continuations are stripped, so only the first line's indent remains
+                buff_stripped = buff.lstrip()
+                # The joined text can classify differently from its first line
+                kind, name = _classify_stripped(buff_stripped)
+            else:
+                buff, buff_stripped, name = cur, stripped[i], None
+            merged.append(buff); merged_stripped.append(buff_stripped)
+            merged_kinds.append(kind); merged_names.append(name)
+            i = j
         else:
-            merged.append(cur); i += 1
-    return merged
+            merged.append(cur); merged_stripped.append(stripped[i])
+            merged_kinds.append(kind); merged_names.append(names[i]); i += 1
+    return merged, merged_stripped, merged_kinds, merged_names
 
-def parse_script_text(full_text: str, use_spacy_person_boost: bool = True, spacy_model: str = "en_core_web_sm") -> ScriptParse:
+def parse_script_text(full_text: str, use_spacy_person_boost: bool = False, spacy_model: str = DEFAULT_SPACY_MODEL) -> ScriptParse:
+    """
+    Parse screenplay text into dialogue blocks.
+    Aliases come from spaCy NER: eagerly with use_spacy_person_boost, otherwise on the
+    first blocks_for_character miss.
+    """
     raw_lines = full_text.splitlines()
-    lines = _merge_soft_wraps(raw_lines)
-
-    nlp = None
-    if use_spacy_person_boost and _HAVE_SPACY:
-        try:
-            nlp = spacy.load(spacy_model, disable=["tagger","lemmatizer","textcat"])
-        except Exception:
-            nlp = None
-
-    name_at_idx: Dict[int, str] = {}
-    for idx, line in enumerate(lines):
-        cand = _looks_like_name_line(line)
-        if cand: name_at_idx[idx] = cand
+    # Strip each line once; classification and the narrator pass reuse these
+    raw_stripped = [l.strip() for l in raw_lines]
+    lines, stripped, kinds, names = _merge_soft_wraps(raw_lines, raw_stripped, *_classify_lines(raw_stripped))
 
     blocks: List[DialogueBlock] = []
     i = 0
     while i < len(lines):
-        if i in name_at_idx:
-            speaker = name_at_idx[i]
+        speaker = names[i]
+        if speaker is not None:
             start = i + 1
             j = start
             collected: List[str] = []
             while j < len(lines):
-                ln = lines[j]
-                if not ln.strip() or j in name_at_idx or _is_scene_or_transition(ln): break
-                collected.append(ln); j += 1
+                if kinds[j] != KIND_BODY: break
+                collected.append(lines[j]); j += 1
             raw_dialogue = "\n".join(collected).strip()
             cleaned, parenths = _strip_parentheticals(raw_dialogue)
             block = DialogueBlock(
@@ -129,20 +222,16 @@ def parse_script_text(full_text: str, use_spacy_person_boost: bool = True, spacy
             i = j
         else:
             # Collect non-dialogue text (scene descriptions, transitions, etc.) as narrator blocks
-            ln = lines[i]
-            if ln.strip():
+            if kinds[i] != KIND_BLANK:
                 # Collect consecutive non-dialogue lines (including scene headings and transitions)
                 narrator_lines: List[str] = []
                 j = i
                 while j < len(lines):
-                    current_line = lines[j]
-                    if not current_line.strip():
-                        break
-                    # Stop if we hit a character name line
-                    if j in name_at_idx:
+                    # Stop at a blank line or a character name line
+                    if kinds[j] == KIND_BLANK or kinds[j] == KIND_NAME:
                         break
                     # Include scene headings and transitions as narrator text
-                    narrator_lines.append(current_line.strip())
+                    narrator_lines.append(stripped[j])
                     j += 1
                 
                 if narrator_lines:
@@ -162,41 +251,84 @@ def parse_script_text(full_text: str, use_spacy_person_boost: bool = True, spacy
             else:
                 i += 1
 
-    freq: Dict[str, int] = {}
-    for b in blocks: freq[b.speaker] = freq.get(b.speaker, 0) + 1
-    # Ensure NARRATOR is in characters dict if there are narrator blocks
-    if "NARRATOR" not in freq and any(b.speaker == "NARRATOR" for b in blocks):
-        freq["NARRATOR"] = sum(1 for b in blocks if b.speaker == "NARRATOR")
+    # Counter keeps first-appearance order; NARRATOR is counted like any speaker.
+    # Stored as a plain dict so unknown names still raise KeyError
+    freq: Dict[str, int] = dict(Counter(b.speaker for b in blocks))
     aliases: Dict[str, List[str]] = {k: [k] for k in freq.keys()}
 
-    if nlp is not None and blocks:
-        seen_tokens: Dict[str, str] = {}
-        for name in list(freq.keys()):
-            for tok in name.split():
-                if len(tok) > 1 and tok.isupper():
-                    seen_tokens[tok] = name
-        doc = nlp(full_text[:500000])
+    by_speaker: Dict[str, List[DialogueBlock]] = {}
+    for b in blocks: by_speaker.setdefault(b.speaker, []).append(b)
+
+    parse = ScriptParse(characters=freq, blocks=blocks, character_aliases=aliases, lines=lines,
+                        blocks_by_speaker=by_speaker)
+    if use_spacy_person_boost:
+        resolve_aliases(parse, spacy_model)
+    return parse
+
+# Upper bound on text fed to NER, matching the old full_text[:500000] cap
+_MAX_NER_CHARS = 500000
+
+def resolve_aliases(parse: ScriptParse, spacy_model: str = DEFAULT_SPACY_MODEL) -> None:
+    """Add PERSON entities that share a word with a known speaker to character_aliases."""
+    if not parse.needs_alias_resolution():
+        return
+    parse.aliases_resolved = True
+    if not _HAVE_SPACY:
+        return
+    seen_tokens: Dict[str, str] = {}
+    for name in list(parse.characters.keys()):
+        for tok in name.split():
+            if len(tok) > 1 and tok.isupper():
+                seen_tokens[tok] = name
+    if not seen_tokens:
+        return
+    # An entity only counts if one of its words is a speaker token, so only
+    # paragraphs mentioning such a word need NER
+    candidates: List[str] = []
+    budget = _MAX_NER_CHARS
+    for line in parse.lines:
+        if budget <= 0: break
+        if any(w in seen_tokens for w in re.findall(r"[^\W\d_]+", line.upper())):
+            candidates.append(line[:budget]); budget -= len(line)
+    if not candidates:
+        return
+    nlp = _load_spacy(spacy_model)
+    if nlp is None:
+        return
+    aliases = parse.character_aliases
+    for doc in nlp.pipe(candidates, batch_size=32):
         for ent in doc.ents:
             if ent.label_ == "PERSON":
                 up = ent.text.upper()
                 for p in [p for p in re.split(r'\s+', up) if p.isalpha()]:
                     if p in seen_tokens:
                         canon = seen_tokens[p]
-                        if up not in aliases[canon]:
-                            aliases[canon].append(up)
-
-    return ScriptParse(characters=freq, blocks=blocks, character_aliases=aliases, lines=lines)
+                        known = aliases.setdefault(canon, [canon])
+                        if up not in known:
+                            known.append(up)
 
 def list_characters(parse: ScriptParse, sort_by_freq: bool = True) -> List[str]:
     chars = list(parse.characters.keys())
     chars.sort(key=lambda c: parse.characters[c], reverse=True) if sort_by_freq else chars.sort()
     return chars
 
+def _speaker_blocks(parse: ScriptParse, speaker: str) -> List[DialogueBlock]:
+    if not parse.blocks_by_speaker and parse.blocks:
+        # Built without the index (e.g. constructed by hand)
+        return [b for b in parse.blocks if b.speaker == speaker]
+    return list(parse.blocks_by_speaker.get(speaker, ()))
+
 def blocks_for_character(parse: ScriptParse, character: str) -> List[DialogueBlock]:
     canon = character.upper().strip()
     if canon in parse.characters:
-        return [b for b in parse.blocks if b.speaker == canon]
+        return _speaker_blocks(parse, canon)
     for k, alist in parse.character_aliases.items():
         if canon == k or canon in alist:
-            return [b for b in parse.blocks if b.speaker == k]
-    return [b for b in parse.blocks if canon in b.speaker]
\ No newline at end of file
+            return _speaker_blocks(parse, k)
+    if parse.needs_alias_resolution():
+        # First miss: run NER once, then retry the alias lookup
+        resolve_aliases(parse)
+        for k, alist in parse.character_aliases.items():
+            if canon in alist:
+                return _speaker_blocks(parse, k)
+    return [b for b in parse.blocks if canon in b.speaker]
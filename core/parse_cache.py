@@ -0,0 +1,68 @@
+# core/parse_cache.py
+"""
+On-disk cache of extracted + parsed scripts, so reopening an unchanged PDF
+skips text extraction and parsing.
+"""
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Optional, Tuple
+
+from core.nlp_processor import ScriptParse
+
+# Bump whenever extraction or ScriptParse output changes shape or content
+PARSE_CACHE_VERSION = 1
+PARSE_CACHE_FILENAME = "parse.cache"
+
+_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def file_sha1(path: str) -> str:
+    """SHA-1 of a file, read in 1 MiB chunks."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _header(pdf_sha1: str, extract_key: str) -> dict:
+    return {"version": PARSE_CACHE_VERSION, "sha1": pdf_sha1, "extract": extract_key}
+
+
+def load_parse_cache(cache_path: Path, pdf_sha1: str, extract_key: str = "") -> Optional[Tuple[ScriptParse, str]]:
+    """
+    Return (parse, full_text) if the cache matches this PDF hash, extraction
+    settings and cache version; otherwise None.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            # The header is pickled separately so a stale cache is rejected without
+            # unpickling the (much larger) payload
+            if pickle.load(f) != _header(pdf_sha1, extract_key):
+                return None
+            parse, full_text = pickle.load(f)
+    except Exception:
+        # Missing, truncated or from an incompatible build: treat as a miss
+        return None
+    if not isinstance(parse, ScriptParse):
+        return None
+    return parse, full_text
+
+
+def save_parse_cache(cache_path: Path, pdf_sha1: str, parse: ScriptParse, full_text: str,
+                     extract_key: str = "") -> None:
+    """Write the cache atomically (temp file + rename); failures are ignored."""
+    tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(_header(pdf_sha1, extract_key), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump((parse, full_text), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
@@ -3,22 +3,31 @@
 PDF editor component with annotation and editing capabilities.
 """
 from __future__ import annotations
+import functools
 import io
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple, Union
 from dataclasses import dataclass
 
-try:
-    import fitz  # PyMuPDF
-    _HAVE_PYMUPDF = True
-except Exception:
-    _HAVE_PYMUPDF = False
+if TYPE_CHECKING:
+    import fitz
 
 
 class PDFEditorError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _fitz():
+    """Import PyMuPDF on first use so app startup doesn't pay for it."""
+    try:
+        import fitz  # PyMuPDF
+    except Exception as e:
+        raise PDFEditorError("PyMuPDF is required for PDF editing") from e
+    return fitz
+
+
 @dataclass
 class Annotation:
     """Represents a PDF annotation."""
@@ -31,6 +40,9 @@ class Annotation:
     created_at: float = 0.0
 
 
+_TEXT_CACHE_SIZE = 256
+
+
 class PDFEditor:
     """
     PDF editor with annotation capabilities.
@@ -38,30 +50,42 @@ class PDFEditor:
     """
     
     def __init__(self, pdf_path: Union[str, Path]):
-        if not _HAVE_PYMUPDF:
-            raise PDFEditorError("PyMuPDF is required for PDF editing")
+        _fitz()  # fail early if PyMuPDF is missing
         
         self.pdf_path = Path(pdf_path).expanduser().resolve()
         if not self.pdf_path.exists():
             raise PDFEditorError(f"PDF not found: {self.pdf_path}")
         
-        self._doc: Optional[fitz.Document] = None
+        self._doc: Optional["fitz.Document"] = None
         self._annotations: List[Annotation] = []
+        self._page_cache: Dict[int, "fitz.Page"] = {}
+        # (page, rect rounded to whole points) -> extracted text, LRU order
+        self._text_cache: "OrderedDict[Tuple[int, Tuple[int, int, int, int]], str]" = OrderedDict()
         self._load()
     
     def _load(self) -> None:
         """Load PDF document."""
         try:
-            self._doc = fitz.open(str(self.pdf_path))
+            self._doc = _fitz().open(str(self.pdf_path))
         except Exception as e:
             raise PDFEditorError(f"Failed to open PDF: {e}")
     
     def close(self) -> None:
         """Close the PDF document."""
+        self._page_cache.clear()
+        self._text_cache.clear()
         if self._doc:
             self._doc.close()
             self._doc = None
     
+    def _page(self, page_num: int) -> "fitz.Page":
+        """Return the (cached) page object for page_num."""
+        page_obj = self._page_cache.get(page_num)
+        if page_obj is None:
+            page_obj = self._doc[page_num]
+            self._page_cache[page_num] = page_obj
+        return page_obj
+    
     def num_pages(self) -> int:
         """Get number of pages."""
         if not self._doc:
@@ -77,10 +101,22 @@ class PDFEditor:
             return None
         
         page = self._doc[page_num]
-        mat = fitz.Matrix(zoom, zoom)
+        mat = _fitz().Matrix(zoom, zoom)
         pix = page.get_pixmap(matrix=mat)
         return pix.tobytes("png")
     
+    def get_page_rgb(self, page_num: int, zoom: float = 1.0) -> Optional[Tuple[int, int, bytes]]:
+        """
+        Get page as raw RGB888 pixels: (width, height, data).
+        Skips PNG encoding; suitable for QImage(data, w, h, w * 3, Format_RGB888).
+        """
+        if not self._doc or page_num < 0 or page_num >= self._doc.page_count:
+            return None
+        
+        mat = _fitz().Matrix(zoom, zoom)
+        pix = self._page(page_num).get_pixmap(matrix=mat, alpha=False)
+        return pix.width, pix.height, bytes(pix.samples)
+    
     def add_highlight(
         self,
         page: int,
@@ -103,7 +139,8 @@ class PDFEditor:
         )
         
         # Add annotation to PDF
-        page_obj = self._doc[page]
+        self._text_cache.clear()
+        page_obj = self._page(page)
         highlight = page_obj.add_highlight_annot(rect)
         highlight.set_colors(stroke=color)
         highlight.set_info(content=content, title="Highlight")
@@ -137,7 +174,8 @@ class PDFEditor:
         )
         
         # Add annotation to PDF
-        page_obj = self._doc[page]
+        self._text_cache.clear()
+        page_obj = self._page(page)
         note = page_obj.add_text_annot(point, content)
         note.set_colors(stroke=color)
         note.update()
@@ -166,7 +204,8 @@ class PDFEditor:
         )
         
         # Add text to PDF page
-        page_obj = self._doc[page]
+        self._text_cache.clear()
+        page_obj = self._page(page)
         page_obj.insert_text(
             (rect[0], rect[1]),
             text,
@@ -194,8 +233,9 @@ class PDFEditor:
         if not self._doc:
             return
         
+        self._text_cache.clear()
         output = Path(output_path) if output_path else self.pdf_path
-        self._doc.save(str(output), incremental=False, encryption=fitz.PDF_ENCRYPT_KEEP)
+        self._doc.save(str(output), incremental=False, encryption=_fitz().PDF_ENCRYPT_KEEP)
     
     def save_copy(self, output_path: Union[str, Path]) -> None:
         """Save a copy of the PDF with annotations."""
@@ -210,7 +250,16 @@ class PDFEditor:
         if not self._doc or page < 0 or page >= self._doc.page_count:
             return ""
         
-        page_obj = self._doc[page]
-        text = page_obj.get_text("text", clip=rect)
-        return text.strip()
+        # Exact coordinates: rects a fraction of a point apart can clip different glyphs
+        key = (page, tuple(float(v) for v in rect))
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+            return cached
+        
+        text = self._page(page).get_text("text", clip=rect).strip()
+        self._text_cache[key] = text
+        if len(self._text_cache) > _TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return text
 
@@ -1,9 +1,16 @@
 # core/pdf_parser.py
 from __future__ import annotations
+import functools
+import importlib.util
 import io
 import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Tuple
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Iterator, Tuple, Callable
+
+if TYPE_CHECKING:
+    import easyocr
 
 # Optional deps: we import lazily where possible
 try:
@@ -18,32 +25,190 @@ try:
 except Exception:
     _HAVE_PYPDF = False
 
-try:
-    import easyocr
-    from PIL import Image
-    import numpy as np
-    _HAVE_EASYOCR = True
-except Exception:
-    _HAVE_EASYOCR = False
+# EasyOCR pulls in PyTorch, so it (and numpy) are only imported when a page is
+# actually OCR'd. Parallel-extraction workers re-import this module in every
+# spawned process; those that never OCR never pay for PyTorch.
+_HAVE_EASYOCR = (importlib.util.find_spec("easyocr") is not None
+                 and importlib.util.find_spec("numpy") is not None)
 
-# Global EasyOCR reader instance (lazy initialization)
-_ocr_reader_instance: Optional[easyocr.Reader] = None
 
-def _get_ocr_reader(lang: str = "en") -> easyocr.Reader:
-    """Get or create EasyOCR reader instance for PDF OCR."""
-    global _ocr_reader_instance
-    if _ocr_reader_instance is None:
+@functools.lru_cache(maxsize=1)
+def _easyocr():
+    """Import and return the easyocr module, or None if it can't be loaded."""
+    try:
+        import easyocr
+    except Exception:
+        return None
+    return easyocr
+
+
+# EasyOCR readers per language (lazy initialization). Loading a reader reads the
+# detection and recognition models from disk, so each is built once per process
+_ocr_readers: Dict[str, "easyocr.Reader"] = {}
+_ocr_reader_lock = threading.Lock()
+
+def _get_ocr_reader(lang: str = "en") -> Optional["easyocr.Reader"]:
+    """Get or create the EasyOCR reader for a language."""
+    reader = _ocr_readers.get(lang)
+    if reader is None:
         if not _HAVE_EASYOCR:
             return None
-        # Initialize reader (this downloads models on first use)
-        _ocr_reader_instance = easyocr.Reader([lang], gpu=False)
-    return _ocr_reader_instance
+        # OCR helper threads may ask at the same time; load the models only once
+        with _ocr_reader_lock:
+            reader = _ocr_readers.get(lang)
+            if reader is None:
+                easyocr = _easyocr()
+                if easyocr is None:
+                    return None
+                # Initialize reader (this downloads models on first use)
+                reader = _ocr_readers[lang] = easyocr.Reader([lang], gpu=False)
+    return reader
 
 
 class PDFParserError(Exception):
     """Generic PDF parsing error."""
 
 
+def _ocr_concurrency() -> int:
+    """
+    Pages recognised at once (env OCR_CONCURRENCY, default 1). Even at 1, recognition
+    runs on a helper thread while the next pages are extracted and rendered.
+    """
+    try:
+        return max(1, int(os.environ.get("OCR_CONCURRENCY", "1")))
+    except ValueError:
+        return 1
+
+
+# Render resolution for OCR; recognition quality levels off around 200-300 DPI while
+# pixel count (and render/recognition cost) grows with its square
+OCR_DPI = 200
+
+
+def _render_for_ocr(page, dpi: int = OCR_DPI):
+    """
+    Render a PyMuPDF page to the image array EasyOCR reads; None on failure or when
+    the page has no images (a page without text or images is blank, nothing to OCR).
+    """
+    try:
+        if not page.get_images(full=False):
+            return None
+        # EasyOCR converts to grayscale anyway; rendering 8-bit gray without
+        # alpha produces a third of the RGB bytes
+        pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+        import numpy as np
+        # View the pixel bytes as an array directly; no PIL image or second copy
+        return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width)
+    except Exception:
+        return None
+
+
+def _group_ocr_lines(results, dpi: int = OCR_DPI) -> str:
+    """Join EasyOCR (bbox, text, confidence) results into lines, top to bottom."""
+    if not results:
+        return ""
+    # Sort by vertical position (top to bottom) to maintain reading order
+    sorted_results = sorted(results, key=lambda x: x[0][0][1])  # Sort by top-left Y coordinate
+
+    # Group by approximate line (similar Y coordinates)
+    lines = []
+    current_line = []
+    current_y = None
+    # Pixels - lines within this distance are considered same line (20 px at 300 DPI)
+    y_threshold = 20 * dpi / 300
+
+    for bbox, text, confidence in sorted_results:
+        top_y = bbox[0][1]  # Top-left Y coordinate
+
+        if current_y is None or abs(top_y - current_y) > y_threshold:
+            # New line
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [text]
+            current_y = top_y
+        else:
+            # Same line
+            current_line.append(text)
+
+    # Add last line
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    return "\n".join(lines)
+
+
+def _ocr_image(img_array, lang: str = "en", dpi: int = OCR_DPI) -> str:
+    """
+    Recognise a rendered page. Thread-safe enough to call from OCR helper threads:
+    the page has already been rendered, so no PyMuPDF object is touched here.
+    """
+    try:
+        # Get EasyOCR reader
+        reader = _get_ocr_reader(lang)
+        if reader is None:
+            return ""
+        return _group_ocr_lines(reader.readtext(img_array), dpi)
+    except Exception:
+        return ""
+
+
+# Same-sized pages recognised per batched EasyOCR call; smaller groups go page by page
+OCR_BATCH_PAGES = 8
+
+
+def _ocr_images(images: List[Any], lang: str = "en", dpi: int = OCR_DPI) -> List[str]:
+    """
+    Recognise several rendered pages. Full batches of same-sized pages go through one
+    readtext_batched call (detector/recognizer batches span pages); otherwise, or if
+    batching fails, pages are recognised one at a time.
+    """
+    if len(images) >= OCR_BATCH_PAGES:
+        try:
+            reader = _get_ocr_reader(lang)
+            if reader is None:
+                return [""] * len(images)
+            return [_group_ocr_lines(r, dpi) for r in reader.readtext_batched(images)]
+        except Exception:
+            pass
+    return [_ocr_image(img, lang, dpi) for img in images]
+
+
+# Engines accepted by PDFParser(backend=...); None picks the best one installed
+PDF_BACKENDS = ("pymupdf", "pypdf")
+# Text modes: "text" is PyMuPDF's reading order, "blocks" re-sorts text blocks by position
+TEXT_MODES = ("text", "blocks")
+
+# Below this many pages, process-pool startup costs more than it saves. Measured:
+# PyMuPDF text extraction takes ~2-3 ms per page, a spawned worker ~0.4 s to
+# start and import PyMuPDF. Workers are always spawned: forking copies whatever
+# the parent's other threads hold (Qt, a loaded OCR model) into the child
+PARALLEL_MIN_PAGES = 250
+# Default worker cap; text extraction is memory-bound well before it runs out of cores
+PARALLEL_MAX_WORKERS = 4
+# Pages per worker task, so progress moves in steps smaller than a worker's share
+PARALLEL_SHARD_PAGES = 50
+
+
+def _extract_shard(pdf_path: str, backend: Optional[str], text_mode: str, start: int, stop: int,
+                   preserve_layout: bool) -> List[str]:
+    """Worker-process entry point: text-layer texts of pages [start, stop), never OCR'd."""
+    parser = PDFParser(pdf_path, backend=backend, text_mode=text_mode)
+    try:
+        return [parser._page_text(i, preserve_layout, False, "")
+                for i in range(start, stop)]
+    finally:
+        parser.close()
+
+
+def _blocks_text(page) -> str:
+    """Page text rebuilt from PyMuPDF text blocks sorted top-to-bottom, then left-to-right."""
+    # Block tuples: (x0, y0, x1, y1, text, block_no, block_type); type 1 is an image
+    blocks = [b for b in page.get_text("blocks") if b[6] == 0]
+    blocks.sort(key=lambda b: (round(b[1]), b[0]))
+    # Single newlines: a blank line between a cue and its dialogue would split the speech
+    return "\n".join(b[4].rstrip("\n") for b in blocks)
+
+
 @dataclass
 class PDFMetadata:
     title: Optional[str]
@@ -68,23 +233,43 @@ class PDFParser:
     Unified PDF parser with:
       - Preferred engine: PyMuPDF (layout-aware, fast)
       - Fallback engine: pypdf
+      - backend="pymupdf" / "pypdf" forces one engine instead of falling back
+      - text_mode="blocks" rebuilds each page from position-sorted text blocks (PyMuPDF only)
       - Optional OCR per page if text extraction is empty and Tesseract is present
     """
 
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, backend: Optional[str] = None, text_mode: str = "text"):
         if not os.path.isfile(pdf_path):
             raise PDFParserError(f"PDF not found: {pdf_path}")
+        if backend is not None and backend not in PDF_BACKENDS:
+            raise PDFParserError(f"Unknown PDF backend: {backend}")
+        if text_mode not in TEXT_MODES:
+            raise PDFParserError(f"Unknown text mode: {text_mode}")
         self.pdf_path = pdf_path
+        self.text_mode = text_mode
+        self._backend = backend
         self._doc_pymupdf = None
         self._doc_pypdf = None
+        self._ocr_doc = None  # PyMuPDF handle used only to render pages for OCR on the pypdf path
+        # (preserve_layout, ocr_if_empty, ocr_lang) -> extracted pages
+        self._pages_cache: Dict[Tuple[bool, bool, str], List[PageText]] = {}
+        # An open document doesn't change, so these are read once
+        self._metadata: Optional[PDFMetadata] = None
+        self._num_pages: Optional[int] = None
 
+        if backend == "pymupdf" and not _HAVE_PYMUPDF:
+            raise PDFParserError("PyMuPDF is not installed. Install 'pymupdf'.")
+        if backend == "pypdf" and not _HAVE_PYPDF:
+            raise PDFParserError("pypdf is not installed. Install 'pypdf'.")
         if not (_HAVE_PYMUPDF or _HAVE_PYPDF):
             raise PDFParserError("No PDF backend available. Install 'pymupdf' or 'pypdf'.")
 
-        if _HAVE_PYMUPDF:
+        if _HAVE_PYMUPDF and backend != "pypdf":
             try:
                 self._doc_pymupdf = fitz.open(self.pdf_path)
             except Exception as e:
+                if backend == "pymupdf":
+                    raise PDFParserError(f"Failed to open PDF with PyMuPDF: {e}")
                 # If PyMuPDF fails, we’ll fall back to pypdf later
                 self._doc_pymupdf = None
 
@@ -94,9 +279,19 @@ class PDFParser:
             except Exception as e:
                 raise PDFParserError(f"Failed to open PDF with both engines: {e}")
 
+    @property
+    def backend(self) -> str:
+        """Name of the engine actually in use."""
+        return "pymupdf" if self._doc_pymupdf is not None else "pypdf"
+
     # ---------- Metadata ----------
     def get_metadata(self) -> PDFMetadata:
-        size = os.path.getsize(self.pdf_path)
+        if self._metadata is None:
+            self._metadata = self._read_metadata()
+        return self._metadata
+
+    def _read_metadata(self) -> PDFMetadata:
+        size = os.stat(self.pdf_path).st_size
 
         if self._doc_pymupdf is not None:
             md = self._doc_pymupdf.metadata or {}
@@ -108,7 +303,7 @@ class PDFParser:
                 producer=md.get("producer"),
                 creation_date=md.get("creationDate") or md.get("creation_date"),
                 mod_date=md.get("modDate") or md.get("mod_date"),
-                num_pages=self._doc_pymupdf.page_count,
+                num_pages=self.num_pages(),
                 file_size_bytes=size,
             )
 
@@ -122,15 +317,18 @@ class PDFParser:
             producer=str(info.producer) if info.producer else None,
             creation_date=str(info.creation_date) if getattr(info, "creation_date", None) else None,
             mod_date=str(info.modification_date) if getattr(info, "modification_date", None) else None,
-            num_pages=len(self._doc_pypdf.pages),
+            num_pages=self.num_pages(),
             file_size_bytes=size,
         )
 
     # ---------- Page count ----------
     def num_pages(self) -> int:
-        if self._doc_pymupdf is not None:
-            return self._doc_pymupdf.page_count
-        return len(self._doc_pypdf.pages)
+        if self._num_pages is None:
+            if self._doc_pymupdf is not None:
+                self._num_pages = self._doc_pymupdf.page_count
+            else:
+                self._num_pages = len(self._doc_pypdf.pages)
+        return self._num_pages
 
     # ---------- Text extraction (full) ----------
     def extract_text(
@@ -138,18 +336,21 @@ class PDFParser:
         preserve_layout: bool = True,
         ocr_if_empty: bool = True,
         ocr_lang: str = "en",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> str:
         """
         Extract full-document text. Attempts layout-preserving modes when available.
         OCR kicks in per-page if no text is found and Tesseract is installed.
+        progress_callback(pages_done, total_pages) is called after each page.
         """
-        pages = self.extract_pages(
-            preserve_layout=preserve_layout,
-            ocr_if_empty=ocr_if_empty,
-            ocr_lang=ocr_lang,
-        )
-        # Join with double line breaks to clearly separate page boundaries
-        return "\n\n".join(p.text for p in pages)
+        # Stream pages into one buffer rather than holding a page list plus the joined copy
+        buf = io.StringIO()
+        for p in self.iter_pages(preserve_layout, ocr_if_empty, ocr_lang, progress_callback):
+            if p.page_index:
+                # Join with double line breaks to clearly separate page boundaries
+                buf.write("\n\n")
+            buf.write(p.text)
+        return buf.getvalue()
 
     # ---------- Text extraction (per page) ----------
     def extract_pages(
@@ -157,110 +358,298 @@ class PDFParser:
         preserve_layout: bool = True,
         ocr_if_empty: bool = True,
         ocr_lang: str = "en",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_workers: int = 1,
     ) -> List[PageText]:
-        results: List[PageText] = []
+        """
+        Per-page text. max_workers > 1 extracts page ranges in worker processes
+        (see _parallel_page_texts); the default stays in-process.
+        Results are cached per option set for the life of the parser.
+        """
+        pages = list(self.iter_pages(preserve_layout, ocr_if_empty, ocr_lang,
+                                     progress_callback, max_workers))
+        self._pages_cache.setdefault((preserve_layout, ocr_if_empty, ocr_lang), pages)
+        return list(pages)
+
+    def iter_pages(
+        self,
+        preserve_layout: bool = True,
+        ocr_if_empty: bool = True,
+        ocr_lang: str = "en",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_workers: int = 1,
+    ) -> Iterator[PageText]:
+        """
+        Yield pages in order as soon as each is final. Unlike extract_pages nothing is
+        kept afterwards, though an existing cached result is reused.
+        """
+        cached = self._pages_cache.get((preserve_layout, ocr_if_empty, ocr_lang))
+        if cached is not None:
+            if progress_callback:
+                progress_callback(len(cached), len(cached))
+            yield from cached
+            return
+        if max_workers > 1:
+            texts = self._parallel_page_texts(max_workers, preserve_layout, ocr_if_empty, ocr_lang,
+                                              progress_callback)
+            if texts is not None:
+                for i, t in enumerate(texts):
+                    yield PageText(page_index=i, text=t)
+                return
+        yield from self._iter_pages_serial(preserve_layout, ocr_if_empty, ocr_lang, progress_callback)
 
+    def _iter_pages_serial(
+        self,
+        preserve_layout: bool,
+        ocr_if_empty: bool,
+        ocr_lang: str,
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> Iterator[PageText]:
+        total = self.num_pages()
+        # Finished pages not yet yielded; OCR can finish them out of order
+        texts: Dict[int, str] = {}
+        next_page = 0
+        done = 0
+        ocr_pool = None
+        ocr_jobs: Dict[Any, List[int]] = {}  # future -> page indices it recognises
+        batch: List[Tuple[int, Any]] = []  # rendered pages waiting for OCR
+
+        def collect(futures) -> None:
+            nonlocal done
+            for future in futures:
+                for i, text in zip(ocr_jobs.pop(future), future.result()):
+                    texts[i] = text
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total)
+
+        def submit(items: List[Tuple[int, Any]]) -> None:
+            nonlocal ocr_pool
+            if ocr_pool is None:
+                ocr_pool = ThreadPoolExecutor(max_workers=_ocr_concurrency(),
+                                              thread_name_prefix="pdf-ocr")
+            # Bound in-flight work so rendered images don't pile up in memory
+            while len(ocr_jobs) > _ocr_concurrency():
+                finished, _ = wait(ocr_jobs, return_when=FIRST_COMPLETED)
+                collect(finished)
+            future = ocr_pool.submit(_ocr_images, [img for _, img in items], ocr_lang)
+            ocr_jobs[future] = [i for i, _ in items]
+
+        try:
+            for i in range(total):
+                text = self._page_text(i, preserve_layout, False, ocr_lang)
+                if ocr_if_empty and not text.strip():
+                    img_array = self._render_page_for_ocr(i)
+                    if img_array is not None:
+                        # Rendering stays on this thread (PyMuPDF objects aren't thread-safe);
+                        # recognition overlaps with extracting the following pages.
+                        # Batches need same-sized pages, so a size change closes the batch
+                        if batch and batch[-1][1].shape != img_array.shape:
+                            submit(batch)
+                            batch = []
+                        batch.append((i, img_array))
+                        if len(batch) >= OCR_BATCH_PAGES:
+                            submit(batch)
+                            batch = []
+                        continue
+                    # OCR unavailable for this page: an empty page reads as empty
+                    text = ""
+                texts[i] = text
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+                while next_page in texts:
+                    yield PageText(page_index=next_page, text=texts.pop(next_page))
+                    next_page += 1
+            if batch:
+                submit(batch)
+            collect(list(ocr_jobs))
+            while next_page in texts:
+                yield PageText(page_index=next_page, text=texts.pop(next_page))
+                next_page += 1
+        finally:
+            if ocr_pool is not None:
+                ocr_pool.shutdown(wait=True)
+
+    def _page_text(self, i: int, preserve_layout: bool, ocr_if_empty: bool, ocr_lang: str) -> str:
+        """Text of one page with the active engine, OCR'ing it if empty and requested."""
         if self._doc_pymupdf is not None:
-            for i in range(self._doc_pymupdf.page_count):
-                page = self._doc_pymupdf.load_page(i)
-                # PyMuPDF text options: "text", "blocks", "xml", "html"
-                # "text" preserves line breaks reasonably; "blocks" allows custom reflow.
+            page = self._doc_pymupdf.load_page(i)
+            # PyMuPDF text options: "text", "blocks", "xml", "html"
+            # "text" preserves line breaks reasonably; "blocks" allows custom reflow.
+            if self.text_mode == "blocks":
+                text = _blocks_text(page)
+            else:
                 text = page.get_text("text") if preserve_layout else page.get_text()
-                if not text.strip() and ocr_if_empty:
-                    text = self._ocr_page_pymupdf(page, lang=ocr_lang)
-                results.append(PageText(page_index=i, text=text))
-            return results
+            if not text.strip() and ocr_if_empty:
+                text = self._ocr_page_pymupdf(page, lang=ocr_lang)
+            return text
 
         # pypdf fallback
-        for i, page in enumerate(self._doc_pypdf.pages):
-            try:
-                # pypdf has limited layout control; we still return line breaks where possible
-                text = page.extract_text() or ""
-            except Exception:
-                text = ""
-            if not text.strip() and ocr_if_empty:
-                text = self._ocr_page_pypdf(i, lang=ocr_lang)
-            results.append(PageText(page_index=i, text=text))
-        return results
+        try:
+            # pypdf has limited layout control; we still return line breaks where possible
+            text = self._doc_pypdf.pages[i].extract_text() or ""
+        except Exception:
+            text = ""
+        if not text.strip() and ocr_if_empty:
+            text = self._ocr_page_pypdf(i, lang=ocr_lang)
+        return text
+
+    # ---------- Text extraction (parallel) ----------
+    def extract_text_parallel(
+        self,
+        workers: Optional[int] = None,
+        preserve_layout: bool = True,
+        ocr_if_empty: bool = True,
+        ocr_lang: str = "en",
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> str:
+        """
+        Same result as extract_text, with page ranges extracted in worker processes.
+        Documents can't be shared across processes, so each worker reopens the file.
+        Short or scanned documents (and single-core machines) are extracted serially.
+        """
+        workers = workers or min(os.cpu_count() or 1, PARALLEL_MAX_WORKERS)
+        texts = self._parallel_page_texts(workers, preserve_layout,
+                                          ocr_if_empty, ocr_lang, progress_callback)
+        if texts is None:
+            return self.extract_text(preserve_layout, ocr_if_empty, ocr_lang, progress_callback)
+        # Join with double line breaks to clearly separate page boundaries
+        return "\n\n".join(texts)
+
+    def _parallel_page_texts(
+        self,
+        workers: int,
+        preserve_layout: bool,
+        ocr_if_empty: bool,
+        ocr_lang: str,
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> Optional[List[str]]:
+        """
+        Page texts in order, extracted by a process pool; None when the document is too
+        short or too scanned to be worth it, or no pool can be started (callers then go
+        serial). Processes rather than threads: a PyMuPDF document must not be shared
+        across threads, and MuPDF calls hold the GIL, so threads would not run pages in
+        parallel. Workers only read the text layer; pages that come back empty are
+        OCR'd here in batches, so the OCR model is loaded once, in this process.
+        """
+        total = self.num_pages()
+        workers = min(workers, total)
+        if total < PARALLEL_MIN_PAGES or workers < 2:
+            return None
+        # Scans are OCR-bound, which the serial path already batches and overlaps
+        if ocr_if_empty and self.is_likely_scanned():
+            return None
+
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from concurrent.futures.process import BrokenProcessPool
+
+        shards = [range(start, min(start + PARALLEL_SHARD_PAGES, total))
+                  for start in range(0, total, PARALLEL_SHARD_PAGES)]
+        texts: List[str] = [""] * total
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                futures = {
+                    pool.submit(_extract_shard, self.pdf_path, self._backend, self.text_mode,
+                                shard.start, shard.stop, preserve_layout): shard
+                    for shard in shards
+                }
+                for future in as_completed(futures):
+                    shard = futures[future]
+                    texts[shard.start:shard.stop] = future.result()
+                    # Pages still waiting for OCR aren't final yet
+                    done += sum(1 for t in texts[shard.start:shard.stop]
+                                if t.strip() or not ocr_if_empty)
+                    if progress_callback:
+                        progress_callback(done, total)
+        except (BrokenProcessPool, OSError):
+            # Process pools can be unavailable (sandboxes, some frozen builds)
+            return None
+
+        if ocr_if_empty:
+            empty = [i for i, t in enumerate(texts) if not t.strip()]
+            batch: List[Tuple[int, Any]] = []
+
+            def run_batch() -> None:
+                nonlocal done
+                for (i, _), text in zip(batch, _ocr_images([img for _, img in batch], ocr_lang)):
+                    texts[i] = text
+                done += len(batch)
+                batch.clear()
+                if progress_callback:
+                    progress_callback(done, total)
+
+            for i in empty:
+                img_array = self._render_page_for_ocr(i)
+                if img_array is None:
+                    # OCR unavailable for this page: an empty page reads as empty
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total)
+                    continue
+                # Batches need same-sized pages, so a size change closes the batch
+                if batch and batch[-1][1].shape != img_array.shape:
+                    run_batch()
+                batch.append((i, img_array))
+                if len(batch) >= OCR_BATCH_PAGES:
+                    run_batch()
+            if batch:
+                run_batch()
+        return texts
 
     # ---------- Page image export for OCR ----------
     def _ocr_page_pymupdf(self, page, lang: str = "en") -> str:
         """Perform OCR on a PDF page using EasyOCR."""
         if not _HAVE_EASYOCR:
             return ""
-        
-        try:
-            # Render page to pixmap -> PIL Image -> numpy array -> EasyOCR
-            pix = page.get_pixmap(dpi=300)  # 300 DPI for better OCR
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            img_array = np.array(img)
-            
-            # Get EasyOCR reader
-            reader = _get_ocr_reader(lang)
-            if reader is None:
-                return ""
-            
-            # Perform OCR
-            results = reader.readtext(img_array)
-            
-            # Extract text from results, preserving line breaks
-            if results:
-                # Sort by vertical position (top to bottom) to maintain reading order
-                sorted_results = sorted(results, key=lambda x: x[0][0][1])  # Sort by top-left Y coordinate
-                
-                # Group by approximate line (similar Y coordinates)
-                lines = []
-                current_line = []
-                current_y = None
-                y_threshold = 20  # Pixels - lines within this distance are considered same line
-                
-                for bbox, text, confidence in sorted_results:
-                    top_y = bbox[0][1]  # Top-left Y coordinate
-                    
-                    if current_y is None or abs(top_y - current_y) > y_threshold:
-                        # New line
-                        if current_line:
-                            lines.append(" ".join(current_line))
-                        current_line = [text]
-                        current_y = top_y
-                    else:
-                        # Same line
-                        current_line.append(text)
-                
-                # Add last line
-                if current_line:
-                    lines.append(" ".join(current_line))
-                
-                return "\n".join(lines)
-            return ""
-        except Exception:
+        img_array = _render_for_ocr(page)
+        if img_array is None:
             return ""
+        return _ocr_image(img_array, lang)
 
     def _ocr_page_pypdf(self, page_index: int, lang: str = "en") -> str:
         """Perform OCR on a PDF page using EasyOCR (pypdf fallback)."""
-        if not _HAVE_EASYOCR or not _HAVE_PYMUPDF:
-            # For OCR from pypdf path, we need PyMuPDF to render
+        img_array = self._render_page_for_ocr(page_index)
+        if img_array is None:
             return ""
+        return _ocr_image(img_array, lang)
+
+    def _render_page_for_ocr(self, page_index: int):
+        """Render a page for OCR with whichever engine is open; None if OCR can't run."""
+        if not _HAVE_EASYOCR:
+            return None
+        if self._doc_pymupdf is not None:
+            return _render_for_ocr(self._doc_pymupdf.load_page(page_index))
+        if not _HAVE_PYMUPDF:
+            # For OCR from pypdf path, we need PyMuPDF to render
+            return None
         try:
-            with fitz.open(self.pdf_path) as d:
-                page = d.load_page(page_index)
-                return self._ocr_page_pymupdf(page, lang=lang)
+            # Opened once and reused for every page that needs OCR
+            if self._ocr_doc is None:
+                self._ocr_doc = fitz.open(self.pdf_path)
+            return _render_for_ocr(self._ocr_doc.load_page(page_index))
         except Exception:
-            return ""
+            return None
 
     # ---------- Quick helpers ----------
     def page_text(self, page_index: int, **kwargs) -> str:
         """
         Extract a single page's text. kwargs mirror extract_pages parameters.
         """
+        if not 0 <= page_index < self.num_pages():
+            raise PDFParserError(f"Page index out of range: {page_index}")
+        preserve_layout = kwargs.get('preserve_layout', True)
         # Default to no OCR for speed when just checking for text
-        if 'ocr_if_empty' not in kwargs:
-            kwargs['ocr_if_empty'] = False
-        pages = self.extract_pages(**kwargs)
-        for p in pages:
-            if p.page_index == page_index:
-                return p.text
-        raise PDFParserError(f"Page index out of range: {page_index}")
+        ocr_if_empty = kwargs.get('ocr_if_empty', False)
+        ocr_lang = kwargs.get('ocr_lang', "en")
+        cached = self._pages_cache.get((preserve_layout, ocr_if_empty, ocr_lang))
+        if cached is not None:
+            return cached[page_index].text
+        # Only this page is loaded; the rest of the document is never touched
+        return self._page_text(page_index, preserve_layout, ocr_if_empty, ocr_lang)
 
     def page_images_count(self, page_index: int) -> int:
         """
@@ -271,6 +660,18 @@ class PDFParser:
         page = self._doc_pymupdf.load_page(page_index)
         return len(page.get_images(full=True) or [])
 
+    def has_text(self, page_index: int) -> bool:
+        """
+        True if the page has any embedded (non-OCR) text. Cheaper than page_text:
+        PyMuPDF only collects words, without building the layout-preserving string.
+        """
+        if self._doc_pymupdf is not None:
+            page = self._doc_pymupdf.load_page(page_index)
+            # Words never contain whitespace, so any word means visible text
+            return bool(page.get_text("words", flags=0))
+        txt = self._doc_pypdf.pages[page_index].extract_text() or ""
+        return bool(txt.strip())
+
     def has_embedded_text(self, sampling: int = 1) -> bool:
         """
         Check if PDF has embedded text (without OCR).
@@ -289,15 +690,7 @@ class PDFParser:
         
         # Only check first page for speed - extract text directly without OCR
         try:
-            if self._doc_pymupdf is not None:
-                page = self._doc_pymupdf.load_page(0)
-                txt = page.get_text("text").strip()
-            else:
-                # pypdf fallback
-                txt = self._doc_pypdf.pages[0].extract_text() or ""
-                txt = txt.strip()
-            
-            if txt:
+            if self.has_text(0):
                 return True
         except Exception:
             pass
@@ -307,15 +700,7 @@ class PDFParser:
             max_check = min(3, n)  # Only check up to 3 pages max
             for i in range(1, max_check):
                 try:
-                    if self._doc_pymupdf is not None:
-                        page = self._doc_pymupdf.load_page(i)
-                        txt = page.get_text("text").strip()
-                    else:
-                        # pypdf fallback
-                        txt = self._doc_pypdf.pages[i].extract_text() or ""
-                        txt = txt.strip()
-                    
-                    if txt:
+                    if self.has_text(i):
                         return True
                 except Exception:
                     continue
@@ -334,8 +719,10 @@ class PDFParser:
         empty_text = 0
         img_pages = 0
         for i in indices:
-            txt = self.page_text(i, preserve_layout=True, ocr_if_empty=False).strip()
-            if txt == "":
+            try:
+                if not self.has_text(i):
+                    empty_text += 1
+            except Exception:
                 empty_text += 1
             if self.page_images_count(i) > 0:
                 img_pages += 1
@@ -347,4 +734,12 @@ class PDFParser:
                 self._doc_pymupdf.close()
         except Exception:
             pass
+        try:
+            if self._ocr_doc is not None:
+                self._ocr_doc.close()
+                self._ocr_doc = None
+        except Exception:
+            pass
+        self._metadata = None
+        self._num_pages = None
         # pypdf uses lazy file handles; nothing explicit to close
\ No newline at end of file
@@ -5,25 +5,61 @@ Prerender manager for TTS audio generation and caching.
 from __future__ import annotations
 import hashlib
 import json
+import os
 import shutil
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 
 from core.nlp_processor import ScriptParse, DialogueBlock
 from core.tts import PiperTTS, PiperTTSError
 from core.project_manager import ProjectLibrary, Project
 from app.tabs.voice_selection_dialog import VoiceConfig
 
+# Hashes below are only compared for cache invalidation, so prefer a fast
+# non-cryptographic hasher when one is installed.
+try:
+    from blake3 import blake3 as _hasher
+    HASH_ALGO = "blake3"
+except Exception:
+    try:
+        import xxhash
+        _hasher = xxhash.xxh3_128
+        HASH_ALGO = "xxh3_128"
+    except Exception:
+        _hasher = hashlib.sha256
+        HASH_ALGO = "sha256"
+
+# Stored as the manifest's hash_algo; bump the version whenever the bytes fed to
+# the hasher change, so manifests hashed the old way are treated as stale
+HASH_FORMAT = f"{HASH_ALGO}/v2"
 
 MANIFEST_FILE = "manifest.json"
 PRERENDER_DIR = "prerendered_audio"
 
 
+def _fast_move(src: Path, dst: Path) -> None:
+    """Move a file, renaming in place when source and destination share a filesystem."""
+    try:
+        if os.stat(src).st_dev == os.stat(dst.parent).st_dev:
+            os.rename(src, dst)
+            return
+    except OSError:
+        pass
+    # Cross-filesystem (e.g. /tmp on tmpfs): copy + unlink
+    shutil.move(str(src), str(dst))
+
+
 class PrerenderManager:
     """Manages prerendered TTS audio for projects."""
     
     def __init__(self, project_library: ProjectLibrary):
         self.project_library = project_library
+        # manifest path -> (st_mtime_ns, parsed manifest)
+        self._manifest_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        # id(script_parse) -> (weakref to the parse, script hash)
+        self._script_hash_cache: Dict[int, Tuple[weakref.ref, str]] = {}
     
     def get_prerender_dir(self, project: Project) -> Path:
         """Get the prerender directory for a project."""
@@ -39,46 +75,81 @@ class PrerenderManager:
     
     def _hash_script(self, script_parse: ScriptParse) -> str:
         """Generate a hash of the script content."""
-        # Hash all block text in order
-        content = "\n".join(f"{block.speaker}:{block.text}" for block in script_parse.blocks)
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        key = id(script_parse)
+        cached = self._script_hash_cache.get(key)
+        if cached is not None and cached[0]() is script_parse:
+            return cached[1]
+        
+        # Stream block text in order; same bytes as "\n".join("speaker:text")
+        h = _hasher()
+        sep = b""
+        for block in script_parse.blocks:
+            h.update(sep)
+            h.update(block.speaker.encode('utf-8'))
+            h.update(b":")
+            h.update(block.text.encode('utf-8'))
+            sep = b"\n"
+        digest = h.hexdigest()
+        
+        cache = self._script_hash_cache
+        ref = weakref.ref(script_parse, lambda _, key=key: cache.pop(key, None))
+        cache[key] = (ref, digest)
+        return digest
     
     def _hash_voice_configs(self, voice_configs: Dict[str, VoiceConfig]) -> str:
         """Generate a hash of voice configurations."""
-        # Create a sorted dict of voice configs for consistent hashing
-        config_data = {}
+        # Feed each config field in sorted character order for consistent hashing
+        h = _hasher()
         for char in sorted(voice_configs.keys()):
             vc = voice_configs[char]
-            config_data[char] = {
-                "model_path": str(vc.model_path) if vc.model_path else "",
-                "speaker": vc.speaker,
-                "noise_scale": vc.noise_scale,
-                "length_scale": vc.length_scale,
-                "noise_w": vc.noise_w,
-                "sentence_silence_seconds": vc.sentence_silence_seconds,
-            }
-        content = json.dumps(config_data, sort_keys=True)
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+            fields = (
+                char,
+                str(vc.model_path) if vc.model_path else "",
+                vc.speaker,
+                vc.noise_scale,
+                vc.length_scale,
+                vc.noise_w,
+                vc.sentence_silence_seconds,
+            )
+            for value in fields:
+                h.update(repr(value).encode('utf-8'))
+                h.update(b"\x1f")
+            h.update(b"\x1e")
+        return h.hexdigest()
     
     def load_manifest(self, project: Project) -> Optional[Dict[str, Any]]:
         """Load the manifest file for a project."""
         manifest_path = self.get_manifest_path(project)
-        if not manifest_path.exists():
+        try:
+            mtime_ns = manifest_path.stat().st_mtime_ns
+        except OSError:
+            self._manifest_cache.pop(manifest_path, None)
             return None
         
+        cached = self._manifest_cache.get(manifest_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
         try:
             with open(manifest_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                manifest = json.load(f)
         except Exception:
             return None
+        self._manifest_cache[manifest_path] = (mtime_ns, manifest)
+        return manifest
     
     def save_manifest(self, project: Project, manifest: Dict[str, Any]) -> None:
         """Save the manifest file for a project."""
         manifest_path = self.get_manifest_path(project)
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self._manifest_cache.pop(manifest_path, None)
         
-        with open(manifest_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        # Write to a temp file and swap it in so a crash never leaves a torn manifest
+        data = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, manifest_path)
     
     def is_prerender_valid(self, project: Project, script_parse: ScriptParse, 
                           voice_configs: Dict[str, VoiceConfig]) -> bool:
@@ -87,6 +158,10 @@ class PrerenderManager:
         if not manifest:
             return False
         
+        # Older manifests carry a bare algorithm name (or none) and a different hash layout
+        if manifest.get('hash_algo') != HASH_FORMAT:
+            return False
+        
         current_script_hash = self._hash_script(script_parse)
         current_voice_hash = self._hash_voice_configs(voice_configs)
         
@@ -116,6 +191,7 @@ class PrerenderManager:
     def clear_prerender(self, project: Project) -> None:
         """Clear all prerendered audio for a project."""
         prerender_dir = self.get_prerender_dir(project)
+        self._manifest_cache.pop(prerender_dir / MANIFEST_FILE, None)
         if prerender_dir.exists():
             shutil.rmtree(prerender_dir)
     
@@ -140,6 +216,9 @@ class PrerenderManager:
         Returns:
             True if successful, False otherwise
         """
+        # Moves run on a single background worker so file I/O overlaps the next synthesis
+        mover = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prerender-move")
+        pending_moves: List[Future] = []
         try:
             # Clear old prerender
             self.clear_prerender(project)
@@ -171,15 +250,12 @@ class PrerenderManager:
             total_blocks = len(blocks_to_render)
             audio_files = {}
             
-            # Render each block
-            for block_index, (block, voice_config) in enumerate(blocks_to_render):
-                if progress_callback:
-                    result = progress_callback(block_index, total_blocks, 
-                                    f"Rendering {block.speaker}: {block.text[:50]}...")
-                    if result is False:  # User cancelled
-                        raise InterruptedError("Prerendering cancelled by user")
+            # Resolve model/config paths once per voice config rather than per block
+            resolved_models: Dict[int, Tuple[str, Optional[str]]] = {}
+            for block, voice_config in blocks_to_render:
+                if id(voice_config) in resolved_models:
+                    continue
                 
-                # Resolve model path
                 model_path = voice_config.model_path
                 if not model_path or not model_path.strip() or not Path(model_path).exists():
                     model_path = default_model_path
@@ -198,11 +274,21 @@ class PrerenderManager:
                 
                 # Find config file
                 config_path = None
-                model_path_obj = Path(model_path)
-                if model_path_obj.exists():
-                    config_path_obj = model_path_obj.with_suffix('.onnx.json')
-                    if config_path_obj.exists():
-                        config_path = str(config_path_obj)
+                config_path_obj = Path(model_path).with_suffix('.onnx.json')
+                if config_path_obj.exists():
+                    config_path = str(config_path_obj)
+                
+                resolved_models[id(voice_config)] = (model_path, config_path)
+            
+            # Render each block
+            for block_index, (block, voice_config) in enumerate(blocks_to_render):
+                if progress_callback:
+                    result = progress_callback(block_index, total_blocks, 
+                                    f"Rendering {block.speaker}: {block.text[:50]}...")
+                    if result is False:  # User cancelled
+                        raise InterruptedError("Prerendering cancelled by user")
+                
+                model_path, config_path = resolved_models[id(voice_config)]
                 
                 # Create TTS instance
                 tts = PiperTTS(
@@ -233,13 +319,19 @@ class PrerenderManager:
                 # Move to prerender directory
                 audio_filename = f"block_{block_index}.wav"
                 audio_path = prerender_dir / audio_filename
-                shutil.move(str(temp_audio_path), str(audio_path))
+                pending_moves.append(mover.submit(_fast_move, Path(temp_audio_path), audio_path))
                 
                 # Store relative path in manifest
                 audio_files[str(block_index)] = audio_filename
             
+            # Surface any move failure before the manifest claims the files exist
+            for move in pending_moves:
+                move.result()
+            mover.shutdown(wait=True)
+            
             # Save manifest
             manifest = {
+                'hash_algo': HASH_FORMAT,
                 'script_hash': script_hash,
                 'voice_hash': voice_hash,
                 'audio_files': audio_files,
@@ -253,7 +345,8 @@ class PrerenderManager:
             return True
             
         except Exception as e:
-            # Clean up on error
+            # Clean up on error (after in-flight moves finish writing into the directory)
+            mover.shutdown(wait=True)
             self.clear_prerender(project)
             raise PiperTTSError(f"Failed to prerender audio: {e}") from e
 
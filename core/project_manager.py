@@ -1,16 +1,105 @@
 # core/project_manager.py
 from __future__ import annotations
+import functools
 import os
 import sqlite3
+import sys
 import json
-import shutil
 import time
-import sys
-import platform
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, replace
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Iterable, Tuple, Union, Callable, Set
 
+# meta_json is decoded for every listed project, so use orjson when available
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def _dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2).decode("utf-8")
+except Exception:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    def _dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+# scan_and_register_pdfs inspects new project folders on a thread pool once
+# there are at least this many of them
+SCAN_PARALLEL_MIN_FOLDERS = 8
+SCAN_WORKERS = 8
+
+# UPDATE ... RETURNING lets a mutation hand back the stored row in one statement
+_HAVE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# ----------------------------
+# File copying
+# ----------------------------
+
+def _clonefile(src: str, dst: str) -> bool:
+    """macOS: copy-on-write clone via clonefile(2). Returns False if unsupported."""
+    import ctypes
+    try:
+        libc = ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+        clonefile = libc.clonefile
+    except (OSError, AttributeError):
+        return False
+    clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int)
+    clonefile.restype = ctypes.c_int
+    # clonefile refuses to overwrite, so clear any reserved placeholder first
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+
+def _copy_file_range(src: str, dst: str) -> bool:
+    """Linux: in-kernel copy (a reflink on Btrfs/XFS). Returns False if unsupported."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            return False
+    return remaining == 0
+
+
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Copy src's contents to dst, cloning the file when the filesystem supports
+    it so large scripts import near-instantly. Metadata (mtime, mode) is not
+    carried over; nothing in the library reads it.
+    """
+    import shutil
+    src, dst = str(src), str(dst)
+    try:
+        if sys.platform == "darwin":
+            if _clonefile(src, dst):
+                return
+        elif sys.platform.startswith("linux"):
+            if _copy_file_range(src, dst):
+                return
+    except OSError:
+        pass
+    # copyfile uses sendfile/fcopyfile where available and skips copy2's extra
+    # stat/chmod/utime syscalls
+    shutil.copyfile(src, dst)
+
 # ----------------------------
 # Data models
 # ----------------------------
@@ -29,6 +118,18 @@ class Project:
 # Paths and Config
 # ----------------------------
 
+@functools.lru_cache(maxsize=8)
+def _app_support_path(app_name: str) -> Path:
+    """Compute (once per app name) the platform's app support path."""
+    if sys.platform == "darwin":  # macOS
+        return Path.home() / "Library" / "Application Support" / app_name
+    if sys.platform == "win32":  # Windows
+        appdata = os.getenv("APPDATA", Path.home() / "AppData" / "Roaming")
+        return Path(appdata) / app_name
+    # Linux and other Unix-like systems
+    return Path.home() / ".config" / app_name
+
+
 def mac_app_support_dir(app_name: str = "ActorRehearsal") -> Path:
     """
     Get the application support directory for the current platform.
@@ -36,16 +137,11 @@ def mac_app_support_dir(app_name: str = "ActorRehearsal") -> Path:
     - Windows: %APPDATA%/<app_name>
     - Linux: ~/.config/<app_name>
     """
-    system = platform.system()
-    if system == "Darwin":  # macOS
-        base = Path.home() / "Library" / "Application Support" / app_name
-    elif system == "Windows":  # Windows
-        appdata = os.getenv("APPDATA", Path.home() / "AppData" / "Roaming")
-        base = Path(appdata) / app_name
-    else:  # Linux and other Unix-like systems
-        base = Path.home() / ".config" / app_name
-    
-    base.mkdir(parents=True, exist_ok=True)
+    base = _app_support_path(app_name)
+    # Not cached: the folder may be removed while the app runs (e.g. reset_app_data).
+    # One stat in the usual case; mkdir(exist_ok=True) costs a failed mkdir plus a stat
+    if not base.is_dir():
+        base.mkdir(parents=True, exist_ok=True)
     return base
 
 class Config:
@@ -57,16 +153,17 @@ class Config:
         self._load()
 
     def _load(self) -> None:
-        if self._config_path.exists():
-            try:
-                self._data = json.loads(self._config_path.read_text(encoding="utf-8"))
-            except Exception:
-                self._data = {}
-        else:
+        try:
+            self._data = _loads(self._config_path.read_bytes())
+        except Exception:
+            # Missing or unreadable config starts empty
             self._data = {}
 
     def save(self) -> None:
-        self._config_path.write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+        # Write to a temp file and swap it in so a crash never leaves a torn config
+        tmp_path = self._config_path.with_suffix(".json.tmp")
+        tmp_path.write_text(_dumps_pretty(self._data), encoding="utf-8")
+        os.replace(tmp_path, self._config_path)
 
     @property
     def library_path(self) -> Optional[str]:
@@ -74,10 +171,40 @@ class Config:
 
     @library_path.setter
     def library_path(self, p: Optional[str]) -> None:
+        new_value = None if p is None else str(p)
+        if self._data.get("library_path") == new_value:
+            return  # Unchanged; skip the disk write
         if p is None:
             self._data.pop("library_path", None)
         else:
-            self._data["library_path"] = str(p)
+            self._data["library_path"] = new_value
+        self.save()
+
+    @property
+    def pdf_backend(self) -> Optional[str]:
+        """Preferred PDF engine ("pymupdf" / "pypdf"); None picks automatically."""
+        return self._data.get("pdf_backend")
+
+    @pdf_backend.setter
+    def pdf_backend(self, backend: Optional[str]) -> None:
+        if self._data.get("pdf_backend") == backend:
+            return
+        if backend is None:
+            self._data.pop("pdf_backend", None)
+        else:
+            self._data["pdf_backend"] = str(backend)
+        self.save()
+
+    @property
+    def pdf_text_mode(self) -> str:
+        """PDF text mode ("text" / "blocks"), see core.pdf_parser.TEXT_MODES."""
+        return self._data.get("pdf_text_mode", "text")
+
+    @pdf_text_mode.setter
+    def pdf_text_mode(self, mode: str) -> None:
+        if self.pdf_text_mode == mode:
+            return
+        self._data["pdf_text_mode"] = str(mode)
         self.save()
 
 # ----------------------------
@@ -115,26 +242,27 @@ class ProjectLibrary:
         This handles cases where the user selects a subfolder (e.g., a project
         inside <library>/projects/) or the projects folder itself.
         """
-        path = Path(selected_path).expanduser().resolve()
-        candidates = [path] + list(path.parents)
-
-        # Prefer a directory that already contains the app metadata (.rehearsal)
-        for candidate in candidates:
+        # abspath is enough here: we only probe for marker folders, and
+        # ProjectLibrary.__init__ resolves symlinks on the chosen root anyway
+        path = Path(os.path.abspath(os.path.expanduser(str(selected_path))))
+
+        # Single walk up the parent chain. A .rehearsal folder wins outright;
+        # otherwise remember the first hit of each weaker rule in priority order.
+        projects_parent: Optional[Path] = None
+        projects_owner: Optional[Path] = None
+        for candidate in (path, *path.parents):
             if (candidate / ProjectLibrary.DB_SUBDIR).exists():
                 return candidate
+            # Selection is within the projects directory: step back to its parent
+            if (projects_parent is None and candidate.name == ProjectLibrary.PROJECTS_DIR
+                    and candidate.parent.exists()):
+                projects_parent = candidate.parent
+            # Ancestor already contains a projects folder
+            if projects_owner is None and (candidate / ProjectLibrary.PROJECTS_DIR).exists():
+                projects_owner = candidate
 
-        # If the selection is within the projects directory, step back to its parent
-        for candidate in candidates:
-            if candidate.name == ProjectLibrary.PROJECTS_DIR and candidate.parent.exists():
-                return candidate.parent
-
-        # If any ancestor already contains a projects folder, use that ancestor
-        for candidate in candidates:
-            if (candidate / ProjectLibrary.PROJECTS_DIR).exists():
-                return candidate
-
-        # As a fallback, return the resolved selection itself
-        return path
+        # As a fallback, return the selection itself
+        return projects_parent or projects_owner or path
 
     def __init__(self, root: Union[str, Path]):
         self.root = Path(root).expanduser().resolve()
@@ -145,6 +273,8 @@ class ProjectLibrary:
         # Create projects folder for storing project files (any file = a project)
         self._projects_dir = self.root / self.PROJECTS_DIR
         self._projects_dir.mkdir(parents=True, exist_ok=True)
+        # root is already resolved, so this only differs if projects/ is a symlink
+        self._projects_dir_resolved = self._projects_dir.resolve()
         # Create customizations folder for user modifications
         self._customizations_dir = self.root / self.CUSTOMIZATIONS_DIR
         self._customizations_dir.mkdir(parents=True, exist_ok=True)
@@ -170,6 +300,8 @@ class ProjectLibrary:
         self._attach_dir.mkdir(parents=True, exist_ok=True)
         self._db_path = self._db_dir / self.DB_FILE
         self._conn: Optional[sqlite3.Connection] = None
+        # Last Project materialized per id; mutations build their result from it
+        self._projects: Dict[int, Project] = {}
         self._ensure_db()
         self._normalize_existing_projects()
 
@@ -177,10 +309,31 @@ class ProjectLibrary:
 
     def _connect(self) -> sqlite3.Connection:
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self._db_path))
-            self._conn.row_factory = sqlite3.Row
+            # Autocommit mode: multi-statement writes open their own
+            # transaction via _transaction() instead of the driver's implicit one
+            conn = sqlite3.connect(str(self._db_path), isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=134217728")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._conn = conn
         return self._conn
 
+    @contextmanager
+    def _transaction(self, mode: str = ""):
+        """Run the enclosed statements in one explicit transaction."""
+        conn = self._connect()
+        conn.execute(f"BEGIN {mode}".strip())
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
     def close(self) -> None:
         if self._conn is not None:
             self._conn.close()
@@ -199,19 +352,44 @@ class ProjectLibrary:
                 meta_json TEXT NOT NULL DEFAULT '{}'
             )
         """)
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name)")
-        conn.commit()
+        # UNIQUE(name) already carries an index; this one serves list_projects' ORDER BY
+        conn.execute("DROP INDEX IF EXISTS idx_projects_name")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_projects_updated_name "
+            "ON projects(updated_at DESC, name ASC)"
+        )
 
     def _now(self) -> float:
         return time.time()
+
+    @staticmethod
+    def _reserve_filename(folder: Path, base: str, ext: str) -> Path:
+        """
+        Atomically create an empty <base><ext> (or <base>_<n><ext>) in folder
+        and return its path. O_EXCL makes the existence check and the create
+        one step, so concurrent callers never pick the same name.
+        """
+        counter = 0
+        while True:
+            candidate = folder / (f"{base}{ext}" if counter == 0 else f"{base}_{counter}{ext}")
+            try:
+                fd = os.open(str(candidate), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                counter += 1
+                continue
+            os.close(fd)
+            return candidate
     
     def _check_and_install_voices(self) -> None:
         """Check if voices need to be installed and mark for installation."""
-        from core.voice_installer import VoiceInstaller
-        
-        # Check if voices already exist
-        if VoiceInstaller.has_voices(self._voice_presets_dir):
-            return
+        # Same test as VoiceInstaller.has_voices, but stops at the first match and
+        # keeps voice_installer (and its HTTP stack) out of startup imports
+        try:
+            with os.scandir(self._voice_presets_dir) as it:
+                if any(entry.name.endswith(".onnx.json") and entry.is_file() for entry in it):
+                    return
+        except OSError:
+            pass
         
         # Mark that voices need to be installed (we'll do it in the UI thread)
         # Store a flag that the UI can check
@@ -224,52 +402,40 @@ class ProjectLibrary:
         If older data placed project folders/files outside that directory, move them
         back into place and update the database metadata.
         """
+        import shutil
         conn = self._connect()
         rows = conn.execute(
             "SELECT id, name, pdf_path, meta_json FROM projects"
         ).fetchall()
 
+        # Collected here and written in one transaction after the loop
+        path_updates: List[Tuple[str, str, float, int]] = []
+        meta_updates: List[Tuple[str, int]] = []
+        projects_prefix = str(self._projects_dir_resolved) + os.sep
+        now = self._now()
+
         for row in rows:
             project_id = row["id"]
             name = row["name"]
             raw_pdf_path = row["pdf_path"]
-            meta: Dict[str, Any] = {}
-            if row["meta_json"]:
-                try:
-                    meta = json.loads(row["meta_json"])
-                except Exception:
-                    meta = {}
 
-            expected_folder = (self._projects_dir / name).resolve()
+            # Stored paths are written already resolved, so a plain prefix match
+            # means the file is in place; skip the realpath calls below
+            if raw_pdf_path and raw_pdf_path.startswith(f"{projects_prefix}{name}{os.sep}"):
+                continue
+
+            expected_folder = (self._projects_dir_resolved / name).resolve()
             pdf_path = Path(raw_pdf_path).expanduser() if raw_pdf_path else None
             updated_path: Optional[Path] = None
-            updated_meta = dict(meta)
-
-            def ensure_expected_folder() -> None:
-                expected_folder.mkdir(parents=True, exist_ok=True)
-
-            def move_folder_contents(src: Path, dest: Path) -> None:
-                dest.mkdir(parents=True, exist_ok=True)
-                for child in src.iterdir():
-                    target = dest / child.name
-                    if target.exists():
-                        # Skip collision to avoid overwriting unexpectedly.
-                        continue
-                    shutil.move(str(child), str(target))
-                try:
-                    src.rmdir()
-                except OSError:
-                    pass
 
             if pdf_path:
                 pdf_path = pdf_path.resolve()
                 if expected_folder in pdf_path.parents:
                     # Already in the correct location.
-                    updated_meta["folder_path"] = str(expected_folder)
                     continue
 
                 current_parent = pdf_path.parent
-                ensure_expected_folder()
+                expected_folder.mkdir(parents=True, exist_ok=True)
 
                 if (
                     current_parent.exists()
@@ -278,7 +444,7 @@ class ProjectLibrary:
                     and current_parent.parent.resolve() == self.root
                 ):
                     # Entire project folder is sitting alongside projects/. Move it back.
-                    move_folder_contents(current_parent, expected_folder)
+                    self._move_folder_contents(current_parent, expected_folder)
                     updated_path = (expected_folder / pdf_path.name).resolve()
                 elif pdf_path.exists():
                     # Move the file itself into the expected folder.
@@ -296,29 +462,59 @@ class ProjectLibrary:
                     filename = pdf_path.name if pdf_path.name else "script.pdf"
                     updated_path = (expected_folder / filename).resolve()
             else:
-                ensure_expected_folder()
+                expected_folder.mkdir(parents=True, exist_ok=True)
                 updated_path = (expected_folder / "script.pdf").resolve()
 
-            updated_meta["folder_path"] = str(expected_folder)
+            # Only rows that are out of place pay for decoding meta_json
+            meta: Dict[str, Any] = {}
+            if row["meta_json"]:
+                try:
+                    meta = _loads(row["meta_json"])
+                except Exception:
+                    meta = {}
+            folder_changed = meta.get("folder_path") != str(expected_folder)
+            meta["folder_path"] = str(expected_folder)
 
             if updated_path and str(updated_path) != raw_pdf_path:
-                conn.execute(
+                path_updates.append((
+                    str(updated_path),
+                    _dumps(meta),
+                    now,
+                    project_id,
+                ))
+            elif folder_changed:
+                meta_updates.append((_dumps(meta), project_id))
+
+        if path_updates or meta_updates:
+            # Take the write lock up front rather than upgrading a read lock mid-batch
+            with self._transaction("IMMEDIATE") as conn:
+                conn.executemany(
                     "UPDATE projects SET pdf_path = ?, meta_json = ?, updated_at = ? WHERE id = ?",
-                    (
-                        str(updated_path),
-                        json.dumps(updated_meta, ensure_ascii=False),
-                        self._now(),
-                        project_id,
-                    ),
+                    path_updates,
                 )
-                conn.commit()
-            elif updated_meta != meta:
-                conn.execute(
+                conn.executemany(
                     "UPDATE projects SET meta_json = ? WHERE id = ?",
-                    (json.dumps(updated_meta, ensure_ascii=False), project_id),
+                    meta_updates,
                 )
-                conn.commit()
     
+    @staticmethod
+    def _move_folder_contents(src: Path, dest: Path) -> None:
+        """Move everything in src into dest (skipping name collisions), then drop src."""
+        import shutil
+        dest.mkdir(parents=True, exist_ok=True)
+        dest_str = str(dest)
+        with os.scandir(src) as it:
+            for entry in it:
+                target = os.path.join(dest_str, entry.name)
+                if os.path.exists(target):
+                    # Skip collision to avoid overwriting unexpectedly.
+                    continue
+                shutil.move(entry.path, target)
+        try:
+            src.rmdir()
+        except OSError:
+            pass
+
     def needs_voice_installation(self) -> bool:
         """Check if voices need to be installed."""
         return getattr(self, '_voices_need_installation', False)
@@ -332,10 +528,10 @@ class ProjectLibrary:
         meta = {}
         if row["meta_json"]:
             try:
-                meta = json.loads(row["meta_json"])
+                meta = _loads(row["meta_json"])
             except Exception:
                 meta = {}
-        return Project(
+        project = Project(
             id=row["id"],
             name=row["name"],
             pdf_path=row["pdf_path"],
@@ -344,6 +540,50 @@ class ProjectLibrary:
             updated_at=row["updated_at"],
             meta=meta,
         )
+        self._projects[project.id] = project
+        return project
+
+    def _cached_project(self, project_id: int) -> Project:
+        """Return the last-seen Project for an id, loading it if needed."""
+        project = self._projects.get(project_id)
+        if project is None:
+            project = self.get_project(project_id)
+        return project
+
+    def _update_project(
+        self,
+        project_id: int,
+        assignments: str,
+        params: Tuple[Any, ...],
+        apply: Callable[[Project], Project],
+    ) -> Project:
+        """
+        Run "UPDATE projects SET <assignments>" for one project and return the
+        updated Project. Uses RETURNING where SQLite supports it; otherwise
+        builds the result by applying `apply` to the last-seen Project.
+        """
+        conn = self._connect()
+        if _HAVE_RETURNING:
+            # fetchall() steps the statement to completion so the write is committed
+            rows = conn.execute(
+                f"UPDATE projects SET {assignments} WHERE id = ? RETURNING *",
+                (*params, project_id),
+            ).fetchall()
+            if not rows:
+                self._projects.pop(project_id, None)
+                raise ProjectLibraryError(f"Project not found: id={project_id}")
+            return self._row_to_project(rows[0])
+
+        current = self._cached_project(project_id)
+        cursor = conn.execute(
+            f"UPDATE projects SET {assignments} WHERE id = ?", (*params, project_id)
+        )
+        if cursor.rowcount == 0:
+            self._projects.pop(project_id, None)
+            raise ProjectLibraryError(f"Project not found: id={project_id}")
+        project = apply(current)
+        self._projects[project_id] = project
+        return project
 
     # ---------- CRUD ----------
 
@@ -373,20 +613,13 @@ class ProjectLibrary:
         if copy_into_library and pdf_source.exists():
             # Use project name as filename, preserving the source file extension
             source_ext = pdf_source.suffix if pdf_source.suffix else ".pdf"
-            dest_filename = f"{name}{source_ext}"
-            dest_pdf = self._projects_dir / dest_filename
-            
-            # If file already exists, append a number
-            if dest_pdf.exists() and str(pdf_source) != str(dest_pdf):
-                base = dest_pdf.stem
-                ext = dest_pdf.suffix
-                counter = 1
-                while dest_pdf.exists():
-                    dest_pdf = self._projects_dir / f"{base}_{counter}{ext}"
-                    counter += 1
+            dest_pdf = self._projects_dir / f"{name}{source_ext}"
             
+            # Unless the source already is the destination, claim a free name
+            # (appending a number on collision) and copy over the placeholder
             if str(pdf_source) != str(dest_pdf):
-                shutil.copy2(str(pdf_source), str(dest_pdf))
+                dest_pdf = self._reserve_filename(self._projects_dir, name, source_ext)
+                _fast_copy(pdf_source, dest_pdf)
             pdf_path_final = str(dest_pdf.resolve())
         else:
             # Use source path as-is (may be placeholder)
@@ -394,7 +627,8 @@ class ProjectLibrary:
 
         now = self._now()
         conn = self._connect()
-        meta_json = json.dumps(meta or {}, ensure_ascii=False)
+        meta = meta or {}
+        meta_json = _dumps(meta)
         try:
             cursor = conn.execute(
                 """
@@ -403,14 +637,23 @@ class ProjectLibrary:
                 """,
                 (name, pdf_path_final, initial_character, now, now, meta_json),
             )
-            conn.commit()
             # Get the ID of the newly inserted project
             project_id = cursor.lastrowid
         except sqlite3.IntegrityError as e:
             raise ProjectLibraryError(f"Project name must be unique: {name}") from e
 
-        # Return the project using the ID we just got
-        return self.get_project(project_id)
+        # Build the project from the values just written instead of re-selecting it
+        project = Project(
+            id=project_id,
+            name=name,
+            pdf_path=pdf_path_final,
+            chosen_character=initial_character,
+            created_at=now,
+            updated_at=now,
+            meta=meta,
+        )
+        self._projects[project_id] = project
+        return project
 
     def list_projects(self) -> List[Project]:
         rows = self._connect().execute(
@@ -439,25 +682,24 @@ class ProjectLibrary:
         if not new_name:
             raise ProjectLibraryError("New name is required.")
         now = self._now()
-        conn = self._connect()
         try:
-            conn.execute(
-                "UPDATE projects SET name = ?, updated_at = ? WHERE id = ?",
-                (new_name, now, project_id),
+            return self._update_project(
+                project_id,
+                "name = ?, updated_at = ?",
+                (new_name, now),
+                lambda p: replace(p, name=new_name, updated_at=now),
             )
-            conn.commit()
         except sqlite3.IntegrityError:
             raise ProjectLibraryError(f"Project name already exists: {new_name}")
-        return self.get_project(project_id)
 
     def set_project_character(self, project_id: int, character: Optional[str]) -> Project:
         now = self._now()
-        self._connect().execute(
-            "UPDATE projects SET chosen_character = ?, updated_at = ? WHERE id = ?",
-            (character, now, project_id),
+        return self._update_project(
+            project_id,
+            "chosen_character = ?, updated_at = ?",
+            (character, now),
+            lambda p: replace(p, chosen_character=character, updated_at=now),
         )
-        self._connect().commit()
-        return self.get_project(project_id)
 
     def update_pdf_path(
         self, project_id: int, new_pdf_path: Union[str, Path], copy_into_library: bool = False
@@ -468,47 +710,38 @@ class ProjectLibrary:
 
         pdf_path_final = str(new_pdf)
         if copy_into_library:
-            proj = self.get_project(project_id)
             # Copy file directly into projects folder
-            dest_filename = new_pdf.name
-            dest_pdf = self._projects_dir / dest_filename
-            
-            # If file already exists and it's not the same file, append a number
-            if dest_pdf.exists() and str(new_pdf) != str(dest_pdf):
-                base = dest_pdf.stem
-                ext = dest_pdf.suffix
-                counter = 1
-                while dest_pdf.exists():
-                    dest_pdf = self._projects_dir / f"{base}_{counter}{ext}"
-                    counter += 1
+            dest_pdf = self._projects_dir / new_pdf.name
             
+            # If it's not the same file, claim a free name (appending a number on collision)
             if str(new_pdf) != str(dest_pdf):
-                shutil.copy2(str(new_pdf), str(dest_pdf))
+                dest_pdf = self._reserve_filename(self._projects_dir, new_pdf.stem, new_pdf.suffix)
+                _fast_copy(new_pdf, dest_pdf)
             pdf_path_final = str(dest_pdf.resolve())
 
         now = self._now()
-        self._connect().execute(
-            "UPDATE projects SET pdf_path = ?, updated_at = ? WHERE id = ?",
-            (pdf_path_final, now, project_id),
+        return self._update_project(
+            project_id,
+            "pdf_path = ?, updated_at = ?",
+            (pdf_path_final, now),
+            lambda p: replace(p, pdf_path=pdf_path_final, updated_at=now),
         )
-        self._connect().commit()
-        return self.get_project(project_id)
 
     def update_meta(self, project_id: int, updater: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Project:
         proj = self.get_project(project_id)
         new_meta = updater(dict(proj.meta) if proj.meta else {})
         now = self._now()
-        self._connect().execute(
-            "UPDATE projects SET meta_json = ?, updated_at = ? WHERE id = ?",
-            (json.dumps(new_meta, ensure_ascii=False), now, project_id),
+        return self._update_project(
+            project_id,
+            "meta_json = ?, updated_at = ?",
+            (_dumps(new_meta), now),
+            lambda p: replace(p, meta=new_meta, updated_at=now),
         )
-        self._connect().commit()
-        return self.get_project(project_id)
 
     def delete_project(self, project_id: int, remove_file: bool = False) -> None:
         proj = self.get_project(project_id)
         self._connect().execute("DELETE FROM projects WHERE id = ?", (project_id,))
-        self._connect().commit()
+        self._projects.pop(project_id, None)
         if remove_file:
             self._remove_project_storage(proj)
             self._remove_project_attachments(proj)
@@ -524,6 +757,7 @@ class ProjectLibrary:
 
     def _remove_project_storage(self, proj: Project) -> None:
         """Remove project files and directories from the projects folder."""
+        import shutil
         meta = proj.meta or {}
         candidates: Set[Path] = set()
 
@@ -544,11 +778,7 @@ class ProjectLibrary:
             if pdf_path.parent.exists():
                 candidates.add(pdf_path.parent)
 
-        projects_dir_resolved = None
-        try:
-            projects_dir_resolved = self._projects_dir.resolve()
-        except Exception:
-            return
+        projects_dir_resolved = self._projects_dir_resolved
 
         unique_dirs: Set[Path] = set()
         for candidate in candidates:
@@ -572,16 +802,21 @@ class ProjectLibrary:
 
     def _remove_project_attachments(self, proj: Project) -> None:
         """Remove saved attachments associated with a project."""
+        import shutil
         prefix = f"{proj.id}_"
         try:
-            for attachment in self._attach_dir.glob(f"{prefix}*"):
-                try:
-                    if attachment.is_dir():
-                        shutil.rmtree(attachment, ignore_errors=True)
-                    else:
-                        attachment.unlink(missing_ok=True)
-                except Exception:
-                    continue
+            # Plain prefix test on DirEntry names: no fnmatch, no extra stat per entry
+            with os.scandir(self._attach_dir) as it:
+                for entry in it:
+                    if not entry.name.startswith(prefix):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                        else:
+                            os.unlink(entry.path)
+                    except Exception:
+                        continue
         except Exception:
             pass
 
@@ -589,9 +824,9 @@ class ProjectLibrary:
         """Check if a path is located within the projects directory."""
         try:
             target = path.resolve()
-            projects_dir_resolved = self._projects_dir.resolve()
         except Exception:
             return False
+        projects_dir_resolved = self._projects_dir_resolved
         return projects_dir_resolved in target.parents or target == projects_dir_resolved
 
     def attachment_path(self, project: Project, filename: str) -> Path:
@@ -638,104 +873,118 @@ class ProjectLibrary:
             'male_student_sides_lbr'  # Add this specific one
         }
         
-        # Get list of valid folder names in projects/
-        valid_folder_names = set()
-        for item_path in self._projects_dir.iterdir():
-            # Skip hidden items
-            if item_path.name.startswith('.'):
-                continue
-            
-            # Skip excluded items (case-insensitive)
-            if item_path.name.lower() in EXCLUDED_NAMES:
-                continue
-            
-            # Only process folders
-            if item_path.is_dir():
-                valid_folder_names.add(item_path.name)
+        # Preferred-name lookup order for the project file inside a folder
+        PREFERRED_EXTENSIONS = ('.pdf', '.txt', '.doc', '.docx', '.rtf', '.fountain', '.fdx')
         
-        # Clean up invalid projects from database
-        all_projects = self.list_projects()
-        for proj in all_projects:
-            # Remove if project name is in exclusion list (case-insensitive)
-            if proj.name.lower() in EXCLUDED_NAMES:
-                try:
-                    self.delete_project(proj.id, remove_file=False)
-                except Exception:
-                    pass
-            # Remove if folder doesn't exist in projects/
-            elif proj.name not in valid_folder_names:
+        # One directory listing; DirEntry.is_dir() reuses the readdir type info
+        folders: Dict[str, str] = {}
+        with os.scandir(self._projects_dir) as it:
+            for entry in it:
+                # Skip hidden and excluded items (case-insensitive)
+                if entry.name.startswith('.') or entry.name.lower() in EXCLUDED_NAMES:
+                    continue
+                # Only folders become projects
                 try:
-                    self.delete_project(proj.id, remove_file=False)
-                except Exception:
-                    pass
+                    if entry.is_dir():
+                        folders[entry.name] = entry.path
+                except OSError:
+                    continue
         
-        # Only scan for folders (each folder = a project)
-        for item_path in self._projects_dir.iterdir():
-            # Skip hidden items
-            if item_path.name.startswith('.'):
-                continue
-            
-            # Skip excluded items (case-insensitive)
-            if item_path.name.lower() in EXCLUDED_NAMES:
-                continue
-            
-            # Only process folders, skip files
-            if not item_path.is_dir():
-                continue
-            
-            project_name = item_path.name
-            
-            # Check if project already exists
+        conn = self._connect()
+        existing = conn.execute("SELECT id, name FROM projects").fetchall()
+        
+        # Invalid projects: excluded names, or no matching folder in projects/
+        stale_ids = [
+            (row["id"],) for row in existing
+            if row["name"].lower() in EXCLUDED_NAMES or row["name"] not in folders
+        ]
+        registered = {row["name"] for row in existing}
+        
+        def inspect_folder(item: Tuple[str, str]) -> Tuple[str, str, Dict[str, Any]]:
+            project_name, folder_path = item
+            # List the folder once, then pick the file by preferred name/extension.
+            # Keyed by lowercased name: the default macOS/Windows filesystems match
+            # names case-insensitively, so "Hamlet/hamlet.PDF" is still the script
+            files: Dict[str, str] = {}
+            fallback_file: Optional[str] = None
             try:
-                self.get_project_by_name(project_name)
-                continue  # Already registered
-            except ProjectLibraryError:
-                pass  # Not registered yet, continue
+                with os.scandir(folder_path) as it:
+                    for entry in it:
+                        try:
+                            if not entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        key = entry.name.lower()
+                        # An exact lowercase name wins over case variants of it
+                        if key not in files or entry.name == key:
+                            files[key] = entry.path
+                        if (fallback_file is None
+                                and os.path.splitext(entry.name)[1].lower() in VALID_EXTENSIONS
+                                and entry.name.lower() not in EXCLUDED_NAMES):
+                            fallback_file = entry.path
+            except OSError:
+                pass
             
-            # Look for a project file in the folder
             project_file = None
-            for ext in VALID_EXTENSIONS:
-                # Try common names first
-                for common_name in ['script', 'main', project_name.lower()]:
-                    candidate = item_path / f"{common_name}{ext}"
-                    if candidate.exists():
-                        project_file = candidate
+            for ext in PREFERRED_EXTENSIONS:
+                for common_name in ('script', 'main', project_name.lower()):
+                    project_file = files.get(f"{common_name}{ext}")
+                    if project_file:
                         break
                 if project_file:
                     break
+            project_file = project_file or fallback_file
             
-            # If no common name found, search for any valid file
-            if not project_file:
-                for file_path in item_path.iterdir():
-                    if file_path.is_file() and file_path.suffix.lower() in VALID_EXTENSIONS:
-                        # Skip excluded files
-                        if file_path.name.lower() not in EXCLUDED_NAMES:
-                            project_file = file_path
-                            break
-            
-            # Create project with found file, or use folder as placeholder
-            try:
-                if project_file:
-                    added.append(self.create_project(
-                        name=project_name,
-                        pdf_source_path=project_file,
-                        copy_into_library=False,  # File is already in the projects folder
-                        initial_character=None,
-                        meta={"imported_via_scan": True, "folder_path": str(item_path), "file_path": str(project_file)}
-                    ))
-                else:
-                    # Create placeholder project for folder without valid file
-                    placeholder_path = item_path / "script.pdf"
-                    added.append(self.create_project(
-                        name=project_name,
-                        pdf_source_path=placeholder_path,
-                        copy_into_library=False,  # Placeholder
-                        initial_character=None,
-                        meta={"imported_via_scan": True, "folder_path": str(item_path), "is_placeholder": True}
-                    ))
-            except ProjectLibraryError as e:
-                # If registration fails, skip this folder
-                continue
+            # Register with found file, or use folder as placeholder
+            if project_file:
+                pdf_path = project_file
+                meta = {"imported_via_scan": True, "folder_path": folder_path, "file_path": project_file}
+            else:
+                pdf_path = os.path.join(folder_path, "script.pdf")
+                meta = {"imported_via_scan": True, "folder_path": folder_path, "is_placeholder": True}
+            return project_name, str(Path(pdf_path).resolve()), meta
+        
+        new_folders = [(name, path) for name, path in folders.items() if name not in registered]
+        # Listing and resolving each folder is filesystem-bound (slow on network
+        # or cloud-synced drives), so a bulk import inspects folders concurrently
+        if len(new_folders) >= SCAN_PARALLEL_MIN_FOLDERS:
+            with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(new_folders)),
+                                    thread_name_prefix="project-scan") as pool:
+                found = list(pool.map(inspect_folder, new_folders))
+        else:
+            found = [inspect_folder(item) for item in new_folders]
+        
+        now = self._now()
+        inserts: List[Tuple[str, str, Optional[str], float, float, str]] = [
+            (project_name, pdf_path, None, now, now, _dumps(meta))
+            for project_name, pdf_path, meta in found
+        ]
+        
+        if not stale_ids and not inserts:
+            return added
+        
+        # IMMEDIATE takes the write lock up front, so no other writer can
+        # slip rows in between reading max(id) and reading back our inserts
+        with self._transaction("IMMEDIATE") as conn:
+            conn.executemany("DELETE FROM projects WHERE id = ?", stale_ids)
+            for (stale_id,) in stale_ids:
+                self._projects.pop(stale_id, None)
+            if inserts:
+                last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM projects").fetchone()[0]
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO projects
+                        (name, pdf_path, chosen_character, created_at, updated_at, meta_json)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    inserts,
+                )
+                # AUTOINCREMENT ids are monotonic, so everything above last_id is ours
+                rows = conn.execute(
+                    "SELECT * FROM projects WHERE id > ? ORDER BY id", (last_id,)
+                ).fetchall()
+                added = [self._row_to_project(row) for row in rows]
         
         return added
 
@@ -743,6 +992,17 @@ class ProjectLibrary:
 # High-level facade
 # ----------------------------
 
+def _bump(method: Callable) -> Callable:
+    """Decorator for ProjectManager methods that change the project list."""
+    @functools.wraps(method)
+    def wrapper(self: "ProjectManager", *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_list_cache()
+    return wrapper
+
+
 class ProjectManager:
     """
     Combines Config (remembers last-chosen library) and ProjectLibrary.
@@ -750,12 +1010,16 @@ class ProjectManager:
     def __init__(self, app_name: str = "ActorRehearsal"):
         self.config = Config(app_name=app_name)
         self.library: Optional[ProjectLibrary] = None
+        # list() result, reused until a mutating proxy runs
+        self._list_cache: Optional[List[Project]] = None
+        self._list_version: int = 0
         if self.config.library_path:
             try:
                 self.set_library(self.config.library_path)
             except Exception:
                 self.library = None
 
+    @_bump
     def set_library(self, library_path: Union[str, Path]) -> None:
         resolved_path = ProjectLibrary.resolve_library_root(library_path)
         lib = ProjectLibrary(resolved_path)
@@ -765,54 +1029,61 @@ class ProjectManager:
         self.library = lib
         self.config.library_path = str(lib.root)
 
+    @_bump
     def clear_library(self) -> None:
         if self.library:
             self.library.close()
         self.library = None
         self.config.library_path = None
 
+    def invalidate_list_cache(self) -> None:
+        """Drop the cached list(); call after changing the library directly."""
+        self._list_cache = None
+        self._list_version += 1
+
     # Convenience proxies
 
+    @_bump
     def create(self, name: str, pdf_path: Union[str, Path], copy_into_library: bool = True,
                initial_character: Optional[str] = None, meta: Optional[Dict[str, Any]] = None) -> Project:
-        self._require_lib()
-        return self.library.create_project(name, pdf_path, copy_into_library, None, initial_character, meta)
+        return self._require_lib().create_project(name, pdf_path, copy_into_library, None, initial_character, meta)
 
     def list(self) -> List[Project]:
-        self._require_lib()
-        return self.library.list_projects()
+        lib = self._require_lib()
+        if self._list_cache is None:
+            self._list_cache = lib.list_projects()
+        # Shallow copy so callers can't reorder the cached list
+        return list(self._list_cache)
 
     def get(self, project_id: int) -> Project:
-        self._require_lib()
-        return self.library.get_project(project_id)
+        return self._require_lib().get_project(project_id)
 
     def get_by_name(self, name: str) -> Project:
-        self._require_lib()
-        return self.library.get_project_by_name(name)
+        return self._require_lib().get_project_by_name(name)
 
+    @_bump
     def set_character(self, project_id: int, character: Optional[str]) -> Project:
-        self._require_lib()
-        return self.library.set_project_character(project_id, character)
+        return self._require_lib().set_project_character(project_id, character)
 
+    @_bump
     def rename(self, project_id: int, new_name: str) -> Project:
-        self._require_lib()
-        return self.library.rename_project(project_id, new_name)
+        return self._require_lib().rename_project(project_id, new_name)
 
+    @_bump
     def replace_pdf(self, project_id: int, new_pdf_path: Union[str, Path], copy_into_library: bool = False) -> Project:
-        self._require_lib()
-        return self.library.update_pdf_path(project_id, new_pdf_path, copy_into_library)
+        return self._require_lib().update_pdf_path(project_id, new_pdf_path, copy_into_library)
 
+    @_bump
     def update_meta(self, project_id: int, updater: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Project:
-        self._require_lib()
-        return self.library.update_meta(project_id, updater)
+        return self._require_lib().update_meta(project_id, updater)
 
+    @_bump
     def delete(self, project_id: int, remove_file: bool = False) -> None:
-        self._require_lib()
-        self.library.delete_project(project_id, remove_file)
+        self._require_lib().delete_project(project_id, remove_file)
 
+    @_bump
     def scan(self, subdirs: Optional[List[str]] = None) -> List[Project]:
-        self._require_lib()
-        return self.library.scan_and_register_pdfs(subdirs)
+        return self._require_lib().scan_and_register_pdfs(subdirs)
     
     def voice_presets_dir(self) -> Optional[Path]:
         """Get the voice presets directory for the current library."""
@@ -820,6 +1091,8 @@ class ProjectManager:
             return self.library.voice_presets_dir()
         return None
 
-    def _require_lib(self) -> None:
-        if not self.library:
-            raise ProjectLibraryError("No library set. Call set_library(<folder_path>) first.")
\ No newline at end of file
+    def _require_lib(self) -> ProjectLibrary:
+        lib = self.library
+        if lib is None:
+            raise ProjectLibraryError("No library set. Call set_library(<folder_path>) first.")
+        return lib
\ No newline at end of file
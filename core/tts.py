@@ -3,43 +3,201 @@ Piper neural TTS integration using the piper-tts Python package.
 """
 from __future__ import annotations
 
+import functools
+import re
+import struct
 import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
-try:
+if TYPE_CHECKING:
     from piper.voice import PiperVoice
-    PIPER_AVAILABLE = True
-    PIPER_IMPORT_ERROR = None
-except ImportError as e:
-    PIPER_AVAILABLE = False
-    PIPER_IMPORT_ERROR = str(e)
-    PiperVoice = None
-
 
 class PiperTTSError(Exception):
     """Generic Piper TTS error."""
 
 
+# piper.voice pulls in onnxruntime, so it is only imported when a voice is
+# first loaded. Availability is probed with find_spec, which imports nothing.
+_piper_status: Optional[Tuple[bool, Optional[str]]] = None
+_PiperVoice = None
+
+
+def _probe_piper() -> Tuple[bool, Optional[str]]:
+    """Return (available, import_error) for piper-tts and its native deps."""
+    global _piper_status
+    if _piper_status is None:
+        from importlib.util import find_spec
+        status: Tuple[bool, Optional[str]] = (True, None)
+        for module in ("piper", "onnxruntime", "piper_phonemize"):
+            try:
+                found = find_spec(module) is not None
+            except Exception:
+                found = False
+            if not found:
+                status = (False, f"No module named '{module}'")
+                break
+        _piper_status = status
+    return _piper_status
+
+
+def _piper_voice_class():
+    """Import (once) and return piper.voice.PiperVoice."""
+    global _PiperVoice, _piper_status
+    if _PiperVoice is None:
+        try:
+            from piper.voice import PiperVoice
+        except ImportError as e:
+            # Installed but not importable (e.g. a broken native wheel)
+            _piper_status = (False, str(e))
+            raise PiperTTSError(f"piper-tts could not be loaded: {e}") from e
+        _PiperVoice = PiperVoice
+    return _PiperVoice
+
+
+# Loaded voices shared by all PiperTTS instances, keyed by (model, config) path.
+# Loading builds an ONNX session, so keep the few most recent ones warm.
+VOICE_CACHE_SIZE = 3
+_VOICE_CACHE: "OrderedDict[Tuple[str, str], PiperVoice]" = OrderedDict()
+_VOICE_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_model(path_str: str) -> Path:
+    """Expand a user-supplied model/config path (memoized)."""
+    return Path(path_str).expanduser()
+
+
+def _load_tuned_voice(model_path: str, config_path: Optional[str]) -> Optional["PiperVoice"]:
+    """
+    Build a PiperVoice with an ONNX session tuned for CPU inference (full graph
+    optimization, half the cores for intra-op work). PiperVoice.load takes no
+    session options, so this mirrors it; returns None if piper's layout differs.
+    """
+    try:
+        import json
+        import os
+        import onnxruntime
+        from piper.config import PiperConfig
+        
+        with open(config_path or f"{model_path}.json", "r", encoding="utf-8") as f:
+            config_dict = json.load(f)
+        
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+        session = onnxruntime.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        return _piper_voice_class()(config=PiperConfig.from_dict(config_dict), session=session)
+    except PiperTTSError:
+        raise
+    except Exception:
+        return None
+
+
+# Path fragments that mark a demo model or one inside a virtualenv, not a Piper voice
+_INVALID_MODEL_PATH_RE = re.compile("|".join(map(re.escape, [
+    "logreg_iris", "datasets", "onnxruntime/datasets", ".venv", "venv", "site-packages",
+])))
+
+# 16-bit mono PCM WAV header: RIFF chunk, fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+WAV_HEADER_SIZE = _WAV_HEADER.size  # 44
+
+
+def _wav_header(sample_rate: int, data_size: int) -> bytes:
+    """Header for 16-bit mono PCM with data_size bytes of samples."""
+    return _WAV_HEADER.pack(
+        b"RIFF", min(data_size + WAV_HEADER_SIZE - 8, 0xFFFFFFFF), b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", min(data_size, 0xFFFFFFFF),
+    )
+
+
+def _write_wav(fh: BinaryIO, sample_rate: int, chunks: Iterable[bytes]) -> int:
+    """
+    Write a WAV file to a seekable binary sink (file or io.BytesIO).
+    The header goes out first with placeholder sizes and PCM is appended as
+    it arrives; only the two size fields are patched at the end.
+    Returns the number of PCM bytes written.
+    """
+    start = fh.tell()
+    fh.write(_wav_header(sample_rate, 0))
+    pcm_bytes = 0
+    for chunk in chunks:
+        fh.write(chunk)
+        pcm_bytes += len(chunk)
+    end = fh.tell()
+    fh.seek(start + 4)
+    fh.write(struct.pack("<I", pcm_bytes + WAV_HEADER_SIZE - 8))
+    fh.seek(start + 40)
+    fh.write(struct.pack("<I", pcm_bytes))
+    fh.seek(end)
+    return pcm_bytes
+
+
+# Sentence boundary: whitespace after terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences, using pysbd when installed for better accuracy."""
+    try:
+        import pysbd
+        sentences = pysbd.Segmenter(language="en", clean=False).segment(text)
+    except Exception:
+        sentences = _SENTENCE_SPLIT_RE.split(text)
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+
+def _load_voice(model_path: Path, config_path: Optional[Path]) -> "PiperVoice":
+    """Return a loaded PiperVoice, reusing a cached one for the same files."""
+    key = (str(model_path.resolve()), str(config_path.resolve()) if config_path else "")
+    with _VOICE_CACHE_LOCK:
+        voice = _VOICE_CACHE.get(key)
+        if voice is not None:
+            _VOICE_CACHE.move_to_end(key)
+            return voice
+    
+    # Load outside the lock so other voices stay usable meanwhile
+    voice = _load_tuned_voice(key[0], key[1] or None)
+    if voice is None:
+        if config_path:
+            voice = _piper_voice_class().load(model_path=key[0], config_path=key[1])
+        else:
+            voice = _piper_voice_class().load(model_path=key[0])
+    
+    with _VOICE_CACHE_LOCK:
+        _VOICE_CACHE[key] = voice
+        _VOICE_CACHE.move_to_end(key)
+        while len(_VOICE_CACHE) > VOICE_CACHE_SIZE:
+            _VOICE_CACHE.popitem(last=False)
+    return voice
+
+
 def check_tts_availability() -> tuple[bool, Optional[str]]:
     """
     Check if TTS is available and return a user-friendly message if not.
     Returns: (is_available, error_message_or_none)
     """
-    if PIPER_AVAILABLE:
+    available, import_error = _probe_piper()
+    if available:
         return True, None
     
     import sys
     error_msg = "TTS features are not available.\n\n"
     
-    if PIPER_IMPORT_ERROR:
-        if "onnxruntime" in str(PIPER_IMPORT_ERROR):
+    if import_error:
+        if "onnxruntime" in str(import_error):
             error_msg += (
                 "The 'onnxruntime' package is required but not available.\n\n"
                 "If you're using Python 3.14, please use Python 3.13 or earlier.\n"
                 "Otherwise, install with: pip install onnxruntime\n\n"
             )
-        elif "piper_phonemize" in str(PIPER_IMPORT_ERROR):
+        elif "piper_phonemize" in str(import_error):
             error_msg += (
                 "The 'piper-phonemize' package is required but not available.\n\n"
                 "piper-phonemize needs to be built from source and requires Rust.\n\n"
@@ -50,7 +208,7 @@ def check_tts_availability() -> tuple[bool, Optional[str]]:
                 "   Or from source: pip install git+https://github.com/rhasspy/piper-phonemize.git\n\n"
             )
         else:
-            error_msg += f"Error: {PIPER_IMPORT_ERROR}\n\n"
+            error_msg += f"Error: {import_error}\n\n"
             error_msg += "Try installing: pip install piper-tts\n\n"
     
     error_msg += (
@@ -78,10 +236,11 @@ class PiperTTS:
         noise_w: Optional[float] = None,
         sentence_silence_seconds: Optional[float] = None
     ):
-        if not PIPER_AVAILABLE:
+        available, import_error = _probe_piper()
+        if not available:
             import sys
             error_msg = "piper-tts package dependencies are not available.\n\n"
-            if "onnxruntime" in str(PIPER_IMPORT_ERROR):
+            if "onnxruntime" in str(import_error):
                 error_msg += (
                     "The 'onnxruntime' package is required but not available for Python 3.14.\n\n"
                     "Options:\n"
@@ -89,7 +248,7 @@ class PiperTTS:
                     "2. Wait for onnxruntime to support Python 3.14\n"
                     "3. Try installing from source: pip install onnxruntime --no-binary onnxruntime\n\n"
                 )
-            elif "piper_phonemize" in str(PIPER_IMPORT_ERROR):
+            elif "piper_phonemize" in str(import_error):
                 error_msg += (
                     "The 'piper-phonemize' package is required but not available.\n\n"
                     "piper-phonemize needs to be built from source and requires Rust.\n\n"
@@ -101,33 +260,38 @@ class PiperTTS:
                     "All other app features should work normally.\n\n"
                 )
             else:
-                error_msg += f"Error: {PIPER_IMPORT_ERROR}\n\n"
+                error_msg += f"Error: {import_error}\n\n"
                 error_msg += "Install with: pip install piper-tts\n"
             
             error_msg += f"\nCurrent Python version: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
             raise PiperTTSError(error_msg)
         
-        self._model_path = Path(model_path).expanduser() if model_path else None
-        self._config_path = Path(config_path).expanduser() if config_path else None
+        self._model_path = _resolve_model(model_path) if model_path else None
+        self._config_path = _resolve_model(config_path) if config_path else None
+        # Whether _model_path exists on disk; checked lazily, reset by set_model
+        self._model_exists: Optional[bool] = None
         self._speaker = speaker
         self._noise_scale = noise_scale
         self._length_scale = length_scale
         self._noise_w = noise_w
         self._sentence_silence_seconds = sentence_silence_seconds
         self._piper_instance: Optional[PiperVoice] = None
+        self._load_lock = threading.Lock()
+        self._warm_thread: Optional[threading.Thread] = None
 
     @property
     def model_path(self) -> Optional[Path]:
         return self._model_path
 
     def set_model(self, model_path: str, config_path: Optional[str] = None) -> None:
-        path = Path(model_path).expanduser()
+        path = _resolve_model(model_path)
         if not path.exists():
             raise PiperTTSError(f"Piper model not found: {path}")
         self._model_path = path
+        self._model_exists = True
         
         if config_path:
-            config = Path(config_path).expanduser()
+            config = _resolve_model(config_path)
             if config.exists():
                 self._config_path = config
         else:
@@ -136,31 +300,47 @@ class PiperTTS:
             if config.exists():
                 self._config_path = config
         
-        # Reset instance so it's recreated with new model
+        # Drop our handle; the loaded voice stays in the shared cache
         self._piper_instance = None
+        
+        # Load the new voice now so the first synthesize() doesn't wait on it
+        self._warm_thread = threading.Thread(target=self._warm, name="piper-warmup", daemon=True)
+        self._warm_thread.start()
 
     def set_speaker(self, speaker: Optional[int]) -> None:
+        # speaker_id is passed per synthesize call, so the loaded voice stays valid
         self._speaker = speaker
-        # Reset instance so it's recreated with new speaker
-        self._piper_instance = None
+
+    def _has_model_file(self) -> bool:
+        """Whether the configured model file exists (stat'ed once per model)."""
+        if self._model_exists is None:
+            self._model_exists = bool(self._model_path and self._model_path.exists())
+        return self._model_exists
 
     def _get_piper_instance(self) -> PiperVoice:
         """Get or create the PiperVoice instance."""
-        if self._piper_instance is None:
-            if not self._model_path or not self._model_path.exists():
+        instance = self._piper_instance
+        if instance is not None:
+            return instance
+        
+        # Serializes loads between the warmup thread and synthesize callers
+        with self._load_lock:
+            if self._piper_instance is not None:
+                return self._piper_instance
+            
+            model_path = self._model_path
+            if not self._has_model_file():
                 raise PiperTTSError(
                     f"Piper model not configured or not found.\n\n"
-                    f"Model path: {self._model_path}\n\n"
+                    f"Model path: {model_path}\n\n"
                     f"Please select a valid Piper TTS model file (.onnx) in the voice settings."
                 )
             
             # Validate that this is likely a Piper model (not a random .onnx file)
-            model_path_str = str(self._model_path)
-            invalid_patterns = ["logreg_iris", "datasets", "onnxruntime/datasets", ".venv", "venv", "site-packages"]
-            if any(pattern in model_path_str for pattern in invalid_patterns):
+            if _INVALID_MODEL_PATH_RE.search(str(model_path)):
                 raise PiperTTSError(
                     f"Invalid model path detected. The selected file appears to be a demo file or is located in a virtual environment, not a Piper TTS model.\n\n"
-                    f"Model path: {self._model_path}\n\n"
+                    f"Model path: {model_path}\n\n"
                     f"Please select a valid Piper TTS voice model (.onnx file) in the voice settings.\n"
                     f"You may need to download Piper voice models first.\n\n"
                     f"Note: Model files should not be in .venv, venv, or site-packages directories."
@@ -170,55 +350,179 @@ class PiperTTS:
             config_path = self._config_path
             if not config_path or not config_path.exists():
                 # Try to find config file automatically
-                config_path = self._model_path.with_suffix('.onnx.json')
+                config_path = model_path.with_suffix('.onnx.json')
                 if not config_path.exists():
                     config_path = None
             
-            if config_path and config_path.exists():
-                self._piper_instance = PiperVoice.load(
-                    model_path=str(self._model_path),
-                    config_path=str(config_path)
-                )
-            else:
-                self._piper_instance = PiperVoice.load(
-                    model_path=str(self._model_path)
-                )
-        
-        return self._piper_instance
+            voice = _load_voice(model_path, config_path)
+            # set_model may have switched models while this one was loading
+            if self._model_path == model_path:
+                self._piper_instance = voice
+            return voice
 
-    def is_available(self) -> bool:
-        """Check if TTS is available."""
-        if not PIPER_AVAILABLE:
-            return False
-        if not self._model_path or not self._model_path.exists():
-            return False
+    def _warm(self) -> None:
+        """Load the current model in the background (errors surface on synthesize)."""
         try:
-            # Try to create instance to verify it works
             self._get_piper_instance()
-            return True
         except Exception:
+            pass
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a warmup started by set_model finishes (or timeout passes).
+        Returns True if the voice is loaded.
+        """
+        thread = self._warm_thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._piper_instance is not None
+
+    def is_available(self) -> bool:
+        """
+        Check if TTS is available (Piper installed and the model file present).
+        Does not load the model; load errors surface from synthesize().
+        """
+        if not _probe_piper()[0]:
             return False
+        return self._piper_instance is not None or self._has_model_file()
+
+    def _synthesize_kwargs(self) -> Dict[str, Any]:
+        """Voice settings passed to every Piper synthesis call."""
+        synthesize_kwargs = {
+            'length_scale': self._length_scale,
+            'noise_scale': self._noise_scale,
+            'noise_w': self._noise_w,
+            'sentence_silence': self._sentence_silence_seconds
+        }
+        # Only add speaker_id if it's not None (some models don't support it)
+        if self._speaker is not None:
+            synthesize_kwargs['speaker_id'] = self._speaker
+        return synthesize_kwargs
+
+    def _iter_pcm(self, piper: PiperVoice, text: str, **overrides: Any) -> Iterator[bytes]:
+        """Yield raw 16-bit mono PCM chunks (one per sentence) for text."""
+        synthesize_kwargs = self._synthesize_kwargs()
+        synthesize_kwargs.update(overrides)
+        produced = False
+        try:
+            for chunk in piper.synthesize_stream_raw(text, **synthesize_kwargs):
+                produced = True
+                yield chunk
+        except Exception as e:
+            # If speaker_id caused the error, try without it
+            if (not produced and 'speaker_id' in synthesize_kwargs
+                    and ('sid' in str(e) or 'speaker' in str(e).lower())):
+                synthesize_kwargs.pop('speaker_id', None)
+                yield from piper.synthesize_stream_raw(text, **synthesize_kwargs)
+            else:
+                raise
+
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        """
+        Generate speech for text as an in-memory WAV stream.
+        Yields a WAV header first, then PCM chunks as each sentence is
+        synthesized, so playback can start before the whole text is done.
+        """
+        available, import_error = _probe_piper()
+        if not available:
+            raise PiperTTSError(
+                f"piper-tts package dependencies are not available.\n\n"
+                f"Error: {import_error or 'Unknown error'}"
+            )
+        if not self._model_path:
+            raise PiperTTSError("Piper model not configured.")
+        
+        piper = self._get_piper_instance()
+        # Total length is unknown up front; 0xFFFFFFFF is the usual streaming placeholder
+        yield _wav_header(piper.config.sample_rate, 0xFFFFFFFF)
+        try:
+            yield from self._iter_pcm(piper, text)
+        except Exception as e:
+            raise PiperTTSError(f"Failed to synthesize speech: {e}") from e
+
+    def synthesize_sentences(self, text: str) -> Iterator[bytes]:
+        """
+        Yield raw 16-bit mono PCM audio for text one sentence at a time.
+        Sentences are synthesized on a worker thread one step ahead of the
+        consumer, so sentence N can play while N+1 is being generated.
+        """
+        if not _probe_piper()[0]:
+            raise PiperTTSError("piper-tts package dependencies are not available.")
+        if not self._model_path:
+            raise PiperTTSError("Piper model not configured.")
+        
+        import queue
+        
+        piper = self._get_piper_instance()
+        sentences = _split_sentences(text)
+        if not sentences:
+            return
+        
+        # Silence is inserted here rather than by Piper after each sentence
+        silence_frames = int(piper.config.sample_rate * (self._sentence_silence_seconds or 0.0))
+        silence = b"\x00\x00" * silence_frames
+        
+        done = object()
+        results: "queue.Queue[Any]" = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        
+        def put(item: Any) -> None:
+            # Give up once the consumer has gone away, instead of blocking forever
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+        
+        def worker() -> None:
+            try:
+                for sentence in sentences:
+                    if stop.is_set():
+                        return
+                    put(b"".join(self._iter_pcm(piper, sentence, sentence_silence=0.0)))
+            except Exception as e:
+                put(e)
+            put(done)
+        
+        thread = threading.Thread(target=worker, name="piper-sentences", daemon=True)
+        thread.start()
+        try:
+            first = True
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise PiperTTSError(f"Failed to synthesize speech: {item}") from item
+                if not first and silence:
+                    yield silence
+                first = False
+                yield item
+        finally:
+            stop.set()
 
     def synthesize(self, text: str) -> Path:
         """
         Generate speech audio for the provided text.
         Returns a path to a temporary WAV file.
         """
-        if not PIPER_AVAILABLE:
+        available, import_error = _probe_piper()
+        if not available:
             import sys
             error_msg = "piper-tts package dependencies are not available.\n\n"
-            if PIPER_IMPORT_ERROR and "onnxruntime" in PIPER_IMPORT_ERROR:
+            if import_error and "onnxruntime" in import_error:
                 error_msg += (
                     "The 'onnxruntime' package is required but not available for Python 3.14.\n\n"
                     "Please use Python 3.13 or earlier, or wait for onnxruntime to support Python 3.14."
                 )
-            elif PIPER_IMPORT_ERROR and "piper_phonemize" in PIPER_IMPORT_ERROR:
+            elif import_error and "piper_phonemize" in import_error:
                 error_msg += (
                     "The 'piper-phonemize' package is required but not available for Python 3.14.\n\n"
                     "Please use Python 3.13 or earlier, or wait for piper-phonemize to support Python 3.14."
                 )
             else:
-                error_msg += f"Error: {PIPER_IMPORT_ERROR or 'Unknown error'}\n\n"
+                error_msg += f"Error: {import_error or 'Unknown error'}\n\n"
                 error_msg += "Install with: pip install piper-tts"
             raise PiperTTSError(error_msg)
         
@@ -226,47 +530,23 @@ class PiperTTS:
             raise PiperTTSError("Piper model not configured.")
 
         try:
-            import wave
             import os
             
             piper = self._get_piper_instance()
             
             # Create temporary WAV file
             tmp_fd, tmp_path = tempfile.mkstemp(suffix=".wav", prefix="piper_tts_")
-            os.close(tmp_fd)
             
-            # Synthesize audio directly to WAV file
-            with wave.open(tmp_path, 'wb') as wav_file:
-                # Build synthesize arguments - only include speaker_id if it's not None
-                # Some models don't support speaker IDs, so we need to handle that
-                synthesize_kwargs = {
-                    'text': text,
-                    'wav_file': wav_file,
-                    'length_scale': self._length_scale,
-                    'noise_scale': self._noise_scale,
-                    'noise_w': self._noise_w,
-                    'sentence_silence': self._sentence_silence_seconds
-                }
-                
-                # Only add speaker_id if it's not None (some models don't support it)
-                if self._speaker is not None:
-                    synthesize_kwargs['speaker_id'] = self._speaker
-                
-                try:
-                    piper.synthesize(**synthesize_kwargs)
-                except Exception as e:
-                    # If speaker_id caused the error, try without it
-                    if 'speaker_id' in synthesize_kwargs and ('sid' in str(e) or 'speaker' in str(e).lower()):
-                        synthesize_kwargs.pop('speaker_id', None)
-                        piper.synthesize(**synthesize_kwargs)
-                    else:
-                        raise
+            # Write the raw PCM stream straight into the WAV file
+            with os.fdopen(tmp_fd, 'wb') as wav_file:
+                pcm_bytes = _write_wav(wav_file, piper.config.sample_rate, self._iter_pcm(piper, text))
             
-            output_path = Path(tmp_path)
-            if not output_path.exists() or output_path.stat().st_size == 0:
+            # The header is always written, so check for audio, not file size
+            if pcm_bytes == 0:
+                os.unlink(tmp_path)
                 raise PiperTTSError("Piper did not produce a valid output file.")
             
-            return output_path
+            return Path(tmp_path)
             
         except Exception as e:
             if isinstance(e, PiperTTSError):
@@ -3,27 +3,142 @@
 Automatic voice installer - downloads all available voices when library is created.
 """
 from __future__ import annotations
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Any, Iterator, Optional, Dict, List, Tuple
+import importlib.util
 import json
+import os
+import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# httpx with the h2 extra multiplexes every voice file over one HTTP/2
+# connection; requests (HTTP/1.1 pool) is the fallback. h2 is only probed:
+# httpx imports it itself when the http2=True client is built
+try:
+    import httpx
+    _HAVE_HTTPX = importlib.util.find_spec("h2") is not None
+except Exception:
+    httpx = None
+    _HAVE_HTTPX = False
+
+# Preset files are rewritten for every voice; orjson is much faster at indent=2
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+
+# Voice names look like "en_US-amy-low"; voice names may themselves contain dashes
+_VOICE_RE = re.compile(
+    r'^(?P<region>[a-z]{2,3}_[A-Z]{2})-(?P<voice>[^-]+(?:-[^-]+)*)-(?P<quality>x_low|low|medium|high)$'
+)
+
+# Bytes per read/write while streaming a download
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Voices are downloaded concurrently; downloads are network-bound
+MAX_DOWNLOAD_WORKERS = 8
+
+# One pooled client for all downloads so connections (and TLS) are reused
+_session: Any = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> Any:
+    """Get or create the shared download client (httpx.Client or requests.Session)."""
+    global _session
+    with _session_lock:
+        if _session is None and _HAVE_HTTPX:
+            _session = httpx.Client(
+                http2=True,
+                timeout=30.0,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,
+                    # Same connection budget as the requests pool below; keep idle
+                    # connections around for the whole install run
+                    limits=httpx.Limits(max_connections=16, keepalive_expiry=60.0),
+                ),
+            )
+        if _session is None:
+            session = requests.Session()
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=retry_strategy,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _is_httpx(session: Any) -> bool:
+    return _HAVE_HTTPX and isinstance(session, httpx.Client)
+
+
+def _head(session: Any, url: str, headers: Dict[str, str]) -> Any:
+    """HEAD request following redirects, for either client type."""
+    if _is_httpx(session):
+        return session.head(url, follow_redirects=True, timeout=10, headers=headers)
+    return session.head(url, allow_redirects=True, timeout=10, headers=headers)
+
+
+@contextmanager
+def _stream_get(session: Any, url: str, headers: Dict[str, str]) -> Iterator[Any]:
+    """Streaming GET for either client type; yields (response, chunk iterator)."""
+    if _is_httpx(session):
+        with session.stream("GET", url, follow_redirects=True, headers=headers) as response:
+            response.raise_for_status()
+            yield response, response.iter_bytes(DOWNLOAD_CHUNK_SIZE)
+    else:
+        with session.get(url, stream=True, timeout=30, allow_redirects=True,
+                         headers=headers) as response:
+            response.raise_for_status()
+            yield response, response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+
 
 class VoiceInstaller:
     """Automatically install default voices."""
     
     HUGGINGFACE_BASE = "https://huggingface.co/rhasspy/piper-voices/resolve/main"
+    # Discovered voice list, kept in the models directory between runs
+    VOICES_CACHE_FILE = ".voices_cache.json"
+    VOICES_CACHE_TTL = 86400  # seconds
     
     @staticmethod
-    def _discover_all_voices() -> List[Dict]:
+    def _discover_all_voices(cache_path: Optional[Path] = None,
+                             ttl_seconds: float = VOICES_CACHE_TTL) -> List[Dict]:
         """
         Discover all available voices using piper.download_voices module.
         Falls back to a comprehensive list if the module is not available.
+        If cache_path is given, a result younger than ttl_seconds is read from
+        it instead of spawning the subprocess, and fresh results are saved there.
         """
+        if cache_path is not None:
+            try:
+                if time.time() - cache_path.stat().st_mtime < ttl_seconds:
+                    raw = cache_path.read_bytes()
+                    cached = orjson.loads(raw) if _HAVE_ORJSON else json.loads(raw)
+                    if cached:
+                        return cached
+            except Exception:
+                pass  # Missing or unreadable cache; rediscover
+        
         try:
             # Try to use piper.download_voices to get the list
             result = subprocess.run(
@@ -36,24 +151,20 @@ class VoiceInstaller:
             if result.returncode == 0:
                 voices = []
                 for line in result.stdout.splitlines():
-                    line = line.strip()
-                    if not line or line.startswith('#'):
+                    m = _VOICE_RE.match(line.strip())
+                    if not m:
                         continue
-                    # Parse voice name like "en_US-amy-low"
-                    parts = line.split('-')
-                    if len(parts) >= 3:
-                        region = parts[0]
-                        voice = parts[1]
-                        quality = parts[2]
+                    region = m.group("region")
+                    voices.append({
                         # Extract language from region (e.g., en_US -> en)
-                        lang = region.split('_')[0] if '_' in region else region[:2]
-                        voices.append({
-                            "language": lang,
-                            "region": region,
-                            "voice": voice,
-                            "quality": quality
-                        })
+                        "language": region.split('_')[0],
+                        "region": region,
+                        "voice": m.group("voice"),
+                        "quality": m.group("quality")
+                    })
                 if voices:
+                    if cache_path is not None:
+                        VoiceInstaller._write_voices_cache(cache_path, voices)
                     return voices
         except Exception:
             pass
@@ -82,60 +193,93 @@ class VoiceInstaller:
             {"language": "en", "region": "en_US", "voice": "radio", "quality": "high"},
         ]
     
+    @staticmethod
+    def _write_voices_cache(cache_path: Path, voices: List[Dict]) -> None:
+        """Atomically save the discovered voice list."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=cache_path.parent,
+                prefix=cache_path.name, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(voices, f)
+            os.replace(f.name, cache_path)
+        except Exception:
+            pass  # The cache is only an optimization
+    
     # Cache for discovered voices
     _cached_voices: Optional[List[Dict]] = None
     
     @classmethod
-    def get_all_voices(cls) -> List[Dict]:
-        """Get all available voices (cached)."""
+    def get_all_voices(cls, cache_path: Optional[Path] = None) -> List[Dict]:
+        """Get all available voices (cached in memory, and on disk if cache_path is given)."""
         if cls._cached_voices is None:
-            cls._cached_voices = cls._discover_all_voices()
+            cls._cached_voices = cls._discover_all_voices(cache_path)
         return cls._cached_voices
     
     @staticmethod
-    def _get_voice_urls(voice_info: Dict) -> Dict[str, str]:
-        """Get download URLs for a voice."""
+    def _get_voice_urls(voice_info: Dict) -> Tuple[str, str, str, str]:
+        """Get (onnx_name, onnx_url, json_name, json_url) for a voice."""
         lang = voice_info["language"]
         region = voice_info["region"]
         voice = voice_info["voice"]
         quality = voice_info["quality"]
         
-        base_name = f"{region}-{voice}-{quality}"
-        onnx_file = f"{base_name}.onnx"
-        json_file = f"{base_name}.onnx.json"
+        base_name = "-".join((region, voice, quality))
+        base_url = f"{VoiceInstaller.HUGGINGFACE_BASE}/{lang}/{region}/{voice}/{quality}/{base_name}"
+        json_url = f"{base_url}.onnx.json"
         
-        onnx_url = f"{VoiceInstaller.HUGGINGFACE_BASE}/{lang}/{region}/{voice}/{quality}/{onnx_file}"
-        json_url = f"{VoiceInstaller.HUGGINGFACE_BASE}/{lang}/{region}/{voice}/{quality}/{json_file}"
-        
-        return {
-            onnx_file: onnx_url,
-            json_file: json_url
-        }
+        return (f"{base_name}.onnx", f"{base_url}.onnx",
+                f"{base_name}.onnx.json", json_url)
     
     @staticmethod
-    def download_voice_file(url: str, file_path: Path) -> bool:
-        """Download a single file."""
+    def download_voice_file(url: str, file_path: Path, session: Any = None) -> bool:
+        """
+        Download a single file.
+        Skips the download when a file of the server-reported size is already
+        present, and resumes an interrupted download from its .part file.
+        """
         try:
-            session = requests.Session()
-            retry_strategy = Retry(
-                total=3,
-                backoff_factor=1,
-                status_forcelist=[429, 500, 502, 503, 504],
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            
-            response = session.get(url, stream=True, timeout=30, allow_redirects=True)
-            response.raise_for_status()
+            if session is None:
+                session = _get_session()
             
             file_path.parent.mkdir(parents=True, exist_ok=True)
+            part_path = file_path.with_suffix(file_path.suffix + ".part")
+            # Sizes are compared byte-for-byte, so ask for the uncompressed body
+            headers = {"Accept-Encoding": "identity"}
+            
+            expected_size: Optional[int] = None
+            accepts_ranges = False
+            try:
+                head = _head(session, url, headers)
+                if 200 <= head.status_code < 300:
+                    expected_size = int(head.headers.get("Content-Length", ""))
+                    accepts_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+            except Exception:
+                pass  # Fall back to a plain download
+            
+            if expected_size is not None and file_path.exists() \
+                    and file_path.stat().st_size == expected_size:
+                return True
             
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            if offset and accepts_ranges and (expected_size is None or offset < expected_size):
+                headers["Range"] = f"bytes={offset}-"
+            else:
+                offset = 0
             
+            with _stream_get(session, url, headers) as (response, chunks):
+                if offset and response.status_code != 206:
+                    offset = 0  # Server ignored the range; start over
+                
+                with open(part_path, 'ab' if offset else 'wb') as f:
+                    for chunk in chunks:
+                        if chunk:
+                            f.write(chunk)
+            
+            if expected_size is not None and part_path.stat().st_size != expected_size:
+                return False  # Keep the .part file so the next run can resume
+            os.replace(part_path, file_path)
             return True
         except Exception:
             return False
@@ -148,7 +292,8 @@ class VoiceInstaller:
         Args:
             models_dir: Directory to download .onnx files to
             presets_dir: Directory to create .onnx.json preset files in
-            progress_callback: Optional callback(voice_name, current, total) for progress updates
+            progress_callback: Optional callback(voice_name, completed, total), called
+                as each voice finishes
         
         Returns:
             Number of voices successfully installed
@@ -157,72 +302,95 @@ class VoiceInstaller:
         presets_dir.mkdir(parents=True, exist_ok=True)
         
         # Get all available voices
-        all_voices = VoiceInstaller.get_all_voices()
+        all_voices = VoiceInstaller.get_all_voices(models_dir / VoiceInstaller.VOICES_CACHE_FILE)
         installed_count = 0
+        completed = 0
         total = len(all_voices)
+        session = _get_session()
         
-        for i, voice_info in enumerate(all_voices):
-            voice_name = f"{voice_info['region']}-{voice_info['voice']}-{voice_info['quality']}"
-            
-            if progress_callback:
-                progress_callback(voice_name, i, total)
-            
-            # Get URLs
-            urls = VoiceInstaller._get_voice_urls(voice_info)
-            
-            # Download files
-            onnx_file = list(urls.keys())[0]  # First file is .onnx
-            json_file = list(urls.keys())[1]  # Second file is .onnx.json
-            
-            onnx_path = models_dir / onnx_file
-            json_path = models_dir / json_file
-            
-            # Skip if files already exist
-            if onnx_path.exists() and json_path.exists():
-                # Files already downloaded, just create preset
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS,
+                                thread_name_prefix="voice-download") as pool:
+            futures = {
+                pool.submit(VoiceInstaller._install_voice, voice_info,
+                            models_dir, presets_dir, session): voice_info
+                for voice_info in all_voices
+            }
+            # Progress is reported from this thread as each voice finishes
+            for future in as_completed(futures):
+                voice_info = futures[future]
+                completed += 1
                 try:
-                    data = json.loads(json_path.read_text(encoding="utf-8"))
-                    data["model_path"] = str(onnx_path.absolute())
-                    preset_file = presets_dir / json_file
-                    preset_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
-                    installed_count += 1
-                    continue
+                    if future.result():
+                        installed_count += 1
                 except Exception:
-                    pass  # Continue to re-download
-            
-            # Download .onnx file
-            if not VoiceInstaller.download_voice_file(urls[onnx_file], onnx_path):
-                # If download fails, skip this voice (might not exist)
-                continue
-            
-            # Download .onnx.json file
-            if not VoiceInstaller.download_voice_file(urls[json_file], json_path):
-                # If JSON download fails, remove the onnx file
-                if onnx_path.exists():
-                    onnx_path.unlink()
-                continue
-            
-            # Create preset in presets directory
+                    pass
+                if progress_callback:
+                    voice_name = f"{voice_info['region']}-{voice_info['voice']}-{voice_info['quality']}"
+                    progress_callback(voice_name, completed, total)
+        
+        return installed_count
+    
+    @staticmethod
+    def _install_voice(voice_info: Dict, models_dir: Path, presets_dir: Path,
+                       session: Any = None) -> bool:
+        """Download one voice (model + config) and write its preset. Returns success."""
+        # Get URLs
+        onnx_file, onnx_url, json_file, json_url = VoiceInstaller._get_voice_urls(voice_info)
+        
+        onnx_path = models_dir / onnx_file
+        json_path = models_dir / json_file
+        
+        # Skip if files already exist
+        if onnx_path.exists() and json_path.exists():
+            # Files already downloaded, just create preset
             try:
-                data = json.loads(json_path.read_text(encoding="utf-8"))
-                # Update model_path to point to the downloaded .onnx file
-                data["model_path"] = str(onnx_path.absolute())
-                
-                # Save preset to presets directory
-                preset_file = presets_dir / json_file
-                preset_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
-                
-                installed_count += 1
+                VoiceInstaller._write_preset(json_path, onnx_path, presets_dir / json_file)
+                return True
             except Exception:
-                # If preset creation fails, continue with next voice
-                continue
+                pass  # Continue to re-download
         
-        return installed_count
+        # Download .onnx file
+        if not VoiceInstaller.download_voice_file(onnx_url, onnx_path, session):
+            # If download fails, skip this voice (might not exist)
+            return False
+        
+        # Download .onnx.json file
+        if not VoiceInstaller.download_voice_file(json_url, json_path, session):
+            # If JSON download fails, remove the onnx file
+            if onnx_path.exists():
+                onnx_path.unlink()
+            return False
+        
+        # Create preset in presets directory
+        try:
+            VoiceInstaller._write_preset(json_path, onnx_path, presets_dir / json_file)
+            return True
+        except Exception:
+            # If preset creation fails, continue with next voice
+            return False
+    
+    @staticmethod
+    def _write_preset(json_path: Path, onnx_path: Path, preset_file: Path) -> None:
+        """Copy a voice's .onnx.json into presets, pointing model_path at the .onnx."""
+        # Bytes in, bytes out: both parsers accept bytes, so no decoded str copy
+        raw = json_path.read_bytes()
+        if _HAVE_ORJSON:
+            data = orjson.loads(raw)
+            data["model_path"] = str(onnx_path.absolute())
+            out = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.loads(raw)
+            data["model_path"] = str(onnx_path.absolute())
+            out = json.dumps(data, indent=2).encode("utf-8")
+        with open(preset_file, "wb") as f:
+            f.write(out)
     
     @staticmethod
     def has_voices(presets_dir: Path) -> bool:
         """Check if any voices are already installed."""
-        if not presets_dir.exists():
+        try:
+            with os.scandir(presets_dir) as it:
+                return any(entry.name.endswith(".onnx.json") and entry.is_file() for entry in it)
+        except OSError:
             return False
-        return any(presets_dir.glob("*.onnx.json"))
 
@@ -3,11 +3,19 @@
 Helper script to install TTS dependencies (piper-phonemize).
 This script checks for Rust and installs piper-phonemize if possible.
 """
+import functools
 import subprocess
 import sys
 import os
 from pathlib import Path
 
+# Printed whenever the automatic Rust install is declined or fails
+RUST_MANUAL_HELP = (
+    "You can install Rust manually later:\n"
+    "  Visit: https://rustup.rs/\n"
+    "  Or run: curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh\n"
+)
+
 
 def run_command(cmd, check=True, shell=False):
     """Run a command and return success status."""
@@ -25,6 +33,7 @@ def run_command(cmd, check=True, shell=False):
         return False, "", str(e)
 
 
+@functools.lru_cache(maxsize=1)
 def check_rust_installed():
     """Check if Rust is installed."""
     success, stdout, _ = run_command(["rustc", "--version"], check=False)
@@ -33,6 +42,7 @@ def check_rust_installed():
     return False, None
 
 
+@functools.lru_cache(maxsize=1)
 def check_cargo_available():
     """Check if cargo is available."""
     success, stdout, _ = run_command(["cargo", "--version"], check=False)
@@ -41,25 +51,37 @@ def check_cargo_available():
     return False, None
 
 
+@functools.lru_cache(maxsize=1)
+def _brew_prefix():
+    """Return Homebrew's prefix, or None if brew is unavailable."""
+    # brew sets HOMEBREW_PREFIX in shells it manages; otherwise check the standard
+    # Apple Silicon and Intel locations before paying for a brew launch
+    env_prefix = os.environ.get("HOMEBREW_PREFIX")
+    if env_prefix:
+        return env_prefix
+    for prefix in ("/opt/homebrew", "/usr/local"):
+        if (Path(prefix) / "bin" / "brew").exists():
+            return prefix
+    success, stdout, _ = run_command(["brew", "--prefix"], check=False)
+    return stdout.strip() if success else None
+
+
+@functools.lru_cache(maxsize=1)
 def check_espeak_ng_available():
     """Check if espeak-ng development headers are available."""
     # Try to find espeak-ng headers
     if sys.platform == "darwin":  # macOS
         # Check common Homebrew locations
-        brew_prefix = None
-        success, stdout, _ = run_command(["brew", "--prefix"], check=False)
-        if success:
-            brew_prefix = stdout.strip()
-        
+        brew_prefix = _brew_prefix()
         if brew_prefix:
             header_path = Path(brew_prefix) / "include" / "espeak-ng" / "speak_lib.h"
             if header_path.exists():
                 return True, str(header_path)
         
-        # Check if espeak-ng is installed via Homebrew
-        success, _, _ = run_command(["brew", "list", "espeak-ng"], check=False)
-        if success:
-            return True, "espeak-ng installed via Homebrew"
+        # Check if espeak-ng is installed via Homebrew (one call gives presence + version)
+        success, stdout, _ = run_command(["brew", "list", "--versions", "espeak-ng"], check=False)
+        if success and stdout:
+            return True, f"{stdout} installed via Homebrew"
         
         return False, None
     elif sys.platform.startswith("linux"):
@@ -77,13 +99,19 @@ def check_espeak_ng_available():
         return None, None  # Unknown
 
 
+@functools.lru_cache(maxsize=1)
 def check_piper_phonemize_installed():
     """Check if piper-phonemize is already installed."""
+    # Read package metadata rather than importing it, which loads the native library
+    from importlib.metadata import PackageNotFoundError, distribution
     try:
-        import piper_phonemize
+        distribution("piper-phonemize")
         return True
-    except ImportError:
-        return False
+    except PackageNotFoundError:
+        pass
+    # Builds without dist-info (e.g. source checkouts on sys.path)
+    from importlib.util import find_spec
+    return find_spec("piper_phonemize") is not None
 
 
 def install_rust():
@@ -116,13 +144,23 @@ def install_rust():
             return False
 
 
+@functools.lru_cache(maxsize=1)
+def _pip_install_command():
+    """Install command for this interpreter: uv when available (much faster), else pip."""
+    import shutil
+    uv = shutil.which("uv")
+    if uv:
+        return [uv, "pip", "install", "--python", sys.executable]
+    return [sys.executable, "-m", "pip", "install"]
+
+
 def install_piper_phonemize():
-    """Install piper-phonemize using pip."""
+    """Install piper-phonemize using uv or pip."""
     print("Installing piper-phonemize...")
     
     # Try regular install first
     success, stdout, stderr = run_command(
-        [sys.executable, "-m", "pip", "install", "piper-phonemize"],
+        [*_pip_install_command(), "piper-phonemize"],
         check=False
     )
     
@@ -133,7 +171,7 @@ def install_piper_phonemize():
         print("✗ Regular installation failed. Trying from source...")
         # Try installing from source
         success, stdout, stderr = run_command(
-            [sys.executable, "-m", "pip", "install", 
+            [*_pip_install_command(),
              "git+https://github.com/rhasspy/piper-phonemize.git"],
             check=False
         )
@@ -172,15 +210,10 @@ def main():
                 if install_rust():
                     return 0
                 else:
-                    print("\nYou can install Rust manually later:")
-                    print("  Visit: https://rustup.rs/")
-                    print("  Or run: curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh")
+                    sys.stdout.write("\n" + RUST_MANUAL_HELP)
                     return 1
             else:
-                print("\nRust installation cancelled.")
-                print("You can install Rust manually later:")
-                print("  Visit: https://rustup.rs/")
-                print("  Or run: curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh")
+                sys.stdout.write("\nRust installation cancelled.\n" + RUST_MANUAL_HELP)
                 return 1
         
         # Check for cargo
@@ -208,18 +241,22 @@ def main():
             print("✗ espeak-ng development headers not found")
             print("\nespeak-ng is required to build piper-phonemize.")
             if sys.platform == "darwin":  # macOS
-                print("\nOn macOS, install espeak-ng using Homebrew:")
-                print("  1. Install Homebrew (if not installed):")
-                print("     /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"")
-                print("  2. Install espeak-ng:")
-                print("     brew install espeak-ng")
-                print("\nThen run this script again.")
+                sys.stdout.write(
+                    "\nOn macOS, install espeak-ng using Homebrew:\n"
+                    "  1. Install Homebrew (if not installed):\n"
+                    "     /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"\n"
+                    "  2. Install espeak-ng:\n"
+                    "     brew install espeak-ng\n"
+                    "\nThen run this script again.\n"
+                )
             elif sys.platform.startswith("linux"):
-                print("\nOn Linux, install espeak-ng development package:")
-                print("  Ubuntu/Debian: sudo apt-get install libespeak-ng-dev")
-                print("  Fedora/RHEL: sudo dnf install espeak-ng-devel")
-                print("  Arch: sudo pacman -S espeak-ng")
-                print("\nThen run this script again.")
+                sys.stdout.write(
+                    "\nOn Linux, install espeak-ng development package:\n"
+                    "  Ubuntu/Debian: sudo apt-get install libespeak-ng-dev\n"
+                    "  Fedora/RHEL: sudo dnf install espeak-ng-devel\n"
+                    "  Arch: sudo pacman -S espeak-ng\n"
+                    "\nThen run this script again.\n"
+                )
             else:
                 print("\nPlease install espeak-ng development headers for your platform.")
                 print("See: https://github.com/espeak-ng/espeak-ng")
@@ -244,12 +281,14 @@ def main():
             print("   Install with: brew install espeak-ng")
         elif sys.platform.startswith("linux"):
             print("   Install with: sudo apt-get install libespeak-ng-dev (Ubuntu/Debian)")
-        print("2. Missing Rust/Cargo")
-        print("   Install with: curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh")
-        print("\nYou can try installing manually:")
-        print("  pip install piper-phonemize")
-        print("  or")
-        print("  pip install git+https://github.com/rhasspy/piper-phonemize.git")
+        sys.stdout.write(
+            "2. Missing Rust/Cargo\n"
+            "   Install with: curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh\n"
+            "\nYou can try installing manually:\n"
+            "  pip install piper-phonemize\n"
+            "  or\n"
+            "  pip install git+https://github.com/rhasspy/piper-phonemize.git\n"
+        )
         return 1
 
 
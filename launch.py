@@ -5,44 +5,44 @@ Works on macOS, Windows, and Linux
 """
 import sys
 import os
-from pathlib import Path
 
 def main():
     # Get the directory where this script is located
-    script_dir = Path(__file__).parent.resolve()
+    # (os.path rather than pathlib: this runs on every launch, keep imports minimal)
+    script_dir = os.path.dirname(os.path.realpath(__file__))
     os.chdir(script_dir)
     
     # Determine Python executable path
-    venv_python = script_dir / ".venv" / "bin" / "python"
+    venv_python = os.path.join(script_dir, ".venv", "bin", "python")
     if sys.platform == "win32":
-        venv_python = script_dir / ".venv" / "Scripts" / "python.exe"
+        venv_python = os.path.join(script_dir, ".venv", "Scripts", "python.exe")
     
     # Use venv Python if it exists, otherwise use system Python
-    if venv_python.exists():
-        python_exe = str(venv_python)
+    if os.path.exists(venv_python):
+        python_exe = venv_python
     else:
         python_exe = sys.executable
     
     # Path to main.py
-    main_py = script_dir / "main.py"
+    main_py = os.path.join(script_dir, "main.py")
     
-    if not main_py.exists():
+    if not os.path.exists(main_py):
         print(f"Error: main.py not found at {main_py}")
         sys.exit(1)
     
-    # On macOS, try to set process name (optional, may not work on all systems)
-    if sys.platform == "darwin":
+    argv = [python_exe, main_py, *sys.argv[1:]]
+    
+    # Replace this process with the app so only one interpreter stays resident
+    if sys.platform != "win32":
         try:
-            # Try to set process name using exec -a (works on some systems)
-            os.execv(python_exe, [python_exe, str(main_py)] + sys.argv[1:])
-        except Exception:
-            # Fallback to subprocess if execv fails
-            import subprocess
-            subprocess.run([python_exe, str(main_py)] + sys.argv[1:])
-    else:
-        # On other platforms, just run normally
-        import subprocess
-        subprocess.run([python_exe, str(main_py)] + sys.argv[1:])
+            os.execv(python_exe, argv)
+        except OSError:
+            pass  # Fall back to running it as a child process
+    
+    # Windows' execv spawns a new process and exits, which detaches the console,
+    # so run the app as a child and pass its exit code through
+    import subprocess
+    sys.exit(subprocess.run(argv).returncode)
 
 if __name__ == "__main__":
     main()
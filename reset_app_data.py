@@ -8,32 +8,46 @@ This script can reset:
 3. All data (complete reset)
 """
 from __future__ import annotations
+import functools
+import os
 import sys
 import shutil
 from pathlib import Path
 from typing import Optional
 
 # Get app support directory
+@functools.lru_cache(maxsize=1)
 def get_app_support_dir() -> Path:
-    """Get the application support directory."""
-    return Path.home() / "Library" / "Application Support" / "ActorRehearsal"
+    """Get the application support directory (same locations as core.project_manager)."""
+    if sys.platform == "darwin":  # macOS
+        return Path.home() / "Library" / "Application Support" / "ActorRehearsal"
+    if sys.platform == "win32":  # Windows
+        appdata = os.getenv("APPDATA", Path.home() / "AppData" / "Roaming")
+        return Path(appdata) / "ActorRehearsal"
+    # Linux and other Unix-like systems
+    return Path.home() / ".config" / "ActorRehearsal"
 
 
 def reset_app_config() -> None:
     """Reset application configuration files."""
     app_dir = get_app_support_dir()
     
-    files_to_remove = [
+    files_to_remove = {
         "config.json",
         "ui_config.json",
-    ]
+    }
     
+    # One directory listing instead of an exists() check per file
     removed = []
-    for filename in files_to_remove:
-        file_path = app_dir / filename
-        if file_path.exists():
-            file_path.unlink()
-            removed.append(filename)
+    try:
+        with os.scandir(app_dir) as it:
+            for entry in it:
+                if entry.name in files_to_remove and entry.is_file():
+                    os.unlink(entry.path)
+                    removed.append(entry.name)
+    except FileNotFoundError:
+        pass
+    removed.sort()
     
     if removed:
         print(f"✓ Removed application config files: {', '.join(removed)}")
@@ -41,19 +55,32 @@ def reset_app_config() -> None:
         print("✓ No application config files found to remove")
 
 
+def _read_library_path(config_path: Path) -> Optional[str]:
+    """Return the top-level "library_path" from config.json, or None."""
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+    try:
+        if ijson is not None:
+            # Stop reading as soon as the key is found
+            with open(config_path, "rb") as f:
+                for prefix, event, value in ijson.parse(f):
+                    if prefix == "library_path" and event == "string":
+                        return value
+            return None
+        import json
+        return json.loads(config_path.read_bytes()).get("library_path")
+    except Exception:
+        return None
+
+
 def reset_library_data(library_path: Optional[str] = None) -> None:
     """Reset library data (database, voice presets, models)."""
     if not library_path:
         # Try to read from config if it exists
         app_dir = get_app_support_dir()
-        config_path = app_dir / "config.json"
-        if config_path.exists():
-            import json
-            try:
-                data = json.loads(config_path.read_text(encoding="utf-8"))
-                library_path = data.get("library_path")
-            except Exception:
-                pass
+        library_path = _read_library_path(app_dir / "config.json")
     
     if not library_path:
         print("⚠ No library path found. Skipping library data reset.")
@@ -67,30 +94,44 @@ def reset_library_data(library_path: Optional[str] = None) -> None:
     
     # Reset database
     db_dir = library_root / ".rehearsal"
+    trees = []  # (directory, message) pairs to delete
     if db_dir.exists():
         db_file = db_dir / "projects.db"
-        if db_file.exists():
-            db_file.unlink()
-            print(f"✓ Removed database: {db_file}")
+        # Single unlink per file; the WAL sidecars go with the database
+        for path in (db_file, db_dir / "projects.db-wal", db_dir / "projects.db-shm"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            if path == db_file:
+                print(f"✓ Removed database: {db_file}")
         
         # Remove attachments
         attach_dir = db_dir / "attachments"
         if attach_dir.exists():
-            shutil.rmtree(attach_dir)
-            print(f"✓ Removed attachments directory: {attach_dir}")
+            trees.append((attach_dir, "Removed attachments directory"))
     
     # Reset voice presets and models
     customizations_dir = library_root / "customizations"
     if customizations_dir.exists():
         voice_presets_dir = customizations_dir / "voice_presets"
         if voice_presets_dir.exists():
-            shutil.rmtree(voice_presets_dir)
-            print(f"✓ Removed voice presets: {voice_presets_dir}")
+            trees.append((voice_presets_dir, "Removed voice presets"))
         
         models_dir = customizations_dir / "models"
         if models_dir.exists():
-            shutil.rmtree(models_dir)
-            print(f"✓ Removed voice models: {models_dir}")
+            trees.append((models_dir, "Removed voice models"))
+    
+    # The trees are independent, so delete them concurrently
+    if trees:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=len(trees)) as pool:
+            futures = {pool.submit(shutil.rmtree, directory): (directory, message)
+                       for directory, message in trees}
+            for future in as_completed(futures):
+                directory, message = futures[future]
+                future.result()
+                print(f"✓ {message}: {directory}")
     
     print(f"✓ Library data reset complete for: {library_root}")
 